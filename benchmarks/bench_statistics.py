@@ -0,0 +1,92 @@
+"""Compare ``compute_summary`` against the eight separate ``*_calc`` functions.
+
+Usage::
+
+    python -m benchmarks.bench_statistics [--rows 270000] [--repeat 5] [--file data.csv]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from services.io_loader import load_table
+from services.statistical_calc import (
+    average_calc,
+    compute_summary,
+    correlation_calc,
+    covariance_calc,
+    median_calc,
+    mode_calc,
+    std_deviation_calc,
+    total_calc,
+    variance_calc,
+)
+
+SEPARATE_CALCS = (
+    total_calc,
+    average_calc,
+    median_calc,
+    mode_calc,
+    variance_calc,
+    std_deviation_calc,
+    covariance_calc,
+    correlation_calc,
+)
+
+
+def synthetic_numeric_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Return a frame shaped like the numeric part of ``athlete_events.csv``."""
+    rng = np.random.default_rng(seed)
+
+    def with_gaps(values: np.ndarray, share: float) -> np.ndarray:
+        return np.where(rng.random(rows) < share, np.nan, values)
+
+    return pd.DataFrame({
+        "Age": with_gaps(rng.integers(10, 70, rows).astype(float), 0.03),
+        "Height": with_gaps(rng.normal(175, 10, rows).round(), 0.2),
+        "Weight": with_gaps(rng.normal(70, 14, rows).round(1), 0.2),
+        "Year": rng.choice(np.arange(1896, 2017, 2), rows),
+    })
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(df: pd.DataFrame, repeat: int = 5) -> dict[str, float]:
+    """Return the best wall time in seconds of both approaches on ``df``."""
+    separate = _best_of(repeat, lambda: [calc(df) for calc in SEPARATE_CALCS])
+    fused = _best_of(repeat, lambda: compute_summary(df))
+    return {"separate": separate, "fused": fused, "speedup": separate / fused if fused else float("nan")}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=270_000, help="rows of synthetic data")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per approach; the best is kept")
+    parser.add_argument("--file", help="benchmark a real CSV/XLSX instead of synthetic data")
+    args = parser.parse_args(argv)
+
+    if args.file:
+        df, _meta = load_table(args.file)
+        df = df.select_dtypes(include="number").drop(columns=["ID"], errors="ignore")
+    else:
+        df = synthetic_numeric_frame(args.rows)
+
+    result = run(df, args.repeat)
+    print(f"rows={len(df)} cols={len(df.columns)}")
+    print(f"eight *_calc functions: {result['separate'] * 1000:8.1f} ms")
+    print(f"compute_summary:        {result['fused'] * 1000:8.1f} ms")
+    print(f"speedup:                {result['speedup']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Synthetic datasets shaped like ``athlete_events.csv``."""
+from __future__ import annotations
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+SIZES = {
+    "10k": 10_000,
+    "270k": 270_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+NOCS = ("USA", "FRA", "GBR", "ITA", "GER", "CAN", "JPN", "SWE", "AUS", "HUN", "BRA", "CHN", "URS", "NED", "ESP")
+SPORTS = ("Athletics", "Gymnastics", "Swimming", "Shooting", "Cycling", "Fencing", "Rowing", "Judo", "Boxing", "Sailing")
+CITIES = ("London", "Athina", "Sydney", "Atlanta", "Rio de Janeiro", "Beijing", "Barcelona", "Los Angeles", "Paris")
+MEDALS = np.array(["Gold", "Silver", "Bronze"], dtype=object)
+
+
+def synthetic_olympics_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Return ``rows`` rows with the 15 columns of ``athlete_events.csv`` and similar gaps."""
+    rng = np.random.default_rng(seed)
+
+    def with_gaps(values: np.ndarray, share: float) -> np.ndarray:
+        return np.where(rng.random(rows) < share, np.nan, values)
+
+    # The real file has about two rows per athlete, sorted by ID.
+    ids = np.sort(rng.integers(1, max(rows // 2, 1) + 1, rows))
+    year = rng.choice(np.arange(1896, 2017, 2), rows)
+    season = np.where(year % 4 == 0, "Summer", "Winter")
+    sex = rng.choice(np.array(["M", "F"]), rows, p=[0.72, 0.28])
+    noc = rng.choice(np.array(NOCS), rows)
+    sport = rng.choice(np.array(SPORTS), rows)
+    medal = np.where(rng.random(rows) < 0.15, MEDALS[rng.integers(0, 3, rows)], None)
+
+    ids_text = pd.Series(ids).astype(str)
+    sport_text = pd.Series(sport)
+    return pd.DataFrame({
+        "ID": ids,
+        "Name": "Athlete " + ids_text,
+        "Sex": sex,
+        "Age": with_gaps(rng.integers(12, 60, rows).astype(float), 0.035),
+        "Height": with_gaps(rng.normal(175, 10, rows).round(), 0.22),
+        "Weight": with_gaps(rng.normal(70, 14, rows).round(1), 0.23),
+        "Team": noc,
+        "NOC": noc,
+        "Games": pd.Series(year).astype(str) + " " + pd.Series(season),
+        "Year": year,
+        "Season": season,
+        "City": rng.choice(np.array(CITIES), rows),
+        "Sport": sport_text,
+        "Event": sport_text + np.where(sex == "M", " Men's ", " Women's ") + pd.Series(rng.integers(1, 30, rows)).astype(str),
+        "Medal": medal,
+    })
+
+
+def default_data_dir() -> str:
+    return os.path.join(tempfile.gettempdir(), "olympics-bench")
+
+
+def dataset_path(rows: int, data_dir: str | None = None, seed: int = 42) -> str:
+    """Return a CSV with ``rows`` synthetic rows, writing it on first use."""
+    data_dir = data_dir or default_data_dir()
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"athletes-{rows}-{seed}.csv")
+    if not os.path.exists(path):
+        tmp = path + ".tmp"
+        synthetic_olympics_frame(rows, seed).to_csv(tmp, index=False)
+        os.replace(tmp, path)
+    return path
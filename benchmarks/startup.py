@@ -0,0 +1,131 @@
+"""Startup import cost of the application.
+
+Usage::
+
+    python -m benchmarks.startup [--repeat 5] [--top 15]
+                                 [--save startup.json] [--compare baseline.json]
+
+Every measurement runs in a fresh interpreter. ``app_import`` is what
+``main.py`` pays after the window is shown (``import ui.app``);
+``plot_import`` and ``seaborn_import`` are paid later, the first time Step 2
+draws a plot or a heatmap. The best time over ``--repeat`` runs is kept, so
+the figures are for a warm OS file cache. One extra run with
+``python -X importtime`` breaks ``app_import`` down by top-level package.
+
+The run fails (exit status 1) when importing the app loads one of
+``DEFERRED_MODULES``, or, with ``--compare``, when a stage got slower than
+``--threshold``; the JSON layout matches ``benchmarks.suite``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.suite import DEFAULT_THRESHOLD, compare, environment
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modules that must not be imported before the user asks for a plot.
+DEFERRED_MODULES = ("matplotlib", "seaborn", "networkx")
+
+STAGES = {
+    "app_import": ("", "import ui.app"),
+    "plot_import": (
+        "import ui.app",
+        "import services.statistical_plot, matplotlib.backends.backend_tkagg",
+    ),
+    "seaborn_import": ("import ui.app, services.statistical_plot", "import seaborn"),
+}
+
+_TIMER = """
+import sys, time
+{setup}
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+print(",".join(m for m in {deferred!r} if m in sys.modules))
+"""
+
+
+def _python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def time_stage(setup: str, statement: str) -> tuple[float, list[str]]:
+    """Seconds taken by ``statement`` after ``setup`` in a fresh interpreter, plus the deferred modules loaded."""
+    out = _python(_TIMER.format(setup=setup, statement=statement, deferred=DEFERRED_MODULES)).stdout.splitlines()
+    return float(out[0]), [m for m in out[1].split(",") if m]
+
+
+def import_cost_by_package(statement: str, top: int) -> list[tuple[str, float]]:
+    """Seconds spent importing each top-level package for ``statement``, slowest ``top`` first."""
+    stderr = _python(statement, "-X", "importtime").stderr
+    packages: dict[str, float] = {}
+    for line in stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _cumulative_us, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0.0) + int(self_us) / 1e6
+    return sorted(packages.items(), key=lambda p: p[1], reverse=True)[:top]
+
+
+def run(repeat: int) -> tuple[dict, list[str]]:
+    stages = {}
+    leaked: list[str] = []
+    for name, (setup, statement) in STAGES.items():
+        best = float("inf")
+        for _ in range(max(repeat, 1)):
+            seconds, loaded = time_stage(setup, statement)
+            best = min(best, seconds)
+            if name == "app_import":
+                leaked = loaded
+        stages[name] = {"seconds": round(best, 6)}
+        print(f"{name:<15} {best * 1000:10.1f} ms", flush=True)
+    total = sum(stage["seconds"] for stage in stages.values())
+    results = {"startup": {"total_seconds": round(total, 6), "stages": stages}}
+    return {"environment": environment(), "repeat": repeat, "results": results}, leaked
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per stage; the best time is kept")
+    parser.add_argument("--top", type=int, default=15, help="slowest packages imported by the app to list (0 to skip)")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown reported as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+
+    results, leaked = run(args.repeat)
+    if args.top:
+        print(f"\nimport time by package for {STAGES['app_import'][1]!r}:")
+        for package, seconds in import_cost_by_package(STAGES["app_import"][1], args.top):
+            print(f"  {package:<24} {seconds * 1000:8.1f} ms")
+
+    failed = False
+    if leaked:
+        print(f"\nimporting the app loads deferred modules: {', '.join(leaked)}", file=sys.stderr)
+        failed = True
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        if compare(results, baseline, args.threshold):
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
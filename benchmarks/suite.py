@@ -0,0 +1,260 @@
+"""Stage-by-stage benchmark of loading, statistics, plotting and table rendering.
+
+Usage::
+
+    python -m benchmarks.suite [--sizes 10k 270k 1m 10m] [--repeat 3]
+                               [--save results.json] [--compare baseline.json]
+
+Each size runs on a synthetic Olympics-shaped CSV (see ``benchmarks.datasets``)
+and every stage reports its best wall time over ``--repeat`` runs plus its
+peak traced memory from one extra run (tracing slows Python-heavy stages
+down too much to time them at the same time; ``--no-memory`` skips it).
+``--save`` stores the results as a JSON baseline and ``--compare`` prints
+the ratio of each stage against one, exiting with status 1 when a stage got
+slower than ``--threshold``.
+
+Plots are drawn with the Agg backend. The ``table_render`` stage needs a
+display and is skipped without one; run the suite under ``xvfb-run`` to
+include it on a headless server.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+matplotlib.use("Agg")
+
+from benchmarks.datasets import SIZES, dataset_path  # noqa: E402
+from services.dtype_profile import OLYMPICS_PROFILE, optimize_dtypes  # noqa: E402
+from services.io_loader import load_table  # noqa: E402
+from services.page_cache import PageCache  # noqa: E402
+from services.plot_data import GROUP_COLUMN, MATRIX_EXCLUDE, PLOT_KINDS, matrix_data, prepare_plot_data  # noqa: E402
+from services.statistical_calc import compute_summary  # noqa: E402
+from services.table_index import TableIndex  # noqa: E402
+
+DEFAULT_SIZES = ("10k", "270k")
+DEFAULT_THRESHOLD = 0.10
+TABLE_PAGE_SIZE = 10_000
+
+
+class Skipped(Exception):
+    """Raised by a stage that cannot run in this environment."""
+
+
+def _stage_load(ctx: dict) -> None:
+    ctx["raw"], _meta = load_table(ctx["path"], use_cache=False)
+
+
+def _stage_dtype_profile(ctx: dict) -> None:
+    ctx["df"], _info = optimize_dtypes(ctx["raw"], OLYMPICS_PROFILE)
+    ctx["numeric"] = ctx["df"].select_dtypes(include="number").drop(columns=["ID"], errors="ignore")
+
+
+def _stage_statistics(ctx: dict) -> None:
+    ctx["summary"] = compute_summary(ctx["numeric"])
+
+
+def _stage_plot_data(ctx: dict) -> None:
+    numeric = ctx["numeric"]
+    groups = numeric[GROUP_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+    data = {}
+    for kind, per_column in PLOT_KINDS.items():
+        if per_column:
+            for column in numeric.columns:
+                values = numeric[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                data[(kind, column)] = prepare_plot_data(kind, values, groups)
+        else:
+            matrix = getattr(ctx["summary"], kind)
+            data[(kind, None)] = matrix_data(matrix, MATRIX_EXCLUDE)
+    ctx["plot_data"] = data
+
+
+def _stage_plot_render(ctx: dict) -> None:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from services.statistical_plot import StatisticalPlot
+
+    plot = ctx.setdefault("plot", StatisticalPlot(None, None))
+    for (kind, column), data in ctx["plot_data"].items():
+        fig = plot.render(kind, column, data)
+        if fig is not None:
+            FigureCanvasAgg(fig).draw()
+            plot.release([fig])
+
+
+def _stage_table_index(ctx: dict) -> None:
+    index = TableIndex(ctx["df"])
+    index.view(index.filter('NOC == "BRA" and Year >= 1980'), "Name", True)
+
+
+def _stage_table_page(ctx: dict) -> None:
+    pages = PageCache(ctx["df"], TABLE_PAGE_SIZE)
+    ctx["page"] = (pages.columns, pages.get(0))
+    pages.close()
+
+
+def _stage_table_render(ctx: dict) -> None:
+    table = _tk_table()
+    columns, rows = ctx["page"]
+    table.set_rows(columns, len(rows), lambda a, b: rows[a:b])
+    table.update_idletasks()
+
+
+STAGES: dict[str, Callable[[dict], None]] = {
+    "load": _stage_load,
+    "dtype_profile": _stage_dtype_profile,
+    "statistics": _stage_statistics,
+    "plot_data": _stage_plot_data,
+    "plot_render": _stage_plot_render,
+    "table_index": _stage_table_index,
+    "table_page": _stage_table_page,
+    "table_render": _stage_table_render,
+}
+
+
+_table = None
+
+
+def _tk_table():
+    """Return a DataFrameTable in a hidden Tk root, created once."""
+    global _table
+    if _table is None:
+        import tkinter as tk
+        from widgets.dataframe_table import DataFrameTable
+
+        class _Theme:
+            def add_observer(self, _callback):
+                pass
+
+        try:
+            root = tk.Tk()
+        except tk.TclError as e:
+            raise Skipped(f"no display ({e})") from e
+        root.geometry("1100x700")
+        _table = DataFrameTable(root, _Theme())
+        _table.pack(fill="both", expand=True)
+        root.update()
+    return _table
+
+
+def measure(stage: Callable[[dict], None], ctx: dict, repeat: int, memory: bool = True) -> dict[str, Any]:
+    """Best wall time of ``stage`` over ``repeat`` runs and, with ``memory``, its traced peak."""
+    seconds = float("inf")
+    for _ in range(max(repeat, 1)):
+        gc.collect()
+        start = time.perf_counter()
+        stage(ctx)
+        seconds = min(seconds, time.perf_counter() - start)
+    result = {"seconds": round(seconds, 6)}
+
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            stage(ctx)
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["peak_mb"] = round(peak / 2**20, 3)
+    return result
+
+
+def run(sizes: list[str], stages: list[str], repeat: int, data_dir: str | None = None, memory: bool = True) -> dict:
+    results = {}
+    for size in sizes:
+        rows = SIZES[size]
+        ctx: dict[str, Any] = {"path": dataset_path(rows, data_dir)}
+        stage_results = {}
+        for name in STAGES:
+            # Later stages need the data of earlier ones, so those always run once.
+            wanted = name in stages
+            try:
+                if wanted:
+                    stage_results[name] = measure(STAGES[name], ctx, repeat, memory)
+                else:
+                    STAGES[name](ctx)
+            except Skipped as e:
+                stage_results[name] = {"skipped": str(e)}
+            if not wanted:
+                continue
+            stage = stage_results[name]
+            if "skipped" in stage:
+                print(f"{size:>5} {name:<14} skipped: {stage['skipped']}", flush=True)
+            else:
+                peak = f"{stage['peak_mb']:10.1f} MB" if "peak_mb" in stage else ""
+                print(f"{size:>5} {name:<14} {stage['seconds'] * 1000:10.1f} ms {peak}", flush=True)
+        total = sum(r.get("seconds", 0.0) for r in stage_results.values())
+        results[size] = {"rows": rows, "total_seconds": round(total, 6), "stages": stage_results}
+    return {"environment": environment(), "repeat": repeat, "results": results}
+
+
+def environment() -> dict[str, str]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "matplotlib": matplotlib.__version__,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> int:
+    """Print each stage against ``baseline`` and return how many got slower than ``threshold``."""
+    regressions = 0
+    print(f"\n{'size':>5} {'stage':<14} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for size, result in current["results"].items():
+        base_stages = baseline.get("results", {}).get(size, {}).get("stages", {})
+        for name, stage in result["stages"].items():
+            base = base_stages.get(name, {})
+            if "seconds" not in stage or not base.get("seconds"):
+                continue
+            ratio = stage["seconds"] / base["seconds"]
+            flag = ""
+            if ratio > 1 + threshold:
+                regressions += 1
+                flag = "  slower"
+            elif ratio < 1 - threshold:
+                flag = "  faster"
+            print(f"{size:>5} {name:<14} {base['seconds'] * 1000:9.1f} ms {stage['seconds'] * 1000:9.1f} ms "
+                  f"{ratio:6.2f}x{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(DEFAULT_SIZES))
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage; the best time is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced run measuring peak memory")
+    parser.add_argument("--data-dir", help="where the synthetic CSVs are generated and reused")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown reported as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.stages, args.repeat, args.data_dir, memory=not args.no_memory)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
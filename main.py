@@ -1,15 +1,22 @@
 import tkinter as tk
 
-from ui.app import App
-
 
 def main():
     root = tk.Tk()
     root.title("Olympics-project-v2")
     root.geometry("1100x700")
+
+    # Show the window before importing the app: pandas alone takes a while.
+    splash = tk.Label(root, text="Loading...")
+    splash.pack(expand=True)
+    root.update()
+
+    from ui.app import App
+
+    splash.destroy()
     App(root)
     root.mainloop()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,151 @@
+"""Per-athlete index over the participation rows."""
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from services.instrumentation import timed
+from services.result_cache import ResultCache, dataframe_fingerprint, get_result_cache
+
+ID_COLUMN = "ID"
+NAME_COLUMN = "Name"
+CAREER_COLUMNS = ("ID", "Name", "NOC", "First Year", "Last Year", "Games", "Gold", "Silver", "Bronze", "Medals", "Debut Age")
+
+
+class AthleteIndex:
+    """Map each athlete ``ID`` to its participation rows and career figures.
+
+    The rows are sorted by ID once (the sort is skipped when the table already
+    is), after which every athlete owns a contiguous range of that order:
+    :meth:`rows` is a binary search, and :meth:`careers` is built from segment
+    reductions (``np.*.reduceat``) over those ranges instead of a groupby.
+    Name lookup is a prefix search over the sorted, case-folded names.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        if ID_COLUMN not in df.columns:
+            raise ValueError(f"The table has no {ID_COLUMN} column.")
+        self.df = df
+        ids = df[ID_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+        known = np.flatnonzero(~np.isnan(ids))
+        ids = ids[known]
+        if len(ids) and np.all(ids[1:] >= ids[:-1]):
+            self.order = known
+        else:
+            by_id = np.argsort(ids, kind="stable")
+            self.order = known[by_id]
+            ids = ids[by_id]
+        # Athlete k owns self.order[starts[k]:starts[k + 1]].
+        first = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]]) if len(ids) else np.empty(0, dtype=np.intp)
+        self.ids = ids[first]
+        self.starts = np.r_[first, len(ids)]
+        self._careers: pd.DataFrame | None = None
+        self._names: tuple[np.ndarray, np.ndarray] | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows(self, athlete_id: float) -> np.ndarray:
+        """Positions of the rows of ``athlete_id``, in table order; empty when unknown."""
+        k = np.searchsorted(self.ids, athlete_id)
+        if k == len(self.ids) or self.ids[k] != athlete_id:
+            return np.empty(0, dtype=np.intp)
+        return self.order[self.starts[k]:self.starts[k + 1]]
+
+    def careers(self) -> pd.DataFrame:
+        """One row per athlete, in ID order, with the columns of ``CAREER_COLUMNS``.
+
+        Columns whose source column is missing from the table are left out.
+        """
+        with self._lock:
+            if self._careers is None:
+                self._careers = self._build_careers()
+            return self._careers
+
+    def lookup(self, query: str, limit: int = 200) -> pd.DataFrame:
+        """Careers of the athlete with ID ``query``, or of athletes whose name starts with it."""
+        query = query.strip()
+        careers = self.careers()
+        if not query:
+            return careers.iloc[:0]
+        if query.isdigit():
+            k = np.searchsorted(self.ids, float(query))
+            found = [k] if k < len(self.ids) and self.ids[k] == float(query) else []
+            return careers.iloc[found]
+        names, positions = self._sorted_names()
+        prefix = query.casefold()
+        lo = np.searchsorted(names, prefix, side="left")
+        hi = np.searchsorted(names, prefix + "\U0010ffff", side="left")
+        return careers.iloc[np.sort(positions[lo:min(hi, lo + limit)])]
+
+    @timed("athlete_index.careers", category="stats")
+    def _build_careers(self) -> pd.DataFrame:
+        df = self.df
+        starts = self.starts[:-1]
+        first_rows = self.order[starts]
+        careers = pd.DataFrame({ID_COLUMN: self.ids.astype(np.int64)})
+        for column in (NAME_COLUMN, "NOC"):
+            if column in df.columns:
+                careers[column] = df[column].to_numpy()[first_rows]
+        if not len(starts):
+            return careers
+
+        if "Year" in df.columns:
+            year = df["Year"].to_numpy(dtype=np.float64, na_value=np.nan)[self.order]
+            first_year = np.fmin.reduceat(year, starts)
+            careers["First Year"] = pd.array(first_year, dtype="Float64").astype("Int64")
+            careers["Last Year"] = pd.array(np.fmax.reduceat(year, starts), dtype="Float64").astype("Int64")
+            if "Age" in df.columns:
+                age = df["Age"].to_numpy(dtype=np.float64, na_value=np.nan)[self.order]
+                owner = np.repeat(np.arange(len(starts)), np.diff(self.starts))
+                debut = np.where(year == first_year[owner], age, np.nan)
+                careers["Debut Age"] = pd.array(np.fmin.reduceat(debut, starts), dtype="Float64").astype("Int64")
+
+        if "Games" in df.columns:
+            careers["Games"] = self._distinct_per_athlete(df["Games"])
+
+        if "Medal" in df.columns:
+            medal = df["Medal"].astype("string").to_numpy(na_value="")[self.order]
+            total = np.zeros(len(starts), dtype=np.int64)
+            for name in ("Gold", "Silver", "Bronze"):
+                careers[name] = np.add.reduceat((medal == name).astype(np.int64), starts)
+                total += careers[name].to_numpy()
+            careers["Medals"] = total
+        return careers[[c for c in CAREER_COLUMNS if c in careers.columns]]
+
+    def _distinct_per_athlete(self, values: pd.Series) -> np.ndarray:
+        """Number of distinct non-missing ``values`` in each athlete's rows."""
+        codes = pd.factorize(values)[0][self.order]
+        owner = np.repeat(np.arange(len(self.ids)), np.diff(self.starts))
+        # Sorting by (athlete, code) puts each athlete's repeats next to each other.
+        pairs = np.lexsort((codes, owner))
+        owner, codes = owner[pairs], codes[pairs]
+        new = np.r_[True, (owner[1:] != owner[:-1]) | (codes[1:] != codes[:-1])] & (codes >= 0)
+        return np.add.reduceat(new.astype(np.int64), self.starts[:-1])
+
+    def _sorted_names(self) -> tuple[np.ndarray, np.ndarray]:
+        """Case-folded athlete names in sorted order, with their career positions."""
+        careers = self.careers()
+        with self._lock:
+            if self._names is None:
+                if NAME_COLUMN in careers.columns:
+                    names = careers[NAME_COLUMN].astype("string").fillna("").str.casefold().to_numpy(dtype=object)
+                else:
+                    names = np.empty(0, dtype=object)
+                positions = np.argsort(names, kind="stable")
+                self._names = (names[positions], positions)
+            return self._names
+
+
+def athlete_index_for(df: pd.DataFrame, cache: ResultCache | None = None) -> AthleteIndex:
+    """Return the athlete index of ``df``, reusing the one built for an identical frame."""
+    cache = cache if cache is not None else get_result_cache()
+    key = (dataframe_fingerprint(df), "athlete_index")
+    index = cache.get(key)
+    if index is None:
+        index = AthleteIndex(df)
+        cache.put(key, index)
+    return index
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Sequence
+
+import pandas as pd
+
+from services import instrumentation
+from services.column_store import is_store
+from services.io_loader import CHUNK_SIZE, apply_dtype_profile, build_meta, iter_table, selection_variant
+from services.medal_table import KEY_COLUMNS as MEDAL_COLUMNS, MedalTable, cache_medal_table
+from services.noc_regions import add_region
+from services.table_cache import TableCache, get_default_cache
+
+
+class BackgroundLoader:
+    """Load a table on a worker thread and report back through a message queue.
+
+    The UI drains :meth:`poll` from ``root.after`` callbacks; the worker never
+    touches Tk. Messages are ``(kind, payload)`` tuples where ``kind`` is one of:
+
+    - ``"progress"``: ``(rows_loaded, fraction)``; ``fraction`` is ``None`` when unknown
+    - ``"chunk"``: the first DataFrame chunk, sent once so a page can be shown early
+    - ``"done"``: ``(df, meta)`` with the complete DataFrame (plus ``Region``
+      when ``enrich_regions`` is set)
+    - ``"error"``: the raised exception
+    - ``"cancelled"``: ``None``
+    """
+
+    def __init__(
+            self,
+            file_path: str,
+            chunksize: int = CHUNK_SIZE,
+            cache: TableCache | None = None,
+            dtype_profile: str | None = None,
+            enrich_regions: bool = False,
+            sheets: Sequence[str] | None = None,
+            columns: Sequence[str] | None = None,
+            tally_medals: bool = False,
+    ):
+        self.file_path = file_path
+        self.sheets = sheets
+        self.columns = columns
+        self.chunksize = chunksize
+        self.dtype_profile = dtype_profile
+        self.enrich_regions = enrich_regions
+        # With tally_medals, parsed chunks are appended to a medal table as
+        # they arrive; it is then served by ``medal_table_for`` on the result.
+        self.medal_table: MedalTable | None = MedalTable() if tally_medals else None
+        self.cache = cache if cache is not None else get_default_cache()
+        self.messages: queue.Queue[tuple[str, Any]] = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="table-loader", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Ask the worker to stop after the chunk it is currently parsing."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def poll(self) -> list[tuple[str, Any]]:
+        """Return every message posted since the last call, without blocking."""
+        items = []
+        while True:
+            try:
+                items.append(self.messages.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _post(self, kind: str, payload: Any = None) -> None:
+        self.messages.put((kind, payload))
+
+    def _run(self) -> None:
+        with instrumentation.span("load.background", "io", file=self.file_path):
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            chunks: list[pd.DataFrame] = []
+            meta: dict = {}
+            self._post("progress", (0, None))
+            # A mapped project store opens faster than any cached copy of it.
+            use_cache = not is_store(self.file_path)
+            variant = selection_variant(self.sheets, self.columns)
+            cached = self.cache.get(self.file_path, variant) if use_cache else None
+            if cached is not None:
+                df, meta = cached
+                # Nothing is streamed; medal_table_for builds the tally on demand.
+                self.medal_table = None
+                self._post("chunk", df)
+                self._post("progress", (len(df), 1.0))
+                self._post("done", self._finish(df, meta))
+                return
+
+            for chunk, meta in iter_table(self.file_path, self.chunksize, self.sheets, self.columns):
+                if self.cancelled:
+                    self._post("cancelled")
+                    return
+                chunks.append(chunk)
+                if len(chunks) == 1:
+                    self._post("chunk", chunk)
+                self._tally(chunk)
+                size = meta.get("size") or 0
+                fraction = meta["bytes_read"] / size if size else None
+                self._post("progress", (meta["rows"], fraction))
+
+            df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+            meta = {**_stable_meta(meta), **build_meta(self.file_path, df)}
+            result = self._finish(df, meta)
+            if self.medal_table is not None:
+                cache_medal_table(result[0], self.medal_table)
+            self._post("done", result)
+            if use_cache:
+                self.cache.put(self.file_path, df, meta, variant)
+        except Exception as e:
+            self._post("error", e)
+
+    def _tally(self, chunk: pd.DataFrame) -> None:
+        if self.medal_table is None:
+            return
+        if not all(c in chunk.columns for c in MEDAL_COLUMNS):
+            # Not an athlete events table: nothing to tally.
+            self.medal_table = None
+            return
+        self.medal_table.append(chunk)
+
+    def _finish(self, df: pd.DataFrame, meta: dict) -> tuple[pd.DataFrame, dict]:
+        """Apply the dtype profile and the optional enrichment to the raw table."""
+        df, meta = apply_dtype_profile(df, meta, self.dtype_profile)
+        if self.enrich_regions:
+            try:
+                df = add_region(df)
+            except OSError:
+                # Without noc_regions.csv the table is still usable.
+                return df, meta
+            meta = {**meta, "cols": len(df.columns)}
+        return df, meta
+
+
+def _stable_meta(meta: dict) -> dict:
+    """Drop the per-chunk progress keys from an ``iter_table`` meta."""
+    return {k: v for k, v in meta.items() if k not in ("bytes_read", "size")}
@@ -0,0 +1,188 @@
+"""Headless Step 2 report: statistics and every figure of one or more files.
+
+Usage::
+
+    python -m services.batch_report data.csv [more.xlsx ...] [-o reports] [--format png svg] [--jobs 4]
+
+Each input gets a ``<output>/<file stem>/`` directory with ``summary.json``,
+``summary.csv`` and one image per figure and format; inputs sharing a stem
+are told apart by their parent directory (``<parent>_<stem>``). Files are
+processed in parallel worker processes with matplotlib's Agg backend, so no
+display is needed.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import dataclasses
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from services.io_loader import load_table
+from services.plot_data import GROUP_COLUMN, MATRIX_EXCLUDE, PLOT_KINDS, matrix_data, prepare_plot_data
+from services.statistical_calc import StatisticsSummary, compute_summary
+
+FORMATS = ("png", "svg")
+CSV_FIELDS = ("count", "total", "mean", "median", "variance", "std")
+
+
+def _use_agg() -> None:
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def report_file(
+        file_path: str,
+        output_dir: str,
+        formats: tuple[str, ...] = ("png",),
+        dpi: int = 100,
+        name: str | None = None,
+) -> dict:
+    """Write the summary and figures of ``file_path`` under ``output_dir/name``; return a short result.
+
+    ``name`` defaults to the file stem; see ``report_names`` for several files.
+    """
+    _use_agg()
+    from services.statistical_plot import StatisticalPlot
+
+    start = time.perf_counter()
+    # No dtype profile: float32 columns would show up as 67.5999984741211 in the summary.
+    df, meta = load_table(file_path)
+    numeric_df = df.select_dtypes(include="number").drop(columns=["ID"], errors="ignore")
+    summary = compute_summary(numeric_df)
+
+    target = os.path.join(output_dir, name or _stem(file_path))
+    os.makedirs(target, exist_ok=True)
+    write_summary_json(summary, meta, os.path.join(target, "summary.json"))
+    write_summary_csv(summary, os.path.join(target, "summary.csv"))
+
+    groups = None
+    if GROUP_COLUMN in numeric_df.columns:
+        groups = numeric_df[GROUP_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    plot = StatisticalPlot(None, None)
+    written = []
+    for kind, per_column in PLOT_KINDS.items():
+        if per_column:
+            items = [
+                (column, prepare_plot_data(kind, numeric_df[column].to_numpy(dtype=np.float64, na_value=np.nan), groups))
+                for column in numeric_df.columns
+            ]
+        else:
+            matrix = summary.covariance if kind == "covariance" else summary.correlation
+            items = [(None, matrix_data(matrix, MATRIX_EXCLUDE))]
+
+        for column, data in items:
+            fig = plot.render(kind, column, data)
+            if fig is None:
+                continue
+            image = kind if column is None else f"{kind}_{column}"
+            for fmt in formats:
+                path = os.path.join(target, f"{image}.{fmt}")
+                fig.savefig(path, format=fmt, dpi=dpi)
+                written.append(path)
+            plot.release([fig])
+
+    return {
+        "file": file_path,
+        "output": target,
+        "rows": meta["rows"],
+        "images": len(written),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def write_summary_json(summary: StatisticsSummary, meta: dict, path: str) -> None:
+    payload = {
+        "file": {k: meta[k] for k in ("name", "rows", "cols") if k in meta},
+        "statistics": dataclasses.asdict(summary),
+    }
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(_json_value(payload), fh, indent=2, allow_nan=False)
+
+
+def write_summary_csv(summary: StatisticsSummary, path: str) -> None:
+    """One row per column with the scalar statistics; modes are joined with ``;``."""
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(("column", *CSV_FIELDS, "mode"))
+        for column in summary.columns:
+            values = [getattr(summary, name).get(column) for name in CSV_FIELDS]
+            modes = summary.mode.get(column) or {}
+            writer.writerow((column, *values, ";".join(str(m) for m in modes.values())))
+
+
+def report_names(files: list[str]) -> list[str]:
+    """Output directory name per file: its stem, prefixed with the parent directory when stems clash."""
+    stems = [_stem(path) for path in files]
+    names: list[str] = []
+    used: set[str] = set()
+    for path, stem in zip(files, stems):
+        name = stem
+        if stems.count(stem) > 1:
+            parent = os.path.basename(os.path.dirname(os.path.abspath(path)))
+            name = f"{parent}_{stem}" if parent else stem
+        # The same file listed twice, or a prefixed name that exists as a stem.
+        unique, n = name, 2
+        while unique.casefold() in used:
+            unique, n = f"{name}_{n}", n + 1
+        used.add(unique.casefold())
+        names.append(unique)
+    return names
+
+
+def _stem(file_path: str) -> str:
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
+def _json_value(value):
+    """Convert numpy values for ``json.dump``; NaN and infinities become null."""
+    if isinstance(value, dict):
+        return {k: _json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_json_value(v) for v in value]
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value) if math.isfinite(value) else None
+    return value
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="+", help="CSV/XLSX files to report on")
+    parser.add_argument("-o", "--output", default="reports", help="output directory (default: reports)")
+    parser.add_argument("--format", nargs="+", choices=FORMATS, default=["png"], help="image formats")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="parallel worker processes")
+    args = parser.parse_args(argv)
+
+    _use_agg()
+    failures = 0
+    jobs = max(min(args.jobs, len(args.files)), 1)
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = {
+            pool.submit(report_file, path, args.output, tuple(args.format), args.dpi, name): path
+            for path, name in zip(args.files, report_names(args.files))
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"{futures[future]}: error: {e}", file=sys.stderr)
+                continue
+            print(f"{result['file']}: {result['rows']} rows, {result['images']} images "
+                  f"in {result['seconds']}s -> {result['output']}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""Memory-mapped columnar project store.
+
+A store is a directory ending in ``.olyproj`` with a ``manifest.json`` and a
+data directory holding one NumPy ``.npy`` file per column. Text columns are
+dictionary encoded: the rows hold integer codes and the distinct values are
+kept once per column. Opening a store maps the files read-only instead of
+reading them, so the DataFrame is available immediately, its columns are the
+mapped arrays themselves, and every process that opens the same store shares
+the pages the OS has cached.
+
+Rewriting a store writes a new data directory and then switches the manifest
+to it, so the files of a store that is still mapped are never overwritten.
+
+Usage::
+
+    python -m services.column_store athlete_events.csv -o athlete_events.olyproj
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from services.dtype_profile import OLYMPICS_PROFILE
+from services.instrumentation import timed
+
+STORE_EXT = ".olyproj"
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 2
+# Version 1 stores keep the column files next to the manifest.
+READABLE_VERSIONS = (1, FORMAT_VERSION)
+DATA_PREFIX = "data-"
+
+
+def is_store(path: str) -> bool:
+    """True when ``path`` is a project store directory."""
+    return os.path.isfile(os.path.join(path, MANIFEST_NAME))
+
+
+def store_path_for(file_path: str) -> str:
+    """Default store location for ``file_path``: next to it, with the store extension."""
+    return os.path.splitext(os.path.abspath(file_path))[0] + STORE_EXT
+
+
+@timed(category="io")
+def write_store(df: pd.DataFrame, store_path: str, meta: dict | None = None) -> dict:
+    """Write ``df`` as a store at ``store_path`` and return its manifest.
+
+    The columns go to a new data directory and the manifest is then replaced
+    in one step, so a reader never sees a half-written store and the files
+    of the previous version, which may still be mapped, are left alone until
+    they can be deleted (on Windows, mapped files cannot be; they are retried
+    on the next write). An existing store at ``store_path`` is replaced; any
+    other existing path raises ``ValueError``.
+    """
+    if os.path.exists(store_path) and not is_store(store_path):
+        raise ValueError(f"Not a project store, refusing to overwrite: {store_path}")
+
+    os.makedirs(store_path, exist_ok=True)
+    data = f"{DATA_PREFIX}{time.time_ns():x}-{os.getpid()}"
+    data_path = os.path.join(store_path, data)
+    manifest_path = os.path.join(store_path, MANIFEST_NAME)
+    tmp_manifest = f"{manifest_path}.{os.getpid()}.tmp"
+    os.makedirs(data_path)
+    try:
+        columns = [_write_column(data_path, f"c{i}", df[col]) | {"name": str(col)} for i, col in enumerate(df.columns)]
+        manifest = {
+            "version": FORMAT_VERSION,
+            "rows": len(df),
+            "data": data,
+            "columns": columns,
+            "meta": _json_safe(meta or {}),
+        }
+        with open(tmp_manifest, "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=1)
+        os.replace(tmp_manifest, manifest_path)
+    except BaseException:
+        shutil.rmtree(data_path, ignore_errors=True)
+        if os.path.exists(tmp_manifest):
+            os.remove(tmp_manifest)
+        raise
+    _remove_stale_data(store_path, manifest)
+    return manifest
+
+
+@timed(category="io")
+def open_store(store_path: str) -> tuple[pd.DataFrame, dict]:
+    """Map the store at ``store_path``; returns ``(df, meta)`` like ``load_table``.
+
+    The columns are read-only views of the mapped files; operations that
+    would modify them give a copy instead.
+    """
+    manifest = _read_manifest(store_path)
+    data_path = os.path.join(store_path, manifest.get("data", ""))
+    data = {col["name"]: _open_column(data_path, col) for col in manifest["columns"]}
+    df = pd.DataFrame(data, copy=False)
+    if not data:
+        df = pd.DataFrame(index=pd.RangeIndex(manifest["rows"]))
+
+    meta = {
+        **manifest["meta"],
+        "name": os.path.basename(os.path.normpath(store_path)),
+        "rows": len(df),
+        "cols": len(df.columns),
+        "ext": STORE_EXT,
+        "path": os.path.abspath(store_path),
+        "store": True,
+    }
+    return df, meta
+
+
+def import_file(
+        file_path: str,
+        store_path: str | None = None,
+        dtype_profile: str | None = None,
+) -> str:
+    """Parse ``file_path`` once and save it as a store; returns the store path.
+
+    ``dtype_profile`` is applied before saving; like in ``load_table`` it is
+    off by default, since the compact float columns change the values.
+    """
+    from services.io_loader import load_table
+
+    store_path = store_path or store_path_for(file_path)
+    df, meta = load_table(file_path, dtype_profile=dtype_profile)
+    write_store(df, store_path, {**meta, "source": os.path.abspath(file_path)})
+    return store_path
+
+
+def _write_column(directory: str, stem: str, series: pd.Series) -> dict:
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufmM":
+        np.save(os.path.join(directory, stem + ".npy"), series.to_numpy(), allow_pickle=False)
+        return {"kind": "array", "file": stem + ".npy"}
+    if isinstance(series.array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)):
+        # Nullable Int64/Float64/boolean: the values plus a missing-value mask.
+        fill = False if dtype.kind == "b" else 0
+        np.save(os.path.join(directory, stem + ".npy"), series.to_numpy(dtype=dtype.numpy_dtype, na_value=fill), allow_pickle=False)
+        np.save(os.path.join(directory, stem + ".mask.npy"), series.isna().to_numpy(), allow_pickle=False)
+        return {"kind": "masked", "file": stem + ".npy", "mask": stem + ".mask.npy", "dtype": str(dtype)}
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes, categories, ordered = series.cat.codes.to_numpy(), dtype.categories, bool(dtype.ordered)
+    else:
+        codes, uniques = pd.factorize(series)
+        categories, ordered = pd.Index(uniques), False
+    codes = codes.astype(_codes_dtype(len(categories)), copy=False)
+    np.save(os.path.join(directory, stem + ".codes.npy"), codes, allow_pickle=False)
+    return {
+        "kind": "dictionary",
+        "file": stem + ".codes.npy",
+        "ordered": ordered,
+        **_write_dictionary(directory, stem, categories),
+    }
+
+
+def _write_dictionary(directory: str, stem: str, values: pd.Index) -> dict:
+    """Save the distinct values of a dictionary-encoded column."""
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufmM":
+        np.save(os.path.join(directory, stem + ".dict.npy"), values.to_numpy(), allow_pickle=False)
+        return {"dictionary": stem + ".dict.npy"}
+    # Text (or mixed) values are stored as strings.
+    with open(os.path.join(directory, stem + ".dict.json"), "w", encoding="utf-8") as fh:
+        json.dump([str(v) for v in values], fh, ensure_ascii=False)
+    return {"dictionary": stem + ".dict.json"}
+
+
+def _open_column(data_path: str, spec: dict):
+    def load(name: str) -> np.ndarray:
+        return np.load(os.path.join(data_path, name), mmap_mode="r", allow_pickle=False)
+
+    kind = spec["kind"]
+    if kind == "array":
+        return load(spec["file"])
+    if kind == "masked":
+        dtype = pd.api.types.pandas_dtype(spec["dtype"])
+        return dtype.construct_array_type()(load(spec["file"]), load(spec["mask"]), copy=False)
+    if kind == "dictionary":
+        dictionary = spec["dictionary"]
+        if dictionary.endswith(".npy"):
+            categories = pd.Index(np.load(os.path.join(data_path, dictionary), allow_pickle=False))
+        else:
+            with open(os.path.join(data_path, dictionary), encoding="utf-8") as fh:
+                categories = pd.Index(json.load(fh))
+        return pd.Categorical.from_codes(load(spec["file"]), categories=categories, ordered=spec["ordered"], validate=False)
+    raise ValueError(f"Unknown column kind in project store: {kind}")
+
+
+def store_size(store_path: str) -> int:
+    """Total size in bytes of the files of the current version of a store."""
+    data = _read_manifest(store_path).get("data")
+    size = sum(entry.stat().st_size for entry in os.scandir(store_path) if entry.is_file())
+    if data:
+        size += sum(entry.stat().st_size for entry in os.scandir(os.path.join(store_path, data)))
+    return size
+
+
+def _read_manifest(store_path: str) -> dict:
+    with open(os.path.join(store_path, MANIFEST_NAME), encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    if manifest.get("version") not in READABLE_VERSIONS:
+        raise ValueError(f"Unsupported project store version: {manifest.get('version')}")
+    return manifest
+
+
+def _remove_stale_data(store_path: str, manifest: dict) -> None:
+    """Delete what earlier versions of the store left behind, skipping files still in use."""
+    for entry in os.scandir(store_path):
+        if entry.name in (MANIFEST_NAME, manifest["data"]):
+            continue
+        if entry.is_dir() and entry.name.startswith(DATA_PREFIX):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        elif entry.is_file() and entry.name.endswith((".npy", ".json")):
+            # Version 1 column files next to the manifest.
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def _codes_dtype(size: int) -> np.dtype:
+    for dtype in (np.int8, np.int16, np.int32):
+        if size < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _json_safe(meta: dict) -> dict:
+    return {k: v for k, v in meta.items() if isinstance(v, (str, int, float, bool, type(None)))}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m services.column_store",
+        description="Import CSV/Excel files into memory-mapped project stores.",
+    )
+    parser.add_argument("files", nargs="+", help="CSV or Excel files to import")
+    parser.add_argument("-o", "--output", help=f"store path (single input only; default: <file>{STORE_EXT})")
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="store the compact olympics dtypes (categoricals, float32); changes float values slightly",
+    )
+    args = parser.parse_args(argv)
+    if args.output and len(args.files) > 1:
+        parser.error("--output needs a single input file")
+
+    failed = 0
+    for file_path in args.files:
+        start = time.perf_counter()
+        try:
+            store = import_file(file_path, args.output, dtype_profile=OLYMPICS_PROFILE if args.compact else None)
+        except (OSError, ValueError) as e:
+            print(f"{file_path}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        print(f"{file_path} -> {store} ({time.perf_counter() - start:.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+OLYMPICS_PROFILE = "olympics"
+
+PROFILES: dict[str, dict[str, tuple[str, ...]]] = {
+    OLYMPICS_PROFILE: {
+        "categorical": ("Sex", "Team", "NOC", "Games", "Season", "City", "Sport", "Event", "Medal", "Sheet"),
+        "numeric": ("ID", "Age", "Height", "Weight", "Year"),
+    },
+}
+
+# Columns whose distinct values exceed this share of the rows stay as strings:
+# a categorical with one category per row costs more than the plain column.
+MAX_CATEGORY_RATIO = 0.5
+
+
+def memory_usage(df: pd.DataFrame) -> int:
+    """Return the deep memory footprint of ``df`` in bytes."""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def optimize_dtypes(df: pd.DataFrame, profile: str = OLYMPICS_PROFILE) -> tuple[pd.DataFrame, dict]:
+    """Return a copy of ``df`` with compact dtypes for the columns in ``profile``.
+
+    Low-cardinality string columns become categoricals, integer columns are
+    downcast to the smallest fitting integer type and float columns become
+    integers when they hold whole numbers without NaN, ``float32`` otherwise.
+    The returned dict reports ``memory_before``/``memory_after`` in bytes.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown dtype profile: {profile}")
+    spec = PROFILES[profile]
+
+    memory_before = memory_usage(df)
+    out = df.copy(deep=False)
+    for col in spec["categorical"]:
+        if col in out.columns:
+            out[col] = _to_category(out[col])
+    for col in spec["numeric"]:
+        if col in out.columns:
+            out[col] = _downcast_numeric(out[col])
+
+    return out, {
+        "dtype_profile": profile,
+        "memory_before": memory_before,
+        "memory_after": memory_usage(out),
+    }
+
+
+def _to_category(series: pd.Series) -> pd.Series:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    if len(series) and series.nunique(dropna=True) > len(series) * MAX_CATEGORY_RATIO:
+        return series
+    return series.astype("category")
+
+
+def _downcast_numeric(series: pd.Series) -> pd.Series:
+    if not pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+        return series
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return pd.to_numeric(series, downcast="integer")
+
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    if len(values) and not np.isnan(values).any() and np.array_equal(values, np.trunc(values)):
+        return pd.to_numeric(series, downcast="integer")
+    # float32 keeps NaN support for the statistics code, unlike nullable ints,
+    # and holds ages, heights and weights with room to spare.
+    return series.astype(np.float32)
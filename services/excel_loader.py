@@ -0,0 +1,189 @@
+"""Excel workbooks: sheet listing and selective, parallel sheet loading."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+from typing import Iterator, Sequence
+from xml.etree import ElementTree
+
+import pandas as pd
+
+from services.instrumentation import timed
+
+EXCEL_EXTS = (".xlsx", ".xlsm", ".xls")
+# Workbooks that openpyxl reads directly (zip of XML parts).
+OPENXML_EXTS = (".xlsx", ".xlsm")
+SHEET_COLUMN = "Sheet"
+# Below this size, starting worker processes costs more than parsing serially.
+PARALLEL_MIN_BYTES = 2 * 1024 ** 2
+
+# python-calamine (optional) parses workbooks far faster than openpyxl.
+HAS_CALAMINE = find_spec("python_calamine") is not None
+
+
+def is_excel(file_path: str) -> bool:
+    return os.path.splitext(file_path)[1].lower() in EXCEL_EXTS
+
+
+@timed(category="io")
+def list_sheets(file_path: str) -> list[str]:
+    """Sheet names in tab order, without reading any cell.
+
+    For .xlsx only the small ``xl/workbook.xml`` part is parsed; opening the
+    workbook would also load its shared strings.
+    """
+    if os.path.splitext(file_path)[1].lower() in OPENXML_EXTS:
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                root = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+            # Match on the local name: strict OOXML files use another namespace.
+            return [el.get("name") for el in root.iter() if el.tag.rsplit("}", 1)[-1] == "sheet"]
+        except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+            pass
+    with pd.ExcelFile(file_path) as book:
+        return [str(name) for name in book.sheet_names]
+
+
+def sheet_columns(file_path: str, sheet: str) -> list[str]:
+    """Column names of ``sheet``, read from its header row only."""
+    return list(read_sheet(file_path, sheet, nrows=0).columns)
+
+
+def read_sheet(
+        file_path: str,
+        sheet: str | int = 0,
+        columns: Sequence[str] | None = None,
+        nrows: int | None = None,
+) -> pd.DataFrame:
+    """Read one sheet, keeping only ``columns`` (all when None) and at most ``nrows`` rows.
+
+    Uses python-calamine when installed. Otherwise .xlsx rows are streamed
+    from a read-only openpyxl workbook and only the wanted cells are kept;
+    other formats go through ``pd.read_excel``.
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if isinstance(sheet, int):
+        sheet = list_sheets(file_path)[sheet]
+    if HAS_CALAMINE:
+        return pd.read_excel(file_path, sheet_name=sheet, usecols=_usecols(columns), nrows=nrows, engine="calamine")
+    if ext not in OPENXML_EXTS:
+        return pd.read_excel(file_path, sheet_name=sheet, usecols=_usecols(columns), nrows=nrows)
+
+    from openpyxl import load_workbook
+
+    book = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        rows = book[sheet].iter_rows(values_only=True)
+        header = next(rows, ())
+        names = _header_names(header)
+        if columns is None:
+            picked = list(range(len(names)))
+        else:
+            missing = [c for c in columns if c not in names]
+            if missing:
+                raise ValueError(f"Columns not found in sheet {sheet!r}: {', '.join(missing)}")
+            picked = [names.index(c) for c in columns]
+        width = len(names)
+
+        records = []
+        for row in rows:
+            if nrows is not None and len(records) >= nrows:
+                break
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            values = tuple(row[i] for i in picked)
+            if any(v is not None for v in values):
+                records.append(values)
+    finally:
+        book.close()
+    return pd.DataFrame.from_records(records, columns=[names[i] for i in picked])
+
+
+def iter_sheets(
+        file_path: str,
+        sheets: Sequence[str] | None = None,
+        columns: Sequence[str] | None = None,
+        jobs: int | None = None,
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """Yield ``(sheet, df)`` for each of ``sheets`` (the first sheet when None), in order.
+
+    Several sheets of a large workbook are parsed in parallel worker
+    processes; ``jobs=1`` forces a serial read.
+    """
+    if not sheets:
+        sheets = list_sheets(file_path)[:1]
+    sheets = list(sheets)
+    workers = min(len(sheets), jobs or os.cpu_count() or 1)
+    if workers < 2 or os.path.getsize(file_path) < PARALLEL_MIN_BYTES:
+        for sheet in sheets:
+            yield sheet, read_sheet(file_path, sheet, columns)
+        return
+
+    # spawn: forking a process that runs Tk (the app) is not safe.
+    context = multiprocessing.get_context("spawn")
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    finished = False
+    try:
+        futures = [pool.submit(read_sheet, file_path, sheet, columns) for sheet in sheets]
+        for sheet, future in zip(sheets, futures):
+            yield sheet, future.result()
+        finished = True
+    finally:
+        if finished:
+            pool.shutdown()
+        else:
+            # Closed early (e.g. a cancelled load): do not wait for the sheets
+            # still being parsed, drop the queued ones and stop the workers.
+            processes = _worker_processes(pool)
+            pool.shutdown(wait=False, cancel_futures=True)
+            for process in processes:
+                process.terminate()
+
+
+def _worker_processes(pool: ProcessPoolExecutor) -> list:
+    # The executor has no public handle on its processes; shutdown() drops them.
+    return list((getattr(pool, "_processes", None) or {}).values())
+
+
+@timed(category="io")
+def read_workbook(
+        file_path: str,
+        sheets: Sequence[str] | None = None,
+        columns: Sequence[str] | None = None,
+        jobs: int | None = None,
+) -> pd.DataFrame:
+    """Read ``sheets`` into one DataFrame; with several sheets a ``Sheet`` column tells them apart."""
+    frames = [with_sheet_column(df, sheet, sheets) for sheet, df in iter_sheets(file_path, sheets, columns, jobs)]
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+
+def with_sheet_column(df: pd.DataFrame, sheet: str, sheets: Sequence[str] | None) -> pd.DataFrame:
+    """Prepend the ``Sheet`` column when rows come from more than one sheet."""
+    if not sheets or len(sheets) < 2 or SHEET_COLUMN in df.columns:
+        return df
+    df = df.copy(deep=False)
+    df.insert(0, SHEET_COLUMN, sheet)
+    return df
+
+
+def _header_names(header: Sequence) -> list[str]:
+    """Column names the way ``pd.read_excel`` makes them: blanks named, repeats suffixed."""
+    names: list[str] = []
+    seen: dict[str, int] = {}
+    for i, value in enumerate(header):
+        name = str(value) if value is not None else f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        seen.setdefault(name, 0)
+        names.append(name)
+    return names
+
+
+def _usecols(columns: Sequence[str] | None):
+    return list(columns) if columns is not None else None
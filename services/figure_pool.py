@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Iterable
+
+import matplotlib as mpl
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.figure import Figure
+
+DEFAULT_MAX_LIVE_FIGURES = 32
+DEFAULT_MAX_IDLE_FIGURES = 8
+
+
+class FigurePool:
+    """Matplotlib figures created outside pyplot and recycled under a cap.
+
+    Figures built with the ``Figure`` class are not registered with pyplot's
+    global manager, so they are freed as soon as nothing references them.
+    Released figures are cleared and up to ``max_idle`` of them are kept for
+    reuse; when ``max_live`` figures are in use, acquiring another one
+    recycles the oldest for which ``can_recycle`` is true (any figure when it
+    is None). When none qualifies, the pool grows past ``max_live`` and
+    shrinks back on later acquires.
+    """
+
+    def __init__(
+            self,
+            max_live: int = DEFAULT_MAX_LIVE_FIGURES,
+            max_idle: int = DEFAULT_MAX_IDLE_FIGURES,
+            can_recycle: Callable[[Figure], bool] | None = None,
+    ):
+        self.max_live = max(int(max_live), 1)
+        self.max_idle = max(int(max_idle), 0)
+        self.can_recycle = can_recycle
+        self._live: OrderedDict[int, Figure] = OrderedDict()
+        self._idle: list[Figure] = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, figure_size: Iterable[float] | None = None) -> Figure:
+        """Return an empty figure of ``figure_size`` inches (rcParams default when None)."""
+        excess = len(self._live) - self.max_live + 1
+        for key, fig in list(self._live.items()):
+            if excess <= 0:
+                break
+            if self.can_recycle is None or self.can_recycle(fig):
+                del self._live[key]
+                self._recycle(fig)
+                excess -= 1
+
+        if self._idle:
+            fig = self._idle.pop()
+            self.reused += 1
+        else:
+            fig = Figure()
+            self.created += 1
+        fig.set_size_inches(tuple(figure_size) if figure_size is not None else mpl.rcParams["figure.figsize"])
+        self._live[id(fig)] = fig
+        return fig
+
+    def release(self, fig: Figure) -> None:
+        """Hand ``fig`` back to the pool; it must no longer be displayed."""
+        fig = self._live.pop(id(fig), None)
+        if fig is not None:
+            self._recycle(fig)
+
+    def release_all(self) -> None:
+        while self._live:
+            _key, fig = self._live.popitem(last=False)
+            self._recycle(fig)
+
+    def live(self) -> list[Figure]:
+        """Figures in use, oldest first."""
+        return list(self._live.values())
+
+    def stats(self) -> dict[str, int]:
+        return {"live": len(self._live), "idle": len(self._idle), "created": self.created, "reused": self.reused}
+
+    def _recycle(self, fig: Figure) -> None:
+        fig.clear()
+        # Detach the canvas it was shown on: a reused figure is a new one
+        # being built, not one whose (destroyed) widget is hidden.
+        FigureCanvasBase(fig)
+        if len(self._idle) < self.max_idle:
+            self._idle.append(fig)
@@ -0,0 +1,185 @@
+"""Opt-in timing of hot paths.
+
+Wrap code in ``with span("name"):`` or decorate functions with ``@timed()``.
+While recording is disabled (the default) both reduce to a flag check, so
+they can stay on hot paths. Enabled, every span is appended to a bounded
+ring buffer that :func:`summary` aggregates and :func:`export_chrome_trace`
+writes in the Chrome trace event format (open it in ``chrome://tracing`` or
+Perfetto). Set ``OLYMPICS_TRACE=1`` to record from start-up.
+
+Spans are per process: work done in the statistics process pool is only
+seen through the spans the UI process records around it.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+DEFAULT_CAPACITY = 4096
+DEFAULT_CATEGORY = "app"
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    # Net traced allocation in bytes; None unless memory tracing is on.
+    memory_delta: int | None = None
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+_enabled = os.environ.get("OLYMPICS_TRACE", "") not in ("", "0")
+_records: deque[SpanRecord] = deque(maxlen=DEFAULT_CAPACITY)
+_lock = threading.Lock()
+_origin_ns = time.perf_counter_ns()
+
+
+def enable(on: bool = True, memory: bool = False) -> None:
+    """Turn recording on or off; ``memory`` also traces allocations (slow)."""
+    global _enabled
+    _enabled = on
+    if on and memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not (on and memory) and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def is_tracing_memory() -> bool:
+    return _enabled and tracemalloc.is_tracing()
+
+
+def set_capacity(capacity: int) -> None:
+    """Resize the ring buffer, keeping the most recent records."""
+    global _records
+    with _lock:
+        _records = deque(_records, maxlen=max(int(capacity), 1))
+
+
+def record(name: str, start_ns: int, end_ns: int, category: str = DEFAULT_CATEGORY, **args) -> None:
+    """Add a span measured by the caller with ``time.perf_counter_ns``."""
+    if not _enabled:
+        return
+    _records.append(SpanRecord(name, category, start_ns, end_ns - start_ns, threading.get_ident(), None, args))
+
+
+class _Span:
+    __slots__ = ("name", "category", "args", "_start", "_memory")
+
+    def __init__(self, name: str, category: str, args: dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self._memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *_exc):
+        end = time.perf_counter_ns()
+        memory = None
+        if self._memory is not None and tracemalloc.is_tracing():
+            memory = tracemalloc.get_traced_memory()[0] - self._memory
+        _records.append(SpanRecord(
+            self.name, self.category, self._start, end - self._start, threading.get_ident(), memory, self.args,
+        ))
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, category: str = DEFAULT_CATEGORY, **args):
+    """Context manager timing its block as ``name``; a shared no-op while disabled."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def timed(name: str | None = None, category: str = DEFAULT_CATEGORY) -> Callable:
+    """Decorator timing every call of the function (``module.qualname`` by default)."""
+    def decorate(fn: Callable) -> Callable:
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(label, category, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def records() -> list[SpanRecord]:
+    with _lock:
+        return list(_records)
+
+
+def clear() -> None:
+    with _lock:
+        _records.clear()
+
+
+def summary() -> list[dict[str, Any]]:
+    """Calls, total, mean and max milliseconds per span name, slowest total first."""
+    totals: dict[str, list[float]] = {}
+    for rec in records():
+        entry = totals.setdefault(rec.name, [0, 0.0, 0.0, rec.category])
+        ms = rec.duration_ns / 1e6
+        entry[0] += 1
+        entry[1] += ms
+        entry[2] = max(entry[2], ms)
+    rows = [
+        {"name": name, "category": cat, "calls": calls, "total_ms": total, "mean_ms": total / calls, "max_ms": peak}
+        for name, (calls, total, peak, cat) in totals.items()
+    ]
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+def export_chrome_trace(path: str) -> int:
+    """Write the recorded spans as Chrome trace JSON; return how many were written."""
+    pid = os.getpid()
+    events = []
+    for rec in records():
+        args = dict(rec.args)
+        if rec.memory_delta is not None:
+            args["memory_delta"] = rec.memory_delta
+        events.append({
+            "name": rec.name,
+            "cat": rec.category,
+            "ph": "X",
+            "ts": (rec.start_ns - _origin_ns) / 1000,
+            "dur": rec.duration_ns / 1000,
+            "pid": pid,
+            "tid": rec.thread_id,
+            "args": {k: v if isinstance(v, (int, float, str, bool)) or v is None else str(v) for k, v in args.items()},
+        })
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fh)
+    return len(events)
@@ -1,37 +1,209 @@
 from __future__ import annotations
 
+import codecs
+import json
 import os
+from typing import Iterator, Sequence
 
 import pandas as pd
 
+from services.column_store import is_store, open_store, store_size
+from services.dtype_profile import optimize_dtypes
+from services.excel_loader import EXCEL_EXTS, SHEET_COLUMN, iter_sheets, read_workbook, with_sheet_column
+from services.instrumentation import timed
+from services.table_cache import get_default_cache
 
-def load_table(file_path: str, sample_rows: int | None = None) -> tuple[pd.DataFrame, dict]:
-    """Load .xlsx, .xls or .csv into a DataFrame.
+CHUNK_SIZE = 50_000
+ENCODING_SAMPLE_BYTES = 64 * 1024
+# Decodes any byte sequence, so it is the last resort for text that is not UTF-8.
+FALLBACK_ENCODING = "latin-1"
+# Error handler of UTF-8 reads: decodes just the invalid bytes as FALLBACK_ENCODING.
+FALLBACK_ERRORS = "olympics-latin-1-fallback"
+
+
+def _decode_fallback(error: UnicodeDecodeError) -> tuple[str, int]:
+    return error.object[error.start:error.end].decode(FALLBACK_ENCODING), error.end
+
+
+codecs.register_error(FALLBACK_ERRORS, _decode_fallback)
+
+
+@timed(category="io")
+def load_table(
+        file_path: str,
+        sample_rows: int | None = None,
+        use_cache: bool = True,
+        dtype_profile: str | None = None,
+        sheets: Sequence[str] | None = None,
+        columns: Sequence[str] | None = None,
+) -> tuple[pd.DataFrame, dict]:
+    """Load .xlsx, .xls, .csv or a project store (see ``services.column_store``) into a DataFrame.
     - If sample_rows is not None, returns only head(sample_rows).
+    - For Excel files, sheets selects the sheets to load (default: the first
+      one; several sheets are stacked with a ``Sheet`` column) and columns
+      the columns to keep (default: all).
+    - If use_cache is True, full loads are served from and stored in the
+      on-disk table cache.
+    - If dtype_profile is set (e.g. "olympics"), columns are converted with
+      ``optimize_dtypes`` and meta reports memory before and after.
     Returns(df, meta)
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
+    if is_store(file_path):
+        # Stores are mapped, not parsed: there is nothing for the cache to save.
+        df, meta = open_store(file_path)
+        if sample_rows is not None:
+            df = df.head(sample_rows)
+        return apply_dtype_profile(df, meta, dtype_profile)
+
+    variant = selection_variant(sheets, columns)
+    if use_cache and sample_rows is None:
+        cached = get_default_cache().get(file_path, variant)
+        if cached is not None:
+            return apply_dtype_profile(*cached, dtype_profile)
+
     ext = os.path.splitext(file_path)[1].lower()
-    if ext in (".xlsx", ".xls"):
-        df = pd.read_excel(file_path)
+    encoding = None
+    if ext in EXCEL_EXTS:
+        df = read_workbook(file_path, sheets, columns)
     elif ext == ".csv":
-        try:
-            df = pd.read_csv(file_path)
-        except UnicodeDecodeError:
-            df = pd.read_csv(file_path, encoding="latin-1")
+        encoding = detect_encoding(file_path)
+        df = pd.read_csv(file_path, nrows=sample_rows, usecols=columns, **_csv_encoding_kwargs(encoding))
     else:
         raise ValueError(f"Unsupported file type: {ext}")
 
     if sample_rows is not None:
         df = df.head(sample_rows).copy()
 
-    meta = {
+    meta = build_meta(file_path, df)
+    if encoding is not None:
+        meta["encoding"] = encoding
+    if use_cache and sample_rows is None:
+        get_default_cache().put(file_path, df, meta, variant)
+    return apply_dtype_profile(df, meta, dtype_profile)
+
+
+@timed(category="io")
+def apply_dtype_profile(df: pd.DataFrame, meta: dict, dtype_profile: str | None) -> tuple[pd.DataFrame, dict]:
+    """Run ``optimize_dtypes`` when a profile is given and merge its report into ``meta``."""
+    if dtype_profile is None:
+        return df, meta
+    df, report = optimize_dtypes(df, dtype_profile)
+    return df, {**meta, **report}
+
+
+def iter_table(
+        file_path: str,
+        chunksize: int = CHUNK_SIZE,
+        sheets: Sequence[str] | None = None,
+        columns: Sequence[str] | None = None,
+) -> Iterator[tuple[pd.DataFrame, dict]]:
+    """Yield ``(chunk, meta)`` pairs while reading ``file_path``.
+
+    ``meta`` has the same keys as ``load_table`` but ``rows`` is the running
+    total so far; ``bytes_read``/``size`` allow progress reporting. CSV files
+    are parsed incrementally with the encoding detected once up front, Excel
+    sheets (``sheets``/``columns`` as in ``load_table``) are parsed whole,
+    in parallel when there are several, and then sliced. A project store is
+    mapped and yielded as a single chunk.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    if is_store(file_path):
+        df, meta = open_store(file_path)
+        size = store_size(file_path)
+        yield df, {**meta, "size": size, "bytes_read": size}
+        return
+
+    ext = os.path.splitext(file_path)[1].lower()
+    size = os.path.getsize(file_path)
+    if ext in EXCEL_EXTS:
+        meta: dict | None = None
+        for done, (sheet, df) in enumerate(iter_sheets(file_path, sheets, columns), start=1):
+            df = with_sheet_column(df, sheet, sheets)
+            if meta is None:
+                meta = build_meta(file_path, df.iloc[0:0])
+                meta.update(size=size)
+                if SHEET_COLUMN in df.columns:
+                    meta["sheets"] = len(sheets)
+            # Progress advances sheet by sheet; a yielded meta is never changed.
+            meta = {**meta, "bytes_read": size * done // (len(sheets) if sheets else 1)}
+            for start in range(0, max(len(df), 1), chunksize):
+                chunk = df.iloc[start:start + chunksize]
+                meta = {**meta, "rows": meta["rows"] + len(chunk)}
+                yield chunk, meta
+    elif ext == ".csv":
+        encoding = detect_encoding(file_path)
+        meta: dict | None = None
+        with open(file_path, "rb") as fh:
+            with pd.read_csv(fh, chunksize=chunksize, usecols=columns, **_csv_encoding_kwargs(encoding)) as reader:
+                for chunk in reader:
+                    if meta is None:
+                        meta = build_meta(file_path, chunk.iloc[0:0])
+                        meta.update(encoding=encoding, size=size)
+                    meta = {
+                        **meta,
+                        "rows": meta["rows"] + len(chunk),
+                        "bytes_read": min(fh.tell(), size),
+                    }
+                    yield chunk, meta
+        if meta is None:
+            # Header-only file: the chunked reader yields nothing.
+            chunk = pd.read_csv(file_path, usecols=columns, **_csv_encoding_kwargs(encoding))
+            meta = build_meta(file_path, chunk)
+            meta.update(encoding=encoding, size=size, bytes_read=size)
+            yield chunk, meta
+    else:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+
+@timed(category="io")
+def detect_encoding(file_path: str, sample_bytes: int = ENCODING_SAMPLE_BYTES) -> str:
+    """Guess a text encoding from the first ``sample_bytes`` of ``file_path``.
+
+    Returns ``"utf-8-sig"`` when a UTF-8 BOM is present, ``"utf-8"`` when the
+    sample decodes cleanly and ``FALLBACK_ENCODING`` otherwise. Bytes past
+    the sample that are not valid UTF-8 are decoded with the fallback one by
+    one, see ``FALLBACK_ERRORS``.
+    """
+    with open(file_path, "rb") as fh:
+        sample = fh.read(sample_bytes)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # final=False tolerates a multi-byte sequence cut at the sample boundary.
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+    return "utf-8"
+
+
+def selection_variant(sheets: Sequence[str] | None, columns: Sequence[str] | None) -> str:
+    """Cache variant naming a sheet/column selection; empty for the default one."""
+    if not sheets and columns is None:
+        return ""
+    return json.dumps({"sheets": list(sheets or ()), "columns": None if columns is None else list(columns)})
+
+
+def _csv_encoding_kwargs(encoding: str) -> dict:
+    # A stray invalid byte past the sample must neither abort a half-read
+    # file nor force a second pass, and the valid UTF-8 around it must stay
+    # intact: only that byte is read as FALLBACK_ENCODING.
+    if encoding.startswith("utf-8"):
+        return {"encoding": encoding, "encoding_errors": FALLBACK_ERRORS}
+    return {"encoding": encoding}
+
+
+def build_meta(file_path: str, df: pd.DataFrame) -> dict:
+    """Describe a loaded table the same way ``load_table`` does."""
+    return {
         "name": os.path.basename(file_path),
         "rows": len(df),
         "cols": len(df.columns),
-        "ext": ext,
+        "ext": os.path.splitext(file_path)[1].lower(),
         "path": os.path.abspath(file_path),
     }
-    return df, meta
\ No newline at end of file
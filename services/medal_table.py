@@ -0,0 +1,174 @@
+"""Medal tallies per Games and NOC."""
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from services.instrumentation import timed
+from services.result_cache import ResultCache, dataframe_fingerprint, get_result_cache
+
+MEDALS = ("Gold", "Silver", "Bronze")
+KEY_COLUMNS = ("Games", "Event", "NOC", "Medal")
+# Bit widths of the packed (Games, Event, NOC, Medal) key; 58 bits in all.
+_MEDAL_BITS = 2
+_NOC_BITS = 16
+_EVENT_BITS = 24
+_NOC_SHIFT = _MEDAL_BITS
+_EVENT_SHIFT = _NOC_SHIFT + _NOC_BITS
+_GAMES_SHIFT = _EVENT_SHIFT + _EVENT_BITS
+
+
+class MedalTable:
+    """Gold/silver/bronze counts per Games and NOC, built incrementally.
+
+    A team event awards one medal per NOC no matter how many athletes are
+    listed, so a medal is counted once per distinct (Games, Event, NOC, Medal).
+    Those keys are packed into int64 codes and kept in a sorted array, which
+    makes the deduplication of appended rows a vectorized set difference: only
+    medals never seen before are added to the ``games x NOC x medal`` count
+    cube.
+
+    Once :meth:`freeze` is called (as for every table shared through the
+    result cache) further appends raise ``ValueError``.
+    """
+
+    def __init__(self):
+        self._codes: dict[str, dict[str, int]] = {c: {} for c in ("Games", "Event", "NOC")}
+        self._labels: dict[str, list[str]] = {c: [] for c in ("Games", "Event", "NOC")}
+        self._seen = np.empty(0, dtype=np.int64)
+        self._counts = np.zeros((0, 0, len(MEDALS)), dtype=np.int64)
+        self._tables: dict[str | None, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+        self.rows = 0
+        self.frozen = False
+
+    @property
+    def games(self) -> list[str]:
+        """Games with at least one medal, in chronological order."""
+        with self._lock:
+            present = self._counts.sum(axis=(1, 2)) > 0
+            return sorted(g for g, keep in zip(self._labels["Games"], present) if keep)
+
+    def freeze(self) -> MedalTable:
+        """Refuse further appends, so the table can be shared; returns ``self``."""
+        self.frozen = True
+        return self
+
+    @timed("medal_table.append", category="stats")
+    def append(self, df: pd.DataFrame) -> int:
+        """Add the medals in ``df``; return how many were new."""
+        if self.frozen:
+            raise ValueError("Medal table is frozen; build a new MedalTable to append rows")
+        missing = [c for c in KEY_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(f"Missing columns for the medal table: {', '.join(missing)}")
+
+        medal = _codes_for(df["Medal"], {m: i for i, m in enumerate(MEDALS)})
+        rows = medal >= 0
+        with self._lock:
+            self.rows += len(df)
+            if not rows.any():
+                return 0
+            subset = df.loc[rows, ["Games", "Event", "NOC"]]
+            games = self._intern("Games", subset["Games"])
+            event = self._intern("Event", subset["Event"])
+            noc = self._intern("NOC", subset["NOC"])
+            valid = (games >= 0) & (event >= 0) & (noc >= 0)
+            games, event, noc, medal = games[valid], event[valid], noc[valid], medal[rows][valid]
+
+            keys = np.unique(
+                (games << _GAMES_SHIFT) | (event << _EVENT_SHIFT) | (noc << _NOC_SHIFT) | medal
+            )
+            new = keys[~np.isin(keys, self._seen, assume_unique=True)]
+            if len(new) == 0:
+                return 0
+            self._seen = np.union1d(self._seen, new)
+
+            self._grow()
+            index = (
+                new >> _GAMES_SHIFT,
+                (new >> _NOC_SHIFT) & ((1 << _NOC_BITS) - 1),
+                new & ((1 << _MEDAL_BITS) - 1),
+            )
+            np.add.at(self._counts, index, 1)
+            self._tables.clear()
+            return len(new)
+
+    def table(self, games: str | None = None) -> pd.DataFrame:
+        """Medal table of one Games, or all Games together when None.
+
+        Sorted like the official tables: gold, then silver, then bronze.
+        """
+        with self._lock:
+            cached = self._tables.get(games)
+            if cached is not None:
+                return cached
+            if games is None:
+                counts = self._counts.sum(axis=0)
+            elif games in self._codes["Games"]:
+                counts = self._counts[self._codes["Games"][games]]
+            else:
+                counts = np.zeros((0, len(MEDALS)), dtype=np.int64)
+
+            won = counts.sum(axis=1) > 0
+            table = pd.DataFrame(counts[won], columns=list(MEDALS))
+            table.insert(0, "NOC", np.asarray(self._labels["NOC"], dtype=object)[won])
+            table["Total"] = table[list(MEDALS)].sum(axis=1)
+            table = table.sort_values(["Gold", "Silver", "Bronze", "NOC"], ascending=[False, False, False, True])
+            table.insert(0, "Rank", np.arange(1, len(table) + 1))
+            table = table.reset_index(drop=True)
+            self._tables[games] = table
+            return table
+
+    def _intern(self, kind: str, series: pd.Series) -> np.ndarray:
+        """Global codes of ``series``, adding unseen labels; -1 for missing values."""
+        codes, uniques = pd.factorize(series)
+        known = self._codes[kind]
+        labels = self._labels[kind]
+        mapping = np.empty(len(uniques) + 1, dtype=np.int64)
+        mapping[-1] = -1
+        for i, label in enumerate(map(str, uniques)):
+            code = known.get(label)
+            if code is None:
+                code = known[label] = len(labels)
+                labels.append(label)
+            mapping[i] = code
+        return mapping[codes]
+
+    def _grow(self) -> None:
+        games, nocs = len(self._labels["Games"]), len(self._labels["NOC"])
+        if self._counts.shape[0] < games or self._counts.shape[1] < nocs:
+            grown = np.zeros((games, nocs, len(MEDALS)), dtype=np.int64)
+            grown[:self._counts.shape[0], :self._counts.shape[1]] = self._counts
+            self._counts = grown
+
+
+def _codes_for(series: pd.Series, codes: dict[str, int]) -> np.ndarray:
+    """Map ``series`` through ``codes`` looking up each distinct value once; -1 when absent."""
+    local, uniques = pd.factorize(series)
+    mapping = np.array([codes.get(str(u), -1) for u in uniques] + [-1], dtype=np.int64)
+    return mapping[local]
+
+
+def medal_table_for(df: pd.DataFrame, cache: ResultCache | None = None) -> MedalTable:
+    """Return the frozen medal table of ``df``, reusing the one built for an identical frame."""
+    cache = cache if cache is not None else get_result_cache()
+    key = _cache_key(df)
+    table = cache.get(key)
+    if table is None:
+        table = MedalTable()
+        table.append(df)
+        cache.put(key, table.freeze())
+    return table
+
+
+def cache_medal_table(df: pd.DataFrame, table: MedalTable, cache: ResultCache | None = None) -> None:
+    """Freeze ``table``, built from the rows of ``df`` (e.g. chunk by chunk), and serve it from ``medal_table_for(df)``."""
+    cache = cache if cache is not None else get_result_cache()
+    cache.put(_cache_key(df), table.freeze())
+
+
+def _cache_key(df: pd.DataFrame) -> tuple[str, str]:
+    return dataframe_fingerprint(df), "medal_table"
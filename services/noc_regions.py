@@ -0,0 +1,75 @@
+"""NOC -> region enrichment backed by ``noc_regions.csv``."""
+from __future__ import annotations
+
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from services.instrumentation import timed
+
+NOC_REGIONS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "noc_regions.csv")
+NOC_COLUMN = "NOC"
+REGION_COLUMN = "Region"
+
+_lock = threading.Lock()
+_cache: dict[str, tuple[int, pd.Series]] = {}
+
+
+def load_noc_regions(path: str = NOC_REGIONS_PATH) -> pd.Series:
+    """Return the region of each NOC as a Series indexed by NOC, read once per file version.
+
+    The file uses bare CR line endings, so it is opened with universal
+    newlines. NOCs without a region (refugee team, Tuvalu, unknown) fall back
+    to their note.
+    """
+    stamp = os.stat(path).st_mtime_ns
+    with _lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    with open(path, encoding="utf-8", newline=None) as fh:
+        table = pd.read_csv(fh, dtype=str)
+    regions = table["region"].fillna(table["notes"])
+    mapping = pd.Series(regions.to_numpy(), index=table["NOC"].str.strip(), name=REGION_COLUMN)
+    mapping = mapping[~mapping.index.duplicated()]
+
+    with _lock:
+        _cache[path] = (stamp, mapping)
+    return mapping
+
+
+@timed(category="io")
+def add_region(df: pd.DataFrame, regions: pd.Series | None = None) -> pd.DataFrame:
+    """Return ``df`` with a categorical ``Region`` column right after ``NOC``.
+
+    Only the distinct NOCs are looked up: their codes index a small
+    code -> region-code array, so the cost on the rows is one gather. NOCs
+    missing from the table get a missing region. ``df`` is returned as is
+    when it has no NOC column.
+    """
+    if NOC_COLUMN not in df.columns:
+        return df
+    if regions is None:
+        regions = load_noc_regions()
+
+    noc = df[NOC_COLUMN]
+    if isinstance(noc.dtype, pd.CategoricalDtype):
+        codes = noc.cat.codes.to_numpy()
+        uniques = noc.cat.categories
+    else:
+        codes, uniques = pd.factorize(noc)
+    categories = pd.Index(sorted(regions.dropna().unique()))
+
+    # lookup[k] is the region code of NOC code k; the extra last slot maps
+    # missing NOCs (code -1) to a missing region.
+    lookup = np.full(len(uniques) + 1, -1, dtype=np.int32)
+    lookup[:-1] = categories.get_indexer(regions.reindex(pd.Index(uniques).astype(str).str.strip()))
+    region = pd.Categorical.from_codes(lookup[codes], categories=categories)
+
+    out = df.drop(columns=[REGION_COLUMN], errors="ignore")
+    out.insert(out.columns.get_loc(NOC_COLUMN) + 1, REGION_COLUMN, region)
+    return out
+
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from services.instrumentation import span
+
+DEFAULT_MAX_PAGES = 8
+DEFAULT_PREFETCH_RADIUS = 1
+
+Page = list[tuple[str, ...]]
+
+
+class PageCache:
+    """Bounded LRU of pages of ``df`` already converted to display strings.
+
+    :meth:`prefetch` prepares the neighbours of the current page on a
+    background thread, so flipping pages only swaps prepared row tuples.
+    With ``rows`` the pages walk that array of row positions (a filtered or
+    sorted view) instead of ``df`` itself.
+    """
+
+    def __init__(
+            self,
+            df: pd.DataFrame,
+            page_size: int,
+            max_pages: int = DEFAULT_MAX_PAGES,
+            prefetch_radius: int = DEFAULT_PREFETCH_RADIUS,
+            rows: np.ndarray | None = None,
+    ):
+        self.df = df
+        self.rows = rows
+        self.page_size = max(int(page_size), 1)
+        self.max_pages = max_pages
+        self.prefetch_radius = prefetch_radius
+        self.columns = [str(c) for c in df.columns]
+        self._pages: OrderedDict[int, Page] = OrderedDict()
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-cache")
+
+    @property
+    def row_count(self) -> int:
+        return len(self.df) if self.rows is None else len(self.rows)
+
+    @property
+    def page_count(self) -> int:
+        return max((self.row_count - 1) // self.page_size + 1, 1)
+
+    def page_bounds(self, page_idx: int) -> tuple[int, int]:
+        start = page_idx * self.page_size
+        return start, min(start + self.page_size, self.row_count)
+
+    def set_page_size(self, page_size: int) -> None:
+        """Change the page size; prepared pages are dropped, the data is kept."""
+        page_size = max(int(page_size), 1)
+        if page_size == self.page_size:
+            return
+        with self._lock:
+            self.page_size = page_size
+            self._pages.clear()
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+
+    def get(self, page_idx: int) -> Page:
+        """Return the rows of ``page_idx``, preparing them now if needed."""
+        with self._lock:
+            page = self._pages.get(page_idx)
+            if page is not None:
+                self._pages.move_to_end(page_idx)
+                return page
+            future = self._pending.get(page_idx)
+        if future is not None and not future.cancelled():
+            return future.result()
+        return self._prepare(page_idx, self.page_size)
+
+    def prefetch(self, page_idx: int) -> None:
+        """Prepare the pages around ``page_idx`` in the background."""
+        for offset in range(1, self.prefetch_radius + 1):
+            for idx in (page_idx + offset, page_idx - offset):
+                if not 0 <= idx < self.page_count:
+                    continue
+                with self._lock:
+                    if idx in self._pages or idx in self._pending:
+                        continue
+                    self._pending[idx] = self._executor.submit(self._prepare, idx, self.page_size)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prepare(self, page_idx: int, page_size: int) -> Page:
+        start = page_idx * page_size
+        with span("table.page_prepare", "table", page=page_idx, page_size=page_size):
+            if self.rows is None:
+                frame = self.df.iloc[start:start + page_size]
+            else:
+                frame = self.df.iloc[self.rows[start:start + page_size]]
+            columns = (frame.iloc[:, j].astype(str).tolist() for j in range(frame.shape[1]))
+            page = list(zip(*columns)) if frame.shape[1] else []
+        with self._lock:
+            # A page prepared for an old page size must not be cached.
+            if page_size == self.page_size:
+                self._pending.pop(page_idx, None)
+                self._pages[page_idx] = page
+                self._pages.move_to_end(page_idx)
+                while len(self._pages) > self.max_pages:
+                    self._pages.popitem(last=False)
+        return page
@@ -0,0 +1,171 @@
+"""Off-thread computation of Step 2 statistics and figure data.
+
+``StatisticsJob`` fans the summary and every per-column figure out to an
+executor: a process pool for large tables so work spreads over all cores, a
+thread pool for small ones where process start-up and pickling would dominate.
+Only the rendering of the returned data is left to the Tk thread.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from services import instrumentation
+from services.plot_data import GROUP_COLUMN, MATRIX_EXCLUDE, PLOT_KINDS, matrix_data, prepare_plot_data
+from services.result_cache import ResultCache, dataframe_fingerprint
+from services.statistical_calc import StatisticsSummary, compute_summary
+
+PROCESS_POOL_MIN_ROWS = 50_000
+
+_MISSING = object()
+
+_lock = threading.Lock()
+_process_pool: ProcessPoolExecutor | None = None
+_thread_pool: ThreadPoolExecutor | None = None
+
+
+def get_executor(rows: int) -> Executor:
+    """Return the shared executor suited to a table of ``rows`` rows."""
+    global _process_pool, _thread_pool
+    with _lock:
+        if rows >= PROCESS_POOL_MIN_ROWS:
+            if _process_pool is None:
+                # "spawn" keeps workers from inheriting the Tk interpreter state.
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return _process_pool
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="stats")
+        return _thread_pool
+
+
+def _discard_process_pool() -> None:
+    global _process_pool
+    with _lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+@dataclass
+class StatisticsResult:
+    summary: StatisticsSummary
+    # (kind, column) -> figure data; column is None for whole-table kinds.
+    plot_data: dict[tuple[str, str | None], Any] = field(default_factory=dict)
+
+
+class StatisticsJob:
+    """Compute a summary plus the requested ``(kind, column)`` figure data in the background.
+
+    Pass a previously computed ``summary`` to skip recomputing it. With a
+    ``cache``, results are looked up and stored under the DataFrame
+    ``fingerprint`` (computed when not given). Poll :meth:`done` from the UI
+    loop and then call :meth:`result`.
+    """
+
+    def __init__(
+            self,
+            numeric_df: pd.DataFrame,
+            plots: Iterable[tuple[str, str | None]],
+            executor: Executor | None = None,
+            summary: StatisticsSummary | None = None,
+            cache: ResultCache | None = None,
+            fingerprint: str | None = None,
+    ):
+        self.numeric_df = numeric_df
+        self.plots = list(plots)
+        self.executor = executor if executor is not None else get_executor(len(numeric_df))
+        self.cache = cache
+        self.fingerprint = fingerprint
+        self._known_summary = summary
+        self._summary: Future | None = None
+        self._plot_futures: dict[tuple[str, str | None], Future] = {}
+        self._cached_plots: dict[tuple[str, str | None], Any] = {}
+        self._started_ns = 0
+
+    def start(self) -> None:
+        self._started_ns = time.perf_counter_ns()
+        if self.cache is not None and self.fingerprint is None:
+            self.fingerprint = dataframe_fingerprint(self.numeric_df)
+
+        summary = self._known_summary
+        if summary is None and self.cache is not None:
+            summary = self.cache.get((self.fingerprint, "summary"))
+        if summary is not None:
+            self._summary = Future()
+            self._summary.set_result(summary)
+        else:
+            self._summary = self._submit(compute_summary, self.numeric_df)
+
+        groups = None
+        if GROUP_COLUMN in self.numeric_df.columns:
+            groups = self.numeric_df[GROUP_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+        for kind, column in self.plots:
+            if not PLOT_KINDS.get(kind) or column not in self.numeric_df.columns:
+                continue
+            if self.cache is not None:
+                cached = self.cache.get((self.fingerprint, kind, column), _MISSING)
+                if cached is not _MISSING:
+                    self._cached_plots[(kind, column)] = cached
+                    continue
+            values = self.numeric_df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            self._plot_futures[(kind, column)] = self._submit(prepare_plot_data, kind, values, groups)
+
+    def done(self) -> bool:
+        futures = [self._summary, *self._plot_futures.values()]
+        return all(f is not None and f.done() for f in futures)
+
+    def cancel(self) -> None:
+        for future in [self._summary, *self._plot_futures.values()]:
+            if future is not None:
+                future.cancel()
+
+    def result(self) -> StatisticsResult:
+        """Return the finished result; re-raises any exception from a worker."""
+        try:
+            summary = self._summary.result()
+            result = StatisticsResult(summary)
+            for key, future in self._plot_futures.items():
+                result.plot_data[key] = future.result()
+        except BrokenProcessPool:
+            _discard_process_pool()
+            raise
+
+        if self.cache is not None:
+            self.cache.put((self.fingerprint, "summary"), summary)
+            for (kind, column), data in result.plot_data.items():
+                self.cache.put((self.fingerprint, kind, column), data)
+        result.plot_data.update(self._cached_plots)
+        for kind, column in self.plots:
+            # Heatmaps reuse the matrices the summary already computed.
+            if kind == "covariance":
+                result.plot_data[(kind, column)] = matrix_data(summary.covariance, MATRIX_EXCLUDE)
+            elif kind == "correlation":
+                result.plot_data[(kind, column)] = matrix_data(summary.correlation, MATRIX_EXCLUDE)
+        instrumentation.record(
+            "statistics.job", self._started_ns, time.perf_counter_ns(), "stats",
+            plots=len(self.plots), cached=len(self._cached_plots),
+        )
+        return result
+
+    def _submit(self, fn, *args) -> Future:
+        try:
+            return self.executor.submit(fn, *args)
+        except (BrokenProcessPool, RuntimeError):
+            # A dead worker (or a frozen build without multiprocessing support)
+            # should slow things down, not break Step 2.
+            _discard_process_pool()
+            self.executor = get_executor(0)
+            return self.executor.submit(fn, *args)
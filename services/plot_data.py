@@ -0,0 +1,213 @@
+"""Figure data for StatisticalPlot.
+
+Everything here is plain NumPy/pandas work that returns small picklable
+objects, so it can run in worker processes; turning the results into
+matplotlib figures is left to ``StatisticalPlot`` on the Tk thread.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from services.instrumentation import timed
+
+DISPERSION_SAMPLE_SIZE = 10000
+HISTOGRAM_BINS = 10
+DISTRIBUTION_BINS = 30
+# Above this many points a line/scatter series is downsampled with LTTB.
+MAX_SERIES_POINTS = 2000
+# Cells per axis of the density grid replacing large dispersion scatters.
+DENSITY_BINS = 120
+
+# Column the dispersion and standard deviation plots are drawn against.
+GROUP_COLUMN = "Year"
+# Identifier-like columns left out of the covariance/correlation heatmaps.
+MATRIX_EXCLUDE = ("ID", "Year")
+
+# Plot kind -> True when it is drawn once per numeric column, False for one
+# figure over the whole table.
+PLOT_KINDS = {
+    "total": True,
+    "histogram": True,
+    "percentile": True,
+    "dispersion": True,
+    "distribution": True,
+    "standard_deviation": True,
+    "covariance": False,
+    "correlation": False,
+}
+
+
+@dataclass(frozen=True)
+class PointsData:
+    x: np.ndarray
+    y: np.ndarray
+
+
+@dataclass(frozen=True)
+class HistogramData:
+    edges: np.ndarray
+    counts: np.ndarray
+
+
+@dataclass(frozen=True)
+class DensityData:
+    x_edges: np.ndarray
+    y_edges: np.ndarray
+    # counts[i, j] is the number of pairs in x bin i and y bin j.
+    counts: np.ndarray
+
+
+@dataclass(frozen=True)
+class BandData:
+    x: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+
+
+@dataclass(frozen=True)
+class MatrixData:
+    labels: tuple[str, ...]
+    values: np.ndarray
+
+
+def _finite(values: np.ndarray | pd.Series) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    return values[~np.isnan(values)]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    ``x`` must be sorted. The first and last points are always kept; every
+    bucket in between contributes the point forming the largest triangle with
+    the previously kept point and the mean of the next bucket, which keeps
+    peaks and troughs that uniform sampling would drop.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    bounds = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    prev = 0
+    for b in range(threshold - 2):
+        start, stop = bounds[b], bounds[b + 1]
+        next_stop = bounds[b + 2] if b + 2 < len(bounds) else n
+        if next_stop > stop:
+            avg_x, avg_y = x[stop:next_stop].mean(), y[stop:next_stop].mean()
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:stop] - y[prev])
+            - (x[prev] - x[start:stop]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(area))
+        kept[b + 1] = prev
+    return kept
+
+
+def downsample_points(data: PointsData, max_points: int = MAX_SERIES_POINTS) -> PointsData:
+    """``data`` reduced to at most ``max_points`` points with LTTB."""
+    if len(data.x) <= max_points:
+        return data
+    idx = lttb_indices(data.x, np.asarray(data.y, dtype=np.float64), max_points)
+    return PointsData(data.x[idx], data.y[idx])
+
+
+def value_counts_data(values: np.ndarray | pd.Series, max_points: int = MAX_SERIES_POINTS) -> PointsData | None:
+    """Occurrences of each distinct value, sorted by value and downsampled to ``max_points``."""
+    values = _finite(values)
+    if len(values) == 0:
+        return None
+    unique, counts = np.unique(values, return_counts=True)
+    return downsample_points(PointsData(unique, counts), max_points)
+
+
+def histogram_data(values: np.ndarray | pd.Series, bins: int = HISTOGRAM_BINS) -> HistogramData | None:
+    """Binned counts with ``bins`` equal-width bins over the data range."""
+    values = _finite(values)
+    if len(values) == 0:
+        return None
+    counts, edges = np.histogram(values, bins=bins)
+    return HistogramData(edges, counts)
+
+
+def percentile_data(values: np.ndarray | pd.Series) -> PointsData | None:
+    """Value at every integer percentile 0..100."""
+    values = _finite(values)
+    if len(values) == 0:
+        return None
+    percentiles = np.linspace(0, 100, 101)
+    return PointsData(percentiles, np.percentile(values, percentiles))
+
+
+def dispersion_data(
+        x: np.ndarray | pd.Series,
+        y: np.ndarray | pd.Series,
+        sample_size: int = DISPERSION_SAMPLE_SIZE,
+        bins: int = DENSITY_BINS,
+) -> PointsData | DensityData | None:
+    """Pairs present in both ``x`` and ``y``.
+
+    Up to ``sample_size`` pairs are returned as points; beyond that they are
+    aggregated into a ``bins`` x ``bins`` density grid, whose size does not
+    depend on the number of rows.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[keep], y[keep]
+    if len(x) == 0:
+        return None
+    if len(x) <= sample_size:
+        return PointsData(x, y)
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins)
+    return DensityData(x_edges, y_edges, counts)
+
+
+def std_band_data(values: np.ndarray | pd.Series, groups: np.ndarray | pd.Series) -> BandData | None:
+    """Mean and standard deviation of ``values`` within each group, sorted by group."""
+    frame = pd.DataFrame({"value": np.asarray(values, dtype=np.float64), "group": np.asarray(groups)})
+    grouped = frame.groupby("group", sort=True)["value"]
+    means = grouped.mean()
+    if means.empty:
+        return None
+    stds = grouped.std()
+    return BandData(means.index.to_numpy(), means.to_numpy(), stds.to_numpy())
+
+
+def matrix_data(matrix: dict[str, dict[str, float]], exclude: tuple[str, ...] = ()) -> MatrixData | None:
+    """Square ``{column: {row: value}}`` matrix without the ``exclude`` labels."""
+    labels = tuple(c for c in matrix if c not in exclude)
+    if not labels:
+        return None
+    values = np.array([[matrix[col][row] for col in labels] for row in labels], dtype=np.float64)
+    return MatrixData(labels, values)
+
+
+@timed(category="plot")
+def prepare_plot_data(kind: str, values: np.ndarray, groups: np.ndarray | None = None):
+    """Compute the figure data of a per-column plot ``kind`` (see ``PLOT_KINDS``).
+
+    ``groups`` holds the ``GROUP_COLUMN`` values aligned with ``values`` and is
+    only used by the kinds drawn against it.
+    """
+    match kind:
+        case "total":
+            return value_counts_data(values)
+        case "histogram":
+            return histogram_data(values)
+        case "percentile":
+            return percentile_data(values)
+        case "distribution":
+            return histogram_data(values, bins=DISTRIBUTION_BINS)
+        case "dispersion":
+            return None if groups is None else dispersion_data(values, groups)
+        case "standard_deviation":
+            return None if groups is None else std_band_data(values, groups)
+    raise ValueError(f"Unknown per-column plot kind: {kind}")
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_ENTRIES = 512
+FINGERPRINT_BLOCKS = 8
+FINGERPRINT_BLOCK_ROWS = 256
+
+
+def dataframe_fingerprint(
+        df: pd.DataFrame,
+        blocks: int = FINGERPRINT_BLOCKS,
+        block_rows: int = FINGERPRINT_BLOCK_ROWS,
+) -> str:
+    """Return a cheap content fingerprint of ``df``.
+
+    Hashes the column names, dtypes and length plus ``blocks`` evenly spaced
+    blocks of ``block_rows`` rows (always including the first and last rows).
+    Two frames differing only outside the sampled blocks share a fingerprint,
+    which is the price for not hashing every row.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([str(c) for c in df.columns]).encode("utf-8"))
+    digest.update(repr([str(t) for t in df.dtypes]).encode("utf-8"))
+    digest.update(str(len(df)).encode("ascii"))
+
+    n = len(df)
+    if n and len(df.columns):
+        starts = np.unique(np.linspace(0, max(n - block_rows, 0), num=blocks).astype(np.int64))
+        for start in starts:
+            block = df.iloc[start:start + block_rows]
+            digest.update(pd.util.hash_pandas_object(block, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU memo of computed results with hit/miss counters."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+_default_cache: ResultCache | None = None
+
+
+def get_result_cache() -> ResultCache:
+    """Return the process-wide statistics result cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
@@ -1,6 +1,13 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from services.instrumentation import timed
+
 
 def _numeric_only(df: pd.DataFrame) -> DataFrame | None:
     """Return a DataFrame containing only numeric columns."""
@@ -8,6 +15,7 @@ def _numeric_only(df: pd.DataFrame) -> DataFrame | None:
         return df
     return df.select_dtypes(include="number")
 
+@timed(category="stats")
 def total_calc(df: pd.DataFrame) -> dict[str, int]:
     """Return the sum of numeric values within each column of ``df``."""
     numeric_df = _numeric_only(df)
@@ -15,6 +23,7 @@ def total_calc(df: pd.DataFrame) -> dict[str, int]:
         return {}
     return numeric_df.sum(numeric_only=True).to_dict()
 
+@timed(category="stats")
 def average_calc(df: pd.DataFrame) -> dict[str, int]:
     """Return the average of numeric values within each column of ``df``."""
     numeric_df = _numeric_only(df)
@@ -22,6 +31,7 @@ def average_calc(df: pd.DataFrame) -> dict[str, int]:
         return {}
     return numeric_df.mean(numeric_only=True).to_dict()
 
+@timed(category="stats")
 def median_calc(df: pd.DataFrame) -> dict[str, int]:
     """Return the median of numeric values within each column of ``df``."""
     numeric_df = _numeric_only(df)
@@ -29,6 +39,7 @@ def median_calc(df: pd.DataFrame) -> dict[str, int]:
         return {}
     return numeric_df.median(numeric_only=True).to_dict()
 
+@timed(category="stats")
 def mode_calc(df: pd.DataFrame) -> dict[str, int]:
     """Return the mode of numeric values within each column of ``df``."""
     numeric_df = _numeric_only(df)
@@ -36,6 +47,7 @@ def mode_calc(df: pd.DataFrame) -> dict[str, int]:
         return {}
     return numeric_df.mode(numeric_only=True).to_dict()
 
+@timed(category="stats")
 def variance_calc(df: pd.DataFrame) -> dict[str, int]:
     """Return the variance of numeric values within each column of ``df``."""
     numeric_df = _numeric_only(df)
@@ -43,6 +55,7 @@ def variance_calc(df: pd.DataFrame) -> dict[str, int]:
         return {}
     return numeric_df.var(numeric_only=True).to_dict()
 
+@timed(category="stats")
 def std_deviation_calc(df: pd.DataFrame) -> dict[str, int]:
     """Return the standard deviation of numeric values within each column of ``df``."""
     numeric_df = _numeric_only(df)
@@ -50,6 +63,7 @@ def std_deviation_calc(df: pd.DataFrame) -> dict[str, int]:
         return {}
     return numeric_df.std(numeric_only=True).to_dict()
 
+@timed(category="stats")
 def covariance_calc(df: pd.DataFrame) -> dict[str, int]:
     """Return the covariance of numeric values within each column of ``df``."""
     numeric_df = _numeric_only(df)
@@ -57,9 +71,282 @@ def covariance_calc(df: pd.DataFrame) -> dict[str, int]:
         return {}
     return numeric_df.cov(numeric_only=True).to_dict()
 
+@timed(category="stats")
 def correlation_calc(df: pd.DataFrame) -> dict[str, int]:
     """Return the correlation of numeric values within each column of ``df``."""
     numeric_df = _numeric_only(df)
     if numeric_df.empty:
         return {}
-    return numeric_df.corr(numeric_only=True).to_dict()
\ No newline at end of file
+    return numeric_df.corr(numeric_only=True).to_dict()
+
+
+@dataclass(frozen=True)
+class StatisticsSummary:
+    """Every Step 2 statistic for the numeric columns of a DataFrame.
+
+    Each field has the same shape as the result of the matching ``*_calc``
+    function: a ``{column: value}`` dict, or ``{column: {other: value}}`` for
+    ``mode``, ``covariance`` and ``correlation``.
+    """
+    columns: tuple[str, ...] = ()
+    count: dict[str, int] = field(default_factory=dict)
+    total: dict[str, float] = field(default_factory=dict)
+    mean: dict[str, float] = field(default_factory=dict)
+    median: dict[str, float] = field(default_factory=dict)
+    mode: dict[str, dict[int, float]] = field(default_factory=dict)
+    variance: dict[str, float] = field(default_factory=dict)
+    std: dict[str, float] = field(default_factory=dict)
+    covariance: dict[str, dict[str, float]] = field(default_factory=dict)
+    correlation: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+@timed(category="stats")
+def compute_summary(df: pd.DataFrame) -> StatisticsSummary:
+    """Compute all Step 2 statistics of ``df`` in a single pass over its numeric columns.
+
+    Sum, mean, variance and standard deviation come from shared moment sums,
+    medians from one ``np.partition`` per column and the correlation matrix is
+    derived from the pairwise co-moments used for the covariance matrix.
+    Missing values are skipped and pairs use pairwise-complete rows, as in pandas.
+    """
+    numeric_df = _numeric_only(df)
+    if numeric_df.empty or len(numeric_df.columns) == 0:
+        return StatisticsSummary()
+
+    columns = list(numeric_df.columns)
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = ~np.isnan(values)
+    count = mask.sum(axis=0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        total = np.where(mask, values, 0.0).sum(axis=0)
+        mean = total / count
+        # Centering first keeps the co-moment sums free of cancellation error.
+        centered = np.where(mask, values - mean, 0.0)
+        variance = np.where(count > 1, (centered ** 2).sum(axis=0) / (count - 1), np.nan)
+        std = np.sqrt(variance)
+        covariance, correlation = _pairwise_moments(centered, mask.astype(np.float64))
+
+    integer_columns = {c for c in columns if pd.api.types.is_integer_dtype(numeric_df[c].dtype)}
+    medians, modes = {}, {}
+    for j, col in enumerate(columns):
+        present = values[mask[:, j], j]
+        medians[col] = _median(present)
+        modes[col] = _mode(present, as_int=col in integer_columns)
+
+    return StatisticsSummary(
+        columns=tuple(columns),
+        count=dict(zip(columns, count.tolist())),
+        total={
+            c: int(round(t)) if c in integer_columns else t
+            for c, t in zip(columns, total.tolist())
+        },
+        mean=dict(zip(columns, mean.tolist())),
+        median=medians,
+        mode=modes,
+        variance=dict(zip(columns, variance.tolist())),
+        std=dict(zip(columns, std.tolist())),
+        covariance=matrix_to_dict(covariance, columns),
+        correlation=matrix_to_dict(correlation, columns),
+    )
+
+
+def _pairwise_moments(centered: np.ndarray, present: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return pairwise-complete covariance and correlation matrices.
+
+    ``centered`` holds mean-centered values with zeros where ``present`` is 0.
+    For every pair the sums are restricted to rows where both columns exist.
+    """
+    n, _sum_x, comoment, own_m2 = pairwise_sums(centered, present)
+    return comoments_to_matrices(n, comoment, own_m2)
+
+
+def pairwise_sums(
+        centered: np.ndarray, present: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the ``(n, sum_x, comoment, own_m2)`` matrices of a block of rows.
+
+    Entry ``[i, j]`` is taken over the rows where both column ``i`` and ``j``
+    are present: ``n`` counts them, ``sum_x`` sums column ``i``, ``comoment``
+    is the co-moment of ``i`` and ``j`` and ``own_m2`` the second central
+    moment of ``i``. ``centered`` must be zero wherever ``present`` is 0.
+    """
+    n = present.T @ present
+    sum_x = centered.T @ present
+    sum_xy = centered.T @ centered
+    sum_xx = (centered ** 2).T @ present
+    with np.errstate(invalid="ignore", divide="ignore"):
+        comoment = np.where(n > 0, sum_xy - sum_x * sum_x.T / n, 0.0)
+        own_m2 = np.where(n > 0, sum_xx - sum_x ** 2 / n, 0.0)
+    return n, sum_x, comoment, own_m2
+
+
+def comoments_to_matrices(
+        n: np.ndarray, comoment: np.ndarray, own_m2: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Turn pairwise co-moments into sample covariance and correlation matrices."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        covariance = np.where(n > 1, comoment / (n - 1), np.nan)
+        correlation = np.clip(comoment / np.sqrt(own_m2 * own_m2.T), -1.0, 1.0)
+    np.fill_diagonal(correlation, np.where(np.diag(own_m2) > 0, 1.0, np.nan))
+    return covariance, correlation
+
+
+def _median(values: np.ndarray) -> float:
+    n = len(values)
+    if n == 0:
+        return float("nan")
+    mid = n // 2
+    if n % 2:
+        return float(np.partition(values, mid)[mid])
+    part = np.partition(values, (mid - 1, mid))
+    return float((part[mid - 1] + part[mid]) / 2)
+
+
+def _mode(values: np.ndarray, as_int: bool = False) -> dict[int, float]:
+    if len(values) == 0:
+        return {}
+    counts = pd.Series(values).value_counts(sort=False)
+    modes = np.sort(counts.index[counts.to_numpy() == counts.max()].to_numpy())
+    if as_int:
+        modes = modes.astype(np.int64)
+    return dict(enumerate(modes.tolist()))
+
+
+def matrix_to_dict(matrix: np.ndarray, columns: list[str]) -> dict[str, dict[str, float]]:
+    """Return a square matrix as ``{column: {row: value}}`` like ``DataFrame.to_dict``."""
+    return {
+        col: dict(zip(columns, matrix[:, j].tolist()))
+        for j, col in enumerate(columns)
+    }
+
+
+GROUP_STATISTICS = ("count", "total", "mean", "median", "mode", "variance", "std")
+
+
+@timed(category="stats")
+def grouped_summary(df: pd.DataFrame, by: list[str], columns: list[str] | None = None) -> pd.DataFrame:
+    """Compute the Step 2 statistics of every group of ``df`` split by the ``by`` columns.
+
+    ``columns`` defaults to the numeric columns not used as keys. The result
+    has one row per non-empty group (indexed by the key values) with a
+    ``Rows`` column, ``"<column> <statistic>"`` columns for each statistic in
+    ``GROUP_STATISTICS`` and ``"<a>×<b> cov"``/``"<a>×<b> corr"`` columns for
+    each pair. Rows with a missing key are left out, as in ``groupby``; the
+    mode is the smallest of the most frequent values.
+
+    Groups are numbered once from the categorical codes of the keys and all
+    statistics are segment reductions (``np.bincount`` and one lexsort for
+    medians and modes), so the cost does not grow with the number of groups.
+    """
+    by = list(by)
+    if not by:
+        raise ValueError("grouped_summary needs at least one column to group by")
+    if columns is None:
+        columns = [c for c in df.select_dtypes(include="number").columns if c not in by]
+
+    group, index = _group_ids(df, by)
+    keep = group >= 0
+    group = group[keep]
+    groups = len(index)
+    result: dict[str, np.ndarray] = {"Rows": np.bincount(group, minlength=groups)}
+
+    centered_columns: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for column in columns:
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)[keep]
+            present = ~np.isnan(values)
+            count = np.bincount(group[present], minlength=groups)
+            total = np.bincount(group[present], weights=values[present], minlength=groups)
+            mean = total / count
+            deviation = values[present] - mean[group[present]]
+            m2 = np.bincount(group[present], weights=deviation ** 2, minlength=groups)
+            variance = np.where(count > 1, m2 / (count - 1), np.nan)
+            median, mode = _group_median_mode(group[present], values[present], count, groups)
+
+            stats = {
+                "count": count, "total": total, "mean": mean, "median": median,
+                "mode": mode, "variance": variance, "std": np.sqrt(variance),
+            }
+            for name in GROUP_STATISTICS:
+                result[f"{column} {name}"] = stats[name]
+            # Centering on the overall mean keeps the pair sums below well conditioned.
+            centered_columns[column] = (values - np.nanmean(values) if present.any() else values, present)
+
+        names = list(centered_columns)
+        for i, a in enumerate(names):
+            for b in names[i + 1:]:
+                (x, x_present), (y, y_present) = centered_columns[a], centered_columns[b]
+                both = x_present & y_present
+                g, x, y = group[both], x[both], y[both]
+                n = np.bincount(g, minlength=groups)
+                sx = np.bincount(g, weights=x, minlength=groups)
+                sy = np.bincount(g, weights=y, minlength=groups)
+                cxy = np.bincount(g, weights=x * y, minlength=groups) - sx * sy / n
+                cxx = np.bincount(g, weights=x * x, minlength=groups) - sx ** 2 / n
+                cyy = np.bincount(g, weights=y * y, minlength=groups) - sy ** 2 / n
+                result[f"{a}×{b} cov"] = np.where(n > 1, cxy / (n - 1), np.nan)
+                result[f"{a}×{b} corr"] = np.clip(cxy / np.sqrt(cxx * cyy), -1.0, 1.0)
+
+    return pd.DataFrame(result, index=index)
+
+
+def _group_ids(df: pd.DataFrame, by: list[str]) -> tuple[np.ndarray, pd.Index]:
+    """Return each row's group number (-1 for a missing key) and the index of the groups."""
+    combined = np.zeros(len(df), dtype=np.int64)
+    missing = np.zeros(len(df), dtype=bool)
+    levels = []
+    for column in by:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, uniques = series.cat.codes.to_numpy().astype(np.int64), series.cat.categories
+        else:
+            codes, uniques = pd.factorize(series, sort=True)
+        missing |= codes < 0
+        combined = combined * (len(uniques) + 1) + np.where(codes < 0, 0, codes)
+        levels.append(pd.Index(uniques))
+
+    present_keys, group = np.unique(combined[~missing], return_inverse=True)
+    ids = np.full(len(df), -1, dtype=np.int64)
+    ids[~missing] = group
+
+    # Decode the key codes of every group, last column first.
+    key_codes = []
+    remainder = present_keys
+    for level in reversed(levels):
+        key_codes.append(remainder % (len(level) + 1))
+        remainder = remainder // (len(level) + 1)
+    key_codes.reverse()
+    if len(by) == 1:
+        index = pd.Index(levels[0].take(key_codes[0]), name=by[0])
+    else:
+        index = pd.MultiIndex(levels=levels, codes=key_codes, names=by)
+    return ids, index
+
+
+def _group_median_mode(
+        group: np.ndarray, values: np.ndarray, count: np.ndarray, groups: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-group median and smallest most frequent value of ``values``."""
+    median = np.full(groups, np.nan)
+    mode = np.full(groups, np.nan)
+    if len(values) == 0:
+        return median, mode
+
+    order = np.lexsort((values, group))
+    ordered = values[order]
+    starts = np.concatenate(([0], np.cumsum(count)[:-1]))
+    has = count > 0
+    lo = starts + (count - 1) // 2
+    hi = starts + count // 2
+    median[has] = (ordered[lo[has]] + ordered[hi[has]]) / 2
+
+    # Runs of equal (group, value) pairs; per group keep the longest, then the smallest value.
+    ordered_group = group[order]
+    run_start = np.flatnonzero(np.r_[True, (ordered_group[1:] != ordered_group[:-1]) | (ordered[1:] != ordered[:-1])])
+    run_length = np.diff(np.r_[run_start, len(ordered)])
+    run_group = ordered_group[run_start]
+    best = np.lexsort((ordered[run_start], -run_length, run_group))
+    first = best[np.r_[True, run_group[best][1:] != run_group[best][:-1]]]
+    mode[run_group[first]] = ordered[run_start[first]]
+    return median, mode
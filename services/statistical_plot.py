@@ -1,16 +1,34 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, Tuple, Literal
+from typing import Any, Iterable, Tuple
 
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 import numpy as np
 import pandas as pd
-import seaborn as sns
-import networkx as nx
 from matplotlib.axes import Axes
+from matplotlib.colors import LogNorm
 from matplotlib.figure import Figure
 from pandas import DataFrame
 
+from services.figure_pool import DEFAULT_MAX_LIVE_FIGURES, FigurePool
+from services.instrumentation import span
+from services.plot_data import (
+    DISTRIBUTION_BINS,
+    GROUP_COLUMN,
+    MATRIX_EXCLUDE,
+    BandData,
+    DensityData,
+    HistogramData,
+    MatrixData,
+    PointsData,
+    dispersion_data,
+    histogram_data,
+    matrix_data,
+    percentile_data,
+    std_band_data,
+    value_counts_data,
+)
+
 X_LABEL = {
     "AGE": "years old",
     "HEIGHT": "centimeters",
@@ -22,6 +40,36 @@ def _column_label(column: str) -> str:
     """Return a human friendly label for ``column``."""
     return X_LABEL.get(column.upper(), column.title())
 
+def _seaborn():
+    """Import seaborn on first use: only the heatmaps need it and it is slow to import."""
+    import seaborn
+
+    return seaborn
+
+
+def _is_viewable(fig: Figure) -> bool:
+    """Whether ``fig`` is drawn on a Tk canvas that is currently mapped."""
+    get_widget = getattr(fig.canvas, "get_tk_widget", None)
+    if get_widget is None:
+        return False
+    # Only Tk canvases get here; the headless report never imports tkinter.
+    from tkinter import TclError
+
+    try:
+        return bool(get_widget().winfo_viewable())
+    except TclError:
+        # The canvas widget was destroyed with its tab.
+        return False
+
+
+def _is_hidden(fig: Figure) -> bool:
+    """Whether ``fig`` was shown on a Tk canvas that is no longer viewable.
+
+    Only such figures may be recycled by the pool: the ones on screen are in
+    use, and the ones without a canvas yet are still being built for one.
+    """
+    return hasattr(fig.canvas, "get_tk_widget") and not _is_viewable(fig)
+
 def _numeric_only(df: pd.DataFrame | None) -> DataFrame | None:
         """Return a DataFrame containing only numeric columns."""
         if df is None or df.empty:
@@ -30,11 +78,20 @@ def _numeric_only(df: pd.DataFrame | None) -> DataFrame | None:
 
 
 class StatisticalPlot:
-    """Render plot for statistical summaries of a DataFrame."""
-    def __init__(self, df: DataFrame | None, theme_manager: Any | None):
+    """Render plot for statistical summaries of a DataFrame.
+
+    Figures come from a :class:`FigurePool` capped at ``max_figures``; call
+    :meth:`release` once a figure is no longer displayed so it can be reused.
+    Past the cap the pool only recycles figures whose canvas is hidden, never
+    one on screen or one not yet shown.
+    A theme change only restyles the figures currently on screen; the others
+    are restyled by :meth:`refresh_theme` when they are shown again.
+    """
+    def __init__(self, df: DataFrame | None, theme_manager: Any | None, max_figures: int = DEFAULT_MAX_LIVE_FIGURES):
         self.theme_manager = theme_manager
         self.df: DataFrame = df if df is not None else pd.DataFrame()
-        self.figures: list[tuple[Figure, Axes]] = []
+        self.pool = FigurePool(max_live=max_figures, can_recycle=_is_hidden)
+        self._stale_theme: set[Figure] = set()
 
         if self.theme_manager is not None:
             self.theme_manager.add_observer(self._on_theme_changed)
@@ -43,26 +100,133 @@ class StatisticalPlot:
     def set_dataframe(self, df: DataFrame | None) -> None:
         """Update the DataFrame used to generate the plots."""
         self.df = df if df is not None else pd.DataFrame()
-        self.figures.clear()
+        self.pool.release_all()
+        self._stale_theme.clear()
+
+    @property
+    def figures(self) -> list[tuple[Figure, Axes]]:
+        """Live figures with their main axes, oldest first."""
+        return [(fig, fig.axes[0]) for fig in self.pool.live() if fig.axes]
+
+    @property
+    def max_figures(self) -> int:
+        return self.pool.max_live
+
+    def release(self, figures: Iterable[Figure]) -> None:
+        """Return figures that are no longer displayed to the pool."""
+        for fig in figures:
+            self._stale_theme.discard(fig)
+            self.pool.release(fig)
+
+    def refresh_theme(self, figures: Iterable[Figure] | None = None) -> None:
+        """Restyle and redraw the figures among ``figures`` still using an old theme.
+
+        With None, only the figures whose Tk canvas is currently viewable are
+        refreshed.
+        """
+        if figures is None:
+            pending = [fig for fig in self._stale_theme if _is_viewable(fig)]
+        else:
+            pending = [fig for fig in figures if fig in self._stale_theme]
+        for fig in pending:
+            self._stale_theme.discard(fig)
+            if fig.axes:
+                self._apply_theme_to_figure(fig, fig.axes[0])
+            fig.canvas.draw_idle()
 
     def total_plot(self, column: str) -> Figure | None:
         """Create a scatter plot counting the occurrences of *column*."""
-        numeric_df = _numeric_only(self.df)
-        if column not in numeric_df.columns:
+        values = self._column_values(column)
+        if values is None:
             return None
+        return self.render_total(column, value_counts_data(values))
 
-        all_values = numeric_df[column].dropna()
-        if all_values.empty:
+    def histogram_plot(self, column: str) -> Figure | None:
+        """Create a histogram plot of *column*."""
+        values = self._column_values(column)
+        if values is None:
             return None
+        return self.render_histogram(column, histogram_data(values))
 
-        value_counts = all_values.value_counts().sort_index()
+    def percentile_plot(self, column: str) -> Figure | None:
+        """Create a percentile plot of *column*."""
+        values = self._column_values(column)
+        if values is None:
+            return None
+        return self.render_percentile(column, percentile_data(values))
 
-        fig, ax = self._create_figure()
-        self._apply_theme_to_figure(fig, ax)
-        self.figures.append((fig, ax))
+    def dispersion_plot(self, x_column: str, y_column: str) -> Figure | None:
+        """Create a dispersion (scatter) plot for two numeric columns."""
+        x_values = self._column_values(x_column)
+        y_values = self._column_values(y_column)
+        if x_values is None or y_values is None:
+            return None
+        return self.render_dispersion(x_column, dispersion_data(x_values, y_values), y_column)
+
+    def distribution_plot(self, column: str) -> Figure | None:
+        """Create a distribution histogram of *column*."""
+        values = self._column_values(column)
+        if values is None:
+            return None
+        return self.render_distribution(column, histogram_data(values, bins=DISTRIBUTION_BINS))
+
+    def standard_deviation_plot(self, column: str, group_col: str) -> Figure | None:
+        """Create a standard deviation plot for two numeric columns."""
+        values = self._column_values(column)
+        groups = self._column_values(group_col)
+        if values is None or groups is None:
+            return None
+        return self.render_standard_deviation(column, std_band_data(values, groups), group_col)
+
+    def covariance_heatmap_plot(self) -> Figure | None:
+        """Create a covariance heatmap plot."""
+        numeric_df = _numeric_only(self.df).drop(columns=list(MATRIX_EXCLUDE), errors="ignore")
+        if numeric_df.empty:
+            return None
+        return self.render_covariance(matrix_data(numeric_df.cov().to_dict()))
+
+    def correlation_heatmap_plot(self, method: str = "pearson") -> Figure | None:
+        """Create a correlation heatmap plot for two numeric columns."""
+        numeric_df = _numeric_only(self.df).drop(columns=list(MATRIX_EXCLUDE), errors="ignore")
+        if numeric_df.empty:
+            return None
+        return self.render_correlation(matrix_data(numeric_df.corr(method=method).to_dict()), method)
+
+    def render(self, kind: str, column: str | None, data: Any) -> Figure | None:
+        """Render prepared figure ``data`` of the given plot ``kind``.
+
+        ``kind`` is one of the keys of ``services.plot_data.PLOT_KINDS``; the
+        ``*_plot`` methods are shortcuts that prepare the data inline.
+        """
+        with span(f"plot.render.{kind}", "plot", column=column):
+            return self._render(kind, column, data)
+
+    def _render(self, kind: str, column: str | None, data: Any) -> Figure | None:
+        match kind:
+            case "total":
+                return self.render_total(column, data)
+            case "histogram":
+                return self.render_histogram(column, data)
+            case "percentile":
+                return self.render_percentile(column, data)
+            case "dispersion":
+                return self.render_dispersion(column, data, GROUP_COLUMN)
+            case "distribution":
+                return self.render_distribution(column, data)
+            case "standard_deviation":
+                return self.render_standard_deviation(column, data, GROUP_COLUMN)
+            case "covariance":
+                return self.render_covariance(data)
+            case "correlation":
+                return self.render_correlation(data)
+        raise ValueError(f"Unknown plot kind: {kind}")
+
+    def render_total(self, column: str, data: PointsData | None) -> Figure | None:
+        if data is None:
+            return None
+        fig, ax = self._new_figure()
 
-        ax.scatter(value_counts.index, value_counts.values, alpha=0.8)
-        ax.scatter(value_counts.index, value_counts.values)
+        ax.scatter(data.x, data.y, alpha=0.8)
 
         ax.set_title(column.upper())
         ax.set_xlabel(_column_label(column))
@@ -72,199 +236,136 @@ class StatisticalPlot:
         fig.tight_layout()
         return fig
 
-    def histogram_plot(self, column: str) -> Figure | None:
-        """Create a histogram plot of *column*."""
-        numeric_df = _numeric_only(self.df)
-        if column not in numeric_df.columns:
-            return None
-
-        all_values = numeric_df[column].dropna()
-        if all_values.empty:
+    def render_histogram(self, column: str, data: HistogramData | None) -> Figure | None:
+        if data is None:
             return None
+        fig, ax = self._new_figure()
 
-        fig, ax = self._create_figure()
-        self._apply_theme_to_figure(fig, ax)
-        self.figures.append((fig, ax))
-
-        ax.hist(all_values.dropna(), alpha=0.5)
+        ax.hist(data.edges[:-1], bins=data.edges, weights=data.counts, alpha=0.5)
         ax.set_title(column.upper())
         ax.set_xlabel(_column_label(column))
         ax.set_ylabel("Values")
         ax.grid(True, linestyle="--")
 
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
-    def percentile_plot(self, column: str) -> Figure | None:
-        """Create a percentile plot of *column*."""
-        numeric_df = _numeric_only(self.df)
-        if column not in numeric_df.columns:
+    def render_percentile(self, column: str, data: PointsData | None) -> Figure | None:
+        if data is None:
             return None
+        fig, ax = self._new_figure()
 
-        all_values = numeric_df[column].dropna()
-        if all_values.empty:
-            return None
-
-        percentiles = np.linspace(0, 100, 101)
-        values = np.percentile(all_values, percentiles)
-
-        fig, ax = plt.subplots()
-        self._apply_theme_to_figure(fig, ax)
-        self.figures.append((fig, ax))
-
-        ax.plot([p * 100 for p in percentiles], values)
+        ax.plot(data.x, data.y)
         ax.set_title(column.upper())
         ax.set_xlabel("Percentile %")
         ax.set_ylabel(column)
         ax.grid(True, linestyle="--")
 
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
-    def dispersion_plot(self, x_column: str, y_column: str) -> Figure | None:
-        """Create a dispersion (scatter) plot for two numeric columns."""
-        numeric_df = _numeric_only(self.df)
-        if numeric_df.empty:
-            return None
-
-        if x_column not in numeric_df.columns or y_column not in numeric_df.columns:
+    def render_dispersion(self, x_column: str, data: PointsData | DensityData | None, y_column: str) -> Figure | None:
+        if data is None:
             return None
+        fig, ax = self._new_figure()
 
-        values = numeric_df[[x_column, y_column]].dropna()
-        if values.empty:
-            return None
-
-        sample_size = 10000
-        if len(values) > sample_size:
-            values = values.sample(sample_size, random_state=42)
-
-        fig, ax = self._create_figure()
-        self._apply_theme_to_figure(fig, ax)
-        self.figures.append((fig, ax))
-
-        ax.scatter(values[x_column], values[y_column], alpha=0.1)
+        if isinstance(data, DensityData):
+            counts = np.ma.masked_equal(data.counts.T, 0)
+            mesh = ax.pcolormesh(data.x_edges, data.y_edges, counts, norm=LogNorm(), cmap="viridis")
+            fig.colorbar(mesh, ax=ax, label="Rows")
+        else:
+            ax.scatter(data.x, data.y, alpha=0.1)
         ax.set_title(f"{x_column.upper()} × {y_column.upper()}")
         ax.set_xlabel(_column_label(x_column))
         ax.set_ylabel(_column_label(y_column))
         ax.grid(True, linestyle="--")
 
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
-    def distribution_plot(self, column: str) -> Figure | None:
-        """Create a dispersion (scatter) plot for two numeric columns."""
-        numeric_df = _numeric_only(self.df)
-        if numeric_df.empty:
+    def render_distribution(self, column: str, data: HistogramData | None) -> Figure | None:
+        if data is None:
             return None
+        fig, ax = self._new_figure()
 
-        if column not in numeric_df.columns:
-            return None
-
-        fig, ax = self._create_figure()
-        self._apply_theme_to_figure(fig, ax)
-        self.figures.append((fig, ax))
-
-        ax.hist(numeric_df[column], bins=30, alpha=0.5)
+        ax.hist(data.edges[:-1], bins=data.edges, weights=data.counts, alpha=0.5)
         ax.set_title(f"{column.upper()}")
         ax.set_xlabel(_column_label(column))
         ax.set_ylabel("Count")
         ax.grid(True, linestyle="--")
 
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
-    def standard_deviation_plot(self, column: str, group_col: str) -> Figure | None:
-        """Create a standard deviation plot for two numeric columns."""
-        numeric_df = _numeric_only(self.df)
-        if numeric_df.empty:
+    def render_standard_deviation(self, column: str, data: BandData | None, group_col: str) -> Figure | None:
+        if data is None:
             return None
+        fig, ax = self._new_figure()
 
-        if column not in numeric_df.columns:
-            return None
-
-        fig, ax = self._create_figure()
-        self._apply_theme_to_figure(fig, ax)
-        self.figures.append((fig, ax))
-
-        grouped = numeric_df.groupby(group_col)[column]
-        means = grouped.mean()
-        stds = grouped.std()
-
-        ax.fill_between(means.index, means - stds, means + stds, alpha=0.4, label='±1σ')
+        ax.fill_between(data.x, data.mean - data.std, data.mean + data.std, alpha=0.4, label='±1σ')
         ax.set_title(f"{column.upper()} — Standard deviation by {group_col}")
-        ax.set_xlabel(_column_label(column))
+        ax.set_xlabel(_column_label(group_col))
         ax.set_ylabel(_column_label(column))
         ax.grid(True, linestyle="--")
 
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
-    def covariance_heatmap_plot(self) -> Figure | None:
-        """Create a covariance heatmap plot."""
-        numeric_df = _numeric_only(self.df).drop(
-            columns=["ID", "Year"], errors="ignore"
-        )
-        if numeric_df.empty:
+    def render_covariance(self, data: MatrixData | None) -> Figure | None:
+        if data is None:
             return None
+        fig, ax = self._new_figure()
 
-        fig, ax = self._create_figure()
-        self._apply_theme_to_figure(fig, ax)
-        self.figures.append((fig, ax))
-
-        cov_matrix = numeric_df.cov()
-
-        sns.heatmap(cov_matrix, annot=True, cmap="coolwarm", center=0, fmt=".2f")
+        cov_matrix = pd.DataFrame(data.values, index=data.labels, columns=data.labels)
+        _seaborn().heatmap(cov_matrix, annot=True, cmap="coolwarm", center=0, fmt=".2f", ax=ax)
 
         ax.set_title("Covariance Heatmap")
         ax.grid(True, linestyle="--")
 
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
-    def correlation_heatmap_plot(self, method: str = "pearson") -> Figure | None:
-        """Create a correlation heatmap plot for two numeric columns."""
-        numeric_df = _numeric_only(self.df).drop(
-            columns=["ID", "Year"], errors="ignore"
-        )
-        if numeric_df.empty:
+    def render_correlation(self, data: MatrixData | None, method: str = "pearson") -> Figure | None:
+        if data is None:
             return None
+        fig, ax = self._new_figure()
 
-        fig, ax = self._create_figure()
-        self._apply_theme_to_figure(fig, ax)
-        self.figures.append((fig, ax))
-
-        corr = numeric_df.corr(method=method)
-
-        fig, ax = plt.subplots()
-        self._apply_theme_to_figure(fig, ax)
-        sns.heatmap(corr, annot=True, cmap="coolwarm", center=0, vmin=-1, vmax=1, ax=ax)
+        corr = pd.DataFrame(data.values, index=data.labels, columns=data.labels)
+        _seaborn().heatmap(corr, annot=True, cmap="coolwarm", center=0, vmin=-1, vmax=1, ax=ax)
         ax.set_title(f"Correlation Matrix ({method.title()})")
         ax.grid(True, linestyle="--")
 
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
-    @staticmethod
-    def _create_figure(figure_size: Iterable[float] | None = None) -> Tuple[Figure, Axes]:
-        if figure_size is not None:
-            fig, ax = plt.subplots(figsize=figure_size)
-        else:
-            fig, ax = plt.subplots()
+    def _column_values(self, column: str) -> pd.Series | None:
+        numeric_df = _numeric_only(self.df)
+        if column not in numeric_df.columns:
+            return None
+        return numeric_df[column]
+
+    def _new_figure(self) -> Tuple[Figure, Axes]:
+        fig, ax = self._create_figure()
+        self._apply_theme_to_figure(fig, ax)
         return fig, ax
 
+    def _create_figure(self, figure_size: Iterable[float] | None = None) -> Tuple[Figure, Axes]:
+        fig = self.pool.acquire(figure_size)
+        return fig, fig.add_subplot()
+
     def _apply_theme_to_matplotlib(self) -> None:
         if self.theme_manager is None:
             return
 
         bg = self.theme_manager.get_color("bg")
         text = self.theme_manager.get_color("text_primary")
-        plt.rcParams["figure.facecolor"] = bg
-        plt.rcParams["axes.facecolor"] = self.theme_manager.get_color("surface")
-        plt.rcParams["axes.edgecolor"] = self.theme_manager.get_color("border")
-        plt.rcParams["axes.labelcolor"] = text
-        plt.rcParams["xtick.color"] = text
-        plt.rcParams["ytick.color"] = text
-        plt.rcParams["text.color"] = text
+        mpl.rcParams["figure.facecolor"] = bg
+        mpl.rcParams["axes.facecolor"] = self.theme_manager.get_color("surface")
+        mpl.rcParams["axes.edgecolor"] = self.theme_manager.get_color("border")
+        mpl.rcParams["axes.labelcolor"] = text
+        mpl.rcParams["xtick.color"] = text
+        mpl.rcParams["ytick.color"] = text
+        mpl.rcParams["text.color"] = text
 
     def _apply_theme_to_figure(self, fig: Figure, ax: Axes) -> None:
         if self.theme_manager is None:
@@ -283,6 +384,5 @@ class StatisticalPlot:
 
     def _on_theme_changed(self, *_):
         self._apply_theme_to_matplotlib()
-        for fig, ax in self.figures:
-            self._apply_theme_to_figure(fig, ax)
-            fig.canvas.draw_idle()
\ No newline at end of file
+        self._stale_theme.update(self.pool.live())
+        self.refresh_theme()
\ No newline at end of file
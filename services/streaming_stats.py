@@ -0,0 +1,344 @@
+"""Mergeable accumulators for Step 2 statistics over data that does not fit in memory.
+
+Every accumulator supports ``update`` with a new block of rows and ``merge``
+with another accumulator of the same columns, so chunks can be processed in
+any order or on different workers and combined afterwards.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from services.io_loader import CHUNK_SIZE, iter_table
+from services.statistical_calc import (
+    StatisticsSummary,
+    comoments_to_matrices,
+    matrix_to_dict,
+    pairwise_sums,
+)
+
+DEFAULT_COMPRESSION = 200
+DEFAULT_MAX_DISTINCT = 100_000
+
+
+class MomentAccumulator:
+    """Per-column count, mean and second central moment (Welford/Chan)."""
+
+    def __init__(self, n_columns: int):
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a ``rows x columns`` float block; NaN marks a missing value."""
+        present = ~np.isnan(values)
+        count = present.sum(axis=0).astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, np.where(present, values, 0.0).sum(axis=0) / count, 0.0)
+        m2 = (np.where(present, values - mean, 0.0) ** 2).sum(axis=0)
+        self._combine(count, mean, m2)
+
+    def merge(self, other: MomentAccumulator) -> None:
+        self._combine(other.count, other.mean, other.m2)
+
+    def _combine(self, count: np.ndarray, mean: np.ndarray, m2: np.ndarray) -> None:
+        total = self.count + count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean - self.mean
+            weight = np.where(total > 0, count / total, 0.0)
+            self.mean = self.mean + delta * weight
+            self.m2 = self.m2 + m2 + delta ** 2 * self.count * weight
+        self.count = total
+
+    @property
+    def total(self) -> np.ndarray:
+        return self.mean * self.count
+
+    @property
+    def variance(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 1, self.m2 / (self.count - 1), np.nan)
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.variance)
+
+
+class CoMomentAccumulator:
+    """Pairwise-complete co-moments for covariance and correlation matrices.
+
+    Entry ``[i, j]`` of each matrix only involves rows where both columns are
+    present, matching ``DataFrame.cov``/``DataFrame.corr``.
+    """
+
+    def __init__(self, n_columns: int):
+        shape = (n_columns, n_columns)
+        self.n = np.zeros(shape)
+        self.mean = np.zeros(shape)      # [i, j]: mean of column i over the pair's rows
+        self.m2 = np.zeros(shape)        # [i, j]: M2 of column i over the pair's rows
+        self.comoment = np.zeros(shape)
+
+    def update(self, values: np.ndarray) -> None:
+        present = ~np.isnan(values)
+        count = present.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            shift = np.where(count > 0, np.where(present, values, 0.0).sum(axis=0) / count, 0.0)
+        centered = np.where(present, values - shift, 0.0)
+        n, sum_x, comoment, own_m2 = pairwise_sums(centered, present.astype(np.float64))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(n > 0, np.reshape(shift, (-1, 1)) + sum_x / n, 0.0)
+        self._combine(n, mean, own_m2, comoment)
+
+    def merge(self, other: CoMomentAccumulator) -> None:
+        self._combine(other.n, other.mean, other.m2, other.comoment)
+
+    def _combine(self, n: np.ndarray, mean: np.ndarray, m2: np.ndarray, comoment: np.ndarray) -> None:
+        total = self.n + n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean - self.mean
+            factor = np.where(total > 0, self.n * n / total, 0.0)
+            self.comoment = self.comoment + comoment + delta * delta.T * factor
+            self.m2 = self.m2 + m2 + delta ** 2 * factor
+            self.mean = self.mean + delta * np.where(total > 0, n / total, 0.0)
+        self.n = total
+
+    def matrices(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(covariance, correlation)``."""
+        return comoments_to_matrices(self.n, self.comoment, self.m2)
+
+
+class QuantileSketch:
+    """Mergeable approximate quantiles with bounded memory (a merging t-digest).
+
+    Values are kept as weighted centroids whose size shrinks towards the tails,
+    so medians and extreme percentiles stay accurate while at most about
+    ``compression`` centroids are stored.
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def update(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._compress(np.concatenate([self.means, values]), np.concatenate([self.weights, np.ones(len(values))]))
+
+    def merge(self, other: QuantileSketch) -> None:
+        if other.count == 0:
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]), np.concatenate([self.weights, other.weights]))
+
+    def quantile(self, q: float | Sequence[float]) -> float | np.ndarray:
+        """Return the approximate value at ``q`` (0..1); NaN when empty."""
+        qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        total = self.count
+        if total == 0:
+            result = np.full(len(qs), np.nan)
+        else:
+            centers = np.cumsum(self.weights) - self.weights / 2
+            result = np.interp(
+                qs * total,
+                np.concatenate([[0.0], centers, [total]]),
+                np.concatenate([[self.min], self.means, [self.max]]),
+            )
+        return float(result[0]) if np.ndim(q) == 0 else result
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        q_mid = (np.cumsum(weights) - weights / 2) / total
+        # k1 scale function: equal steps in k give small centroids near q=0 and q=1.
+        k = np.floor(self.compression * (np.arcsin(2 * q_mid - 1) / np.pi + 0.5))
+        starts = np.flatnonzero(np.concatenate([[True], np.diff(k) != 0]))
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+
+class ValueCounter:
+    """Exact value counts for the mode, dropped once too many distinct values appear."""
+
+    def __init__(self, max_distinct: int = DEFAULT_MAX_DISTINCT):
+        self.max_distinct = max_distinct
+        self.counts: pd.Series | None = pd.Series(dtype=np.float64)
+
+    def update(self, values: np.ndarray) -> None:
+        if self.counts is None:
+            return
+        values = values[~np.isnan(values)]
+        self._add(pd.Series(values).value_counts(sort=False))
+
+    def merge(self, other: ValueCounter) -> None:
+        if other.counts is None:
+            self.counts = None
+        elif self.counts is not None:
+            self._add(other.counts)
+
+    def mode(self) -> dict[int, float] | None:
+        """Return the modes like ``mode_calc``; ``None`` if the counter overflowed."""
+        if self.counts is None:
+            return None
+        if self.counts.empty:
+            return {}
+        modes = np.sort(self.counts.index[self.counts.to_numpy() == self.counts.max()].to_numpy())
+        return dict(enumerate(modes.tolist()))
+
+    def median(self) -> float | None:
+        """Return the exact median; ``None`` if the counter overflowed."""
+        if self.counts is None:
+            return None
+        if self.counts.empty:
+            return float("nan")
+        counts = self.counts.sort_index()
+        cumulative = counts.to_numpy().cumsum()
+        total = cumulative[-1]
+        values = counts.index.to_numpy(dtype=np.float64)
+        lower = values[np.searchsorted(cumulative, (total - 1) // 2, side="right")]
+        upper = values[np.searchsorted(cumulative, total // 2, side="right")]
+        return float((lower + upper) / 2)
+
+    def _add(self, counts: pd.Series) -> None:
+        self.counts = self.counts.add(counts, fill_value=0)
+        if len(self.counts) > self.max_distinct:
+            self.counts = None
+
+
+class StreamingSummary:
+    """Build a :class:`StatisticsSummary` chunk by chunk with bounded memory.
+
+    The numeric columns of the first chunk fix the column set; later chunks are
+    aligned to it. Columns with more than ``max_distinct`` distinct values get
+    an approximate median (see :class:`QuantileSketch`) and ``None`` as mode.
+    """
+
+    def __init__(
+            self,
+            drop: Iterable[str] = ("ID",),
+            compression: int = DEFAULT_COMPRESSION,
+            max_distinct: int = DEFAULT_MAX_DISTINCT,
+    ):
+        self.drop = tuple(drop)
+        self.compression = compression
+        self.max_distinct = max_distinct
+        self.columns: list[str] | None = None
+        self.integer_columns: set[str] = set()
+        self.moments: MomentAccumulator | None = None
+        self.comoments: CoMomentAccumulator | None = None
+        self.sketches: list[QuantileSketch] = []
+        self.counters: list[ValueCounter] = []
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if self.columns is None:
+            numeric = chunk.select_dtypes(include="number").drop(columns=list(self.drop), errors="ignore")
+            self._init_columns(
+                list(numeric.columns),
+                {c for c in numeric.columns if pd.api.types.is_integer_dtype(numeric[c].dtype)},
+            )
+        if not self.columns:
+            return
+
+        block = chunk.reindex(columns=self.columns)
+        for col in self.columns:
+            if not pd.api.types.is_numeric_dtype(block[col].dtype):
+                block[col] = pd.to_numeric(block[col], errors="coerce")
+        values = block.to_numpy(dtype=np.float64, na_value=np.nan)
+        self.moments.update(values)
+        self.comoments.update(values)
+        for j in range(len(self.columns)):
+            self.sketches[j].update(values[:, j])
+            self.counters[j].update(values[:, j])
+
+    def merge(self, other: StreamingSummary) -> None:
+        if other.columns is None:
+            return
+        if self.columns is None:
+            self._init_columns(list(other.columns), set(other.integer_columns))
+        if self.columns != other.columns:
+            raise ValueError("Cannot merge summaries over different columns")
+        self.integer_columns &= other.integer_columns
+        self.moments.merge(other.moments)
+        self.comoments.merge(other.comoments)
+        for mine, theirs in zip(self.sketches, other.sketches):
+            mine.merge(theirs)
+        for mine, theirs in zip(self.counters, other.counters):
+            mine.merge(theirs)
+
+    def result(self) -> StatisticsSummary:
+        if not self.columns:
+            return StatisticsSummary()
+
+        columns = self.columns
+        covariance, correlation = self.comoments.matrices()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(self.moments.count > 0, self.moments.mean, np.nan)
+
+        modes = {}
+        for col, counter in zip(columns, self.counters):
+            mode = counter.mode()
+            if mode is not None and col in self.integer_columns:
+                mode = {k: int(v) for k, v in mode.items()}
+            modes[col] = mode
+
+        return StatisticsSummary(
+            columns=tuple(columns),
+            count=dict(zip(columns, self.moments.count.astype(np.int64).tolist())),
+            total={
+                c: int(round(t)) if c in self.integer_columns else t
+                for c, t in zip(columns, self.moments.total.tolist())
+            },
+            mean=dict(zip(columns, mean.tolist())),
+            median={
+                c: _first_known(counter.median(), sketch.quantile(0.5))
+                for c, counter, sketch in zip(columns, self.counters, self.sketches)
+            },
+            mode=modes,
+            variance=dict(zip(columns, self.moments.variance.tolist())),
+            std=dict(zip(columns, self.moments.std.tolist())),
+            covariance=matrix_to_dict(covariance, columns),
+            correlation=matrix_to_dict(correlation, columns),
+        )
+
+    def quantiles(self, qs: Sequence[float]) -> dict[str, np.ndarray]:
+        """Return approximate quantiles ``qs`` (0..1) for every column."""
+        return {c: sketch.quantile(qs) for c, sketch in zip(self.columns or [], self.sketches)}
+
+    def _init_columns(self, columns: list[str], integer_columns: set[str]) -> None:
+        self.columns = columns
+        self.integer_columns = integer_columns
+        self.moments = MomentAccumulator(len(columns))
+        self.comoments = CoMomentAccumulator(len(columns))
+        self.sketches = [QuantileSketch(self.compression) for _ in columns]
+        self.counters = [ValueCounter(self.max_distinct) for _ in columns]
+
+
+def summarize_chunks(chunks: Iterable[pd.DataFrame], drop: Iterable[str] = ("ID",)) -> StatisticsSummary:
+    """Return the streaming summary of an iterable of DataFrame chunks."""
+    summary = StreamingSummary(drop=drop)
+    for chunk in chunks:
+        summary.update(chunk)
+    return summary.result()
+
+
+def summarize_file(file_path: str, chunksize: int = CHUNK_SIZE, drop: Iterable[str] = ("ID",)) -> StatisticsSummary:
+    """Compute Step 2 statistics for ``file_path`` without loading it whole."""
+    return summarize_chunks((chunk for chunk, _meta in iter_table(file_path, chunksize)), drop=drop)
+
+
+def _first_known(exact: float | None, approximate: float) -> float:
+    return approximate if exact is None else exact
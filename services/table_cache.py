@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+
+import pandas as pd
+
+from services.instrumentation import timed
+
+try:
+    import pyarrow  # noqa: F401  (required by DataFrame.to_feather/read_feather)
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+CACHE_DIR_ENV = "OLYMPICS_CACHE_DIR"
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+_DATA_EXT = ".feather"
+_META_EXT = ".json"
+
+
+def default_cache_dir() -> str:
+    """Return the per-user cache directory for parsed tables."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return override
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "olympics-project-v2", "tables")
+
+
+class TableCache:
+    """Size-bounded LRU cache of parsed tables stored as Feather files.
+
+    Entries are keyed by the source's absolute path, mtime and size, so editing
+    or replacing a file makes its old entry unreachable; stale entries for the
+    same path are removed as soon as they are noticed. ``variant`` names a
+    partial load (e.g. a sheet selection); one variant per file is kept. Without ``pyarrow`` the
+    cache is disabled and every lookup misses.
+    """
+
+    def __init__(self, cache_dir: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return pyarrow is not None
+
+    @timed("table_cache.get", category="io")
+    def get(self, file_path: str, variant: str = "") -> tuple[pd.DataFrame, dict] | None:
+        """Return the cached ``(df, meta)`` for ``file_path`` or ``None``."""
+        if not self.enabled:
+            return None
+        key = self._key(file_path, variant)
+        if key is None:
+            return None
+        self._drop_stale(key)
+
+        data_path = os.path.join(self.cache_dir, key + _DATA_EXT)
+        meta_path = os.path.join(self.cache_dir, key + _META_EXT)
+        try:
+            df = pd.read_feather(data_path)
+            with open(meta_path, encoding="utf-8") as fh:
+                meta = json.load(fh)
+            os.utime(data_path)
+        except (OSError, ValueError):
+            return None
+        return df, meta
+
+    @timed("table_cache.put", category="io")
+    def put(self, file_path: str, df: pd.DataFrame, meta: dict, variant: str = "") -> bool:
+        """Store ``df`` for ``file_path``; returns False if it can't be cached."""
+        if not self.enabled:
+            return False
+        key = self._key(file_path, variant)
+        if key is None:
+            return False
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data_path = os.path.join(self.cache_dir, key + _DATA_EXT)
+        meta_path = os.path.join(self.cache_dir, key + _META_EXT)
+        tmp_path = f"{data_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            frame = df.reset_index(drop=True)
+            frame.columns = [str(c) for c in frame.columns]
+            frame.to_feather(tmp_path)
+            with open(meta_path, "w", encoding="utf-8") as fh:
+                json.dump(meta, fh)
+            os.replace(tmp_path, data_path)
+        except Exception:
+            # Mixed-type object columns and similar are not representable in
+            # Arrow; such tables are simply parsed from the source every time.
+            for path in (tmp_path, meta_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            return False
+
+        self._drop_stale(key)
+        self._evict()
+        return True
+
+    def clear(self) -> None:
+        for name, _size, _mtime in self._entries():
+            self._remove(name)
+
+    def _key(self, file_path: str, variant: str = "") -> str | None:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        path_hash = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:16]
+        stamp_hash = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}{variant}".encode()).hexdigest()[:16]
+        return f"{path_hash}-{stamp_hash}"
+
+    def _entries(self) -> list[tuple[str, int, float]]:
+        """Return ``(key, size, last_used)`` for every cached table."""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith(_DATA_EXT):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, file_name))
+            except OSError:
+                continue
+            entries.append((file_name[:-len(_DATA_EXT)], stat.st_size, stat.st_mtime))
+        return entries
+
+    def _drop_stale(self, key: str) -> None:
+        path_hash = key.split("-", 1)[0]
+        for name, _size, _mtime in self._entries():
+            if name != key and name.startswith(path_hash + "-"):
+                self._remove(name)
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda e: e[2])
+            total = sum(size for _name, size, _mtime in entries)
+            while entries and total > self.max_bytes:
+                name, size, _mtime = entries.pop(0)
+                self._remove(name)
+                total -= size
+
+    def _remove(self, key: str) -> None:
+        for ext in (_DATA_EXT, _META_EXT):
+            try:
+                os.remove(os.path.join(self.cache_dir, key + ext))
+            except OSError:
+                pass
+
+
+_default_cache: TableCache | None = None
+
+
+def get_default_cache() -> TableCache:
+    """Return the process-wide cache rooted at :func:`default_cache_dir`."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TableCache()
+    return _default_cache
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import pandas as pd
+
+_CLAUSE = re.compile(r"^\s*(?P<col>.+?)\s*(?P<op>==|!=|>=|<=|=|>|<)\s*(?P<val>.+?)\s*$")
+# Quoted text is matched first so separators inside values are not split on.
+_SEPARATOR = re.compile(
+    r"""(?P<quoted>"[^"]*"|'[^']*'|`[^`]*`)|(?P<sep>\s+and\s+|\s*&\s*|\s*,\s*)""",
+    flags=re.IGNORECASE,
+)
+
+
+class TableIndex:
+    """Lazily built lookup structures for sorting and filtering ``df``.
+
+    Per column it keeps the ascending/descending argsort permutation (missing
+    values last in both directions) and an inverted index from category code
+    to row positions, so re-sorting and equality filters cost a lookup instead
+    of a scan. All results are arrays of row positions into ``df``.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._columns = {str(c): i for i, c in enumerate(df.columns)}
+        self._sort_keys: dict[str, np.ndarray] = {}
+        self._orders: dict[tuple[str, bool], np.ndarray] = {}
+        self._ranks: dict[tuple[str, bool], np.ndarray] = {}
+        self._groups: dict[str, tuple[pd.Index, np.ndarray, np.ndarray]] = {}
+
+    def sort_order(self, column: str, ascending: bool = True) -> np.ndarray:
+        """Return the row positions of ``df`` sorted by ``column``."""
+        key = (column, ascending)
+        if key not in self._orders:
+            sort_key = self._sort_key(column)
+            self._orders[key] = np.argsort(sort_key if ascending else -sort_key, kind="stable")
+        return self._orders[key]
+
+    def view(self, rows: np.ndarray | None = None, sort_by: str | None = None, ascending: bool = True) -> np.ndarray:
+        """Return ``rows`` (all rows when None) ordered by ``sort_by``."""
+        if sort_by is None:
+            return np.arange(len(self.df)) if rows is None else rows
+        order = self.sort_order(sort_by, ascending)
+        if rows is None:
+            return order
+        return rows[np.argsort(self._rank(sort_by, ascending)[rows], kind="stable")]
+
+    def equal_rows(self, column: str, value) -> np.ndarray:
+        """Return the ascending row positions where ``column == value``."""
+        uniques, order, bounds = self._group_index(column)
+        code = uniques.get_indexer([self._coerce(column, value)])[0]
+        if code < 0:
+            return np.empty(0, dtype=np.int64)
+        return order[bounds[code]:bounds[code + 1]]
+
+    def range_rows(self, column: str, op: str, value) -> np.ndarray:
+        """Return the ascending row positions where ``column <op> value``."""
+        if not pd.api.types.is_numeric_dtype(self._series(column).dtype):
+            raise ValueError(f"Column '{column}' is not numeric; use == or != to filter it")
+        order = self.sort_order(column)
+        sorted_values = self._sort_key(column)[order]
+        value = float(self._coerce(column, value))
+        valid = int(np.count_nonzero(~np.isnan(sorted_values)))
+        match op:
+            case ">":
+                lo, hi = np.searchsorted(sorted_values[:valid], value, side="right"), valid
+            case ">=":
+                lo, hi = np.searchsorted(sorted_values[:valid], value, side="left"), valid
+            case "<":
+                lo, hi = 0, np.searchsorted(sorted_values[:valid], value, side="left")
+            case "<=":
+                lo, hi = 0, np.searchsorted(sorted_values[:valid], value, side="right")
+            case _:
+                raise ValueError(f"Unsupported operator: {op}")
+        return np.sort(order[lo:hi])
+
+    def filter(self, expression: str) -> np.ndarray:
+        """Return the ascending row positions matching ``expression``.
+
+        ``expression`` is one or more ``column op value`` clauses joined by
+        ``and``, ``&`` or ``,``; ``op`` is one of ``== = != > >= < <=`` and
+        string values may be quoted, e.g. ``NOC == "BRA" and Year >= 2000``.
+        """
+        rows: np.ndarray | None = None
+        for clause in _split_clauses(expression.strip()):
+            if not clause:
+                continue
+            match = _CLAUSE.match(clause)
+            if match is None:
+                raise ValueError(f"Could not parse filter: {clause!r}")
+            column, op, value = match["col"].strip("`'\""), match["op"], _unquote(match["val"])
+            if column not in self._columns:
+                raise ValueError(f"Unknown column: {column}")
+
+            if op in ("==", "="):
+                matched = self.equal_rows(column, value)
+            elif op == "!=":
+                matched = np.setdiff1d(np.arange(len(self.df)), self.equal_rows(column, value), assume_unique=True)
+            else:
+                matched = self.range_rows(column, op, value)
+            rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+        return np.arange(len(self.df)) if rows is None else rows
+
+    def _series(self, column: str) -> pd.Series:
+        return self.df.iloc[:, self._columns[column]]
+
+    def _sort_key(self, column: str) -> np.ndarray:
+        """Float key per row whose order matches the column's; NaN for missing values."""
+        if column not in self._sort_keys:
+            series = self._series(column)
+            if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                key = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                codes, _uniques = pd.factorize(series, sort=True)
+                key = codes.astype(np.float64)
+                key[codes < 0] = np.nan
+            self._sort_keys[column] = key
+        return self._sort_keys[column]
+
+    def _rank(self, column: str, ascending: bool) -> np.ndarray:
+        key = (column, ascending)
+        if key not in self._ranks:
+            order = self.sort_order(column, ascending)
+            rank = np.empty(len(order), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            self._ranks[key] = rank
+        return self._ranks[key]
+
+    def _group_index(self, column: str) -> tuple[pd.Index, np.ndarray, np.ndarray]:
+        """Return ``(uniques, order, bounds)``: rows of code ``k`` are ``order[bounds[k]:bounds[k+1]]``."""
+        if column not in self._groups:
+            series = self._series(column)
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy()
+                uniques = pd.Index(series.cat.categories)
+            else:
+                codes, uniques = pd.factorize(series)
+                uniques = pd.Index(uniques)
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1), side="left")
+            self._groups[column] = (uniques, order, bounds)
+        return self._groups[column]
+
+    def _coerce(self, column: str, value: str):
+        """Convert filter text to the type stored in ``column``.
+
+        Numbers are cast to the column's own dtype, so ``70.3`` finds the
+        rounded value a ``float32`` column holds.
+        """
+        dtype = self._series(column).dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtype = dtype.categories.dtype
+        if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+            return value
+        number = float(value)
+        dtype = np.dtype(getattr(dtype, "numpy_dtype", dtype))
+        if dtype.kind in "iu" and not (number.is_integer() and np.iinfo(dtype).min <= number <= np.iinfo(dtype).max):
+            return number
+        return dtype.type(number)
+
+
+def _split_clauses(expression: str) -> list[str]:
+    """Split ``expression`` on ``and``, ``&`` and ``,`` outside quoted values."""
+    clauses, start = [], 0
+    for match in _SEPARATOR.finditer(expression):
+        if match["sep"] is not None:
+            clauses.append(expression[start:match.start()])
+            start = match.end()
+    clauses.append(expression[start:])
+    return clauses
+
+
+def _unquote(text: str) -> str:
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "'\"":
+        return text[1:-1]
+    return text
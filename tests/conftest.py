@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import table_cache
+
+
+@pytest.fixture(scope="session")
+def athletes() -> pd.DataFrame:
+    """Synthetic athlete events: the columns of the real data, with missing values and team medals."""
+    rng = np.random.default_rng(2016)
+    n = 4000
+    ids = np.sort(rng.integers(1, 900, n))
+    year = rng.choice([1992, 1996, 2000, 2004, 2008, 2012, 2016], n)
+    season = rng.choice(["Summer", "Winter"], n, p=[0.8, 0.2])
+
+    def with_missing(values, share):
+        values = values.astype(np.float64)
+        values[rng.random(n) < share] = np.nan
+        return values
+
+    return pd.DataFrame({
+        "ID": ids,
+        "Name": [f"Athlete {i:03d}" for i in ids],
+        "Sex": rng.choice(["M", "F"], n),
+        "Age": with_missing(rng.integers(15, 45, n), 0.05),
+        "Height": with_missing(np.round(rng.normal(175, 10, n)), 0.2),
+        "Weight": with_missing(np.round(rng.normal(70, 12, n), 1), 0.2),
+        "Team": rng.choice(["Brazil", "United States", "Trinidad and Tobago", "Kenya"], n),
+        "NOC": rng.choice(["BRA", "USA", "TTO", "KEN", "SGP"], n),
+        "Games": [f"{y} {s}" for y, s in zip(year, season)],
+        "Year": year,
+        "Season": season,
+        "City": rng.choice(["Atlanta", "Sydney", "Athina"], n),
+        "Sport": rng.choice(["Athletics", "Swimming", "Judo"], n),
+        "Event": rng.choice([f"Event {i}" for i in range(30)], n),
+        "Medal": rng.choice(["Gold", "Silver", "Bronze", None], n, p=[0.05, 0.05, 0.05, 0.85]),
+    })
+
+
+@pytest.fixture(autouse=True)
+def private_table_cache(tmp_path, monkeypatch):
+    """Keep ``load_table`` from reading or filling the user's table cache."""
+    cache = table_cache.TableCache(str(tmp_path / "table-cache"))
+    monkeypatch.setattr(table_cache, "_default_cache", cache)
+    return cache
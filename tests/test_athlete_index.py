@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.athlete_index import CAREER_COLUMNS, AthleteIndex
+
+
+def _reference(df: pd.DataFrame) -> pd.DataFrame:
+    groups = df.groupby("ID", sort=True)
+    first = df.drop_duplicates("ID").set_index("ID").sort_index()
+    careers = pd.DataFrame({"ID": first.index.astype(np.int64)})
+    careers["Name"] = first["Name"].to_numpy()
+    careers["NOC"] = first["NOC"].to_numpy()
+    careers["First Year"] = groups["Year"].min().to_numpy()
+    careers["Last Year"] = groups["Year"].max().to_numpy()
+    careers["Games"] = groups["Games"].nunique().to_numpy()
+    for medal in ("Gold", "Silver", "Bronze"):
+        careers[medal] = df["Medal"].eq(medal).groupby(df["ID"]).sum().to_numpy()
+    careers["Medals"] = careers[["Gold", "Silver", "Bronze"]].sum(axis=1)
+    debut = df[df["Year"] == df.groupby("ID")["Year"].transform("min")]
+    careers["Debut Age"] = pd.array(debut.groupby("ID")["Age"].min().to_numpy(), dtype="Float64").astype("Int64")
+    return careers[list(CAREER_COLUMNS)]
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_careers_match_groupby(athletes, shuffle):
+    df = athletes.sample(frac=1, random_state=4).reset_index(drop=True) if shuffle else athletes
+    careers = AthleteIndex(df).careers()
+    pd.testing.assert_frame_equal(careers, _reference(df), check_dtype=False)
+
+
+def test_rows_match_boolean_mask(athletes):
+    df = athletes.sample(frac=1, random_state=9).reset_index(drop=True)
+    index = AthleteIndex(df)
+    for athlete_id in df["ID"].drop_duplicates().head(20):
+        assert list(index.rows(athlete_id)) == list(np.flatnonzero(df["ID"].to_numpy() == athlete_id))
+    assert len(index.rows(-1)) == 0
+    assert len(index) == df["ID"].nunique()
+
+
+def test_lookup_by_id_and_name_prefix(athletes):
+    index = AthleteIndex(athletes)
+    athlete_id = int(athletes["ID"].iloc[100])
+    assert list(index.lookup(str(athlete_id))["ID"]) == [athlete_id]
+    assert index.lookup("999999").empty
+
+    matches = index.lookup("athlete 01")
+    expected = sorted(i for i in athletes["ID"].unique() if f"Athlete {i:03d}".startswith("Athlete 01"))
+    assert list(matches["ID"]) == expected
+    assert index.lookup("  ").empty
+
+
+def test_requires_id_column(athletes):
+    with pytest.raises(ValueError):
+        AthleteIndex(athletes.drop(columns=["ID"]))
@@ -0,0 +1,40 @@
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+from services.batch_report import report_names, write_summary_json
+from services.statistical_calc import compute_summary
+
+
+def test_report_names_keep_unique_stems():
+    assert report_names(["a/small.csv", "b/large.xlsx"]) == ["small", "large"]
+
+
+def test_report_names_prefix_clashing_stems_with_parent():
+    assert report_names(["d1/small.csv", "d2/small.csv", "other.csv"]) == ["d1_small", "d2_small", "other"]
+    assert report_names(["data/small.csv", "data/small.xlsx"]) == ["data_small", "data_small_2"]
+
+
+def test_report_names_same_file_twice():
+    names = report_names(["small.csv", "small.csv"])
+    assert len(set(names)) == 2
+
+
+def test_summary_json_is_strict_json(tmp_path):
+    # One row: variance, std and correlation are NaN.
+    df = pd.DataFrame({"Age": [24.0], "Height": [np.inf]})
+    path = tmp_path / "summary.json"
+    write_summary_json(compute_summary(df), {"name": "one.csv", "rows": 1, "cols": 2}, str(path))
+
+    def reject(token):
+        raise ValueError(f"non-standard JSON token {token}")
+
+    payload = json.loads(path.read_text(encoding="utf-8"), parse_constant=reject)
+    statistics = payload["statistics"]
+    assert statistics["mean"]["Age"] == 24.0
+    assert statistics["variance"]["Age"] is None
+    assert statistics["total"]["Height"] is None
+    assert payload["file"] == {"name": "one.csv", "rows": 1, "cols": 2}
+    assert all(v is None or math.isfinite(v) for v in statistics["std"].values())
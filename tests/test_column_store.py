@@ -0,0 +1,139 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services import column_store
+from services.column_store import MANIFEST_NAME, import_file, is_store, main, open_store, store_size, write_store
+from services.dtype_profile import optimize_dtypes
+from services.io_loader import load_table
+
+
+@pytest.fixture
+def frame(athletes):
+    df = athletes.copy()
+    df["Rank"] = pd.array([1, None, 3] * (len(df) // 3) + [1] * (len(df) % 3), dtype="Int64")
+    df["Host"] = df["City"].eq("Sydney")
+    df["Date"] = pd.Timestamp("2000-09-15") + pd.to_timedelta(np.arange(len(df)) % 17, unit="D")
+    return df
+
+
+def _assert_round_trip(original: pd.DataFrame, opened: pd.DataFrame):
+    assert list(opened.columns) == list(original.columns)
+    for column in original.columns:
+        expected, actual = original[column], opened[column]
+        if isinstance(expected.dtype, pd.CategoricalDtype) or expected.dtype == object or pd.api.types.is_string_dtype(expected.dtype):
+            # Text comes back dictionary encoded, as a categorical of the same values.
+            assert actual.astype(object).where(actual.notna(), None).tolist() == \
+                expected.astype(object).where(expected.notna(), None).tolist(), column
+        else:
+            # Compare values, not the mapped array class.
+            copied = pd.Series(pd.array(actual.array, copy=True), name=actual.name)
+            pd.testing.assert_series_equal(copied, expected, check_names=False, check_index=False, obj=column)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_round_trip(tmp_path, frame, compact):
+    df = optimize_dtypes(frame)[0] if compact else frame
+    path = str(tmp_path / "athletes.olyproj")
+    manifest = write_store(df, path, {"name": "athletes.csv", "encoding": "utf-8", "skipped": object()})
+    assert is_store(path)
+    assert manifest["rows"] == len(df)
+    assert "skipped" not in manifest["meta"]
+
+    opened, meta = open_store(path)
+    _assert_round_trip(df, opened)
+    assert meta["rows"] == len(df) and meta["store"] and meta["encoding"] == "utf-8"
+
+
+def test_columns_are_memory_mapped(tmp_path, frame):
+    path = str(tmp_path / "athletes.olyproj")
+    write_store(frame, path)
+    opened, _meta = open_store(path)
+    for column in ("Year", "Height"):
+        base = opened[column].to_numpy()
+        while base.base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        assert isinstance(base, np.memmap), column
+    assert isinstance(opened["NOC"].dtype, pd.CategoricalDtype)
+
+
+def test_replaces_store_but_not_other_paths(tmp_path, frame):
+    path = str(tmp_path / "athletes.olyproj")
+    write_store(frame, path)
+    write_store(frame.head(5), path)
+    assert len(open_store(path)[0]) == 5
+
+    other = tmp_path / "notes"
+    other.mkdir()
+    with pytest.raises(ValueError, match="Not a project store"):
+        write_store(frame, str(other))
+
+
+def test_replacing_keeps_the_mapped_version_until_it_can_be_deleted(tmp_path, frame, monkeypatch):
+    path = tmp_path / "athletes.olyproj"
+    write_store(frame, str(path))
+    old, _meta = open_store(str(path))
+    old_files = {p.name for p in path.iterdir()}
+
+    # As on Windows, where mapped files cannot be deleted.
+    monkeypatch.setattr(column_store.shutil, "rmtree", lambda *args, **kwargs: None)
+    write_store(frame.head(5), str(path))
+    assert old_files < {p.name for p in path.iterdir()}
+    assert len(open_store(str(path))[0]) == 5
+    _assert_round_trip(frame, old)
+
+    # The next write removes what could not be deleted before.
+    monkeypatch.undo()
+    manifest = write_store(frame.head(3), str(path))
+    assert {p.name for p in path.iterdir()} == {MANIFEST_NAME, manifest["data"]}
+    assert store_size(str(path)) == sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def test_opens_and_replaces_version_1_stores(tmp_path, frame):
+    path = tmp_path / "athletes.olyproj"
+    manifest = write_store(frame, str(path))
+    # Version 1 layout: the column files next to the manifest.
+    for f in (path / manifest["data"]).iterdir():
+        f.rename(path / f.name)
+    (path / manifest["data"]).rmdir()
+    manifest = {**manifest, "version": 1}
+    del manifest["data"]
+    (path / MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+
+    _assert_round_trip(frame, open_store(str(path))[0])
+    manifest = write_store(frame.head(5), str(path))
+    assert {p.name for p in path.iterdir()} == {MANIFEST_NAME, manifest["data"]}
+    assert len(open_store(str(path))[0]) == 5
+
+
+def test_empty_frame(tmp_path):
+    path = str(tmp_path / "empty.olyproj")
+    write_store(pd.DataFrame({"Name": pd.Series([], dtype=object), "Year": pd.Series([], dtype=np.int64)}), path)
+    opened, meta = open_store(path)
+    assert list(opened.columns) == ["Name", "Year"] and len(opened) == 0 and meta["rows"] == 0
+
+
+def test_import_file_and_load_table(tmp_path, athletes):
+    source = tmp_path / "athlete_events.csv"
+    athletes.to_csv(source, index=False)
+    store = import_file(str(source))
+    assert store.endswith(".olyproj")
+
+    # No dtype profile by default: the store holds the parsed float64 values.
+    loaded, meta = load_table(store)
+    parsed = pd.read_csv(source)
+    _assert_round_trip(parsed, loaded)
+    assert loaded["Weight"].dtype == np.float64
+    assert meta["source"] == str(source)
+    assert "dtype_profile" not in meta
+
+
+def test_command_line_compact_is_opt_in(tmp_path, athletes):
+    source = tmp_path / "athlete_events.csv"
+    athletes.to_csv(source, index=False)
+    assert main([str(source), "-o", str(tmp_path / "raw.olyproj")]) == 0
+    assert main([str(source), "-o", str(tmp_path / "compact.olyproj"), "--compact"]) == 0
+    assert open_store(str(tmp_path / "raw.olyproj"))[0]["Weight"].dtype == np.float64
+    assert open_store(str(tmp_path / "compact.olyproj"))[0]["Weight"].dtype == np.float32
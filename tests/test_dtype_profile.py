@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.dtype_profile import memory_usage, optimize_dtypes
+
+
+def test_optimized_frame_keeps_values(athletes):
+    compact, report = optimize_dtypes(athletes)
+    assert report["memory_after"] < report["memory_before"] == memory_usage(athletes)
+    assert isinstance(compact["NOC"].dtype, pd.CategoricalDtype)
+    assert compact["Year"].dtype == np.int16
+    assert compact["Weight"].dtype == np.float32
+    for column in athletes.columns:
+        expected = athletes[column]
+        if expected.dtype == np.float64:
+            # float32 rounding is the documented price of the compact profile.
+            np.testing.assert_allclose(compact[column].to_numpy(np.float64), expected, rtol=1e-6)
+        else:
+            assert compact[column].astype(object).tolist() == expected.astype(object).tolist()
+
+
+def test_unique_strings_stay_strings(athletes):
+    compact, _ = optimize_dtypes(athletes.drop_duplicates("ID").assign(Team=lambda d: d["Name"]))
+    assert not isinstance(compact["Team"].dtype, pd.CategoricalDtype)
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        optimize_dtypes(pd.DataFrame(), "nope")
@@ -0,0 +1,82 @@
+import multiprocessing
+import time
+
+import pandas as pd
+import pytest
+
+from services import excel_loader
+from services.excel_loader import iter_sheets, list_sheets, read_sheet, read_workbook, sheet_columns
+
+
+@pytest.fixture(scope="module")
+def workbook(tmp_path_factory):
+    path = tmp_path_factory.mktemp("excel") / "games.xlsx"
+    frames = {
+        "1896": pd.DataFrame({"Name": ["Ana", "Bruno"], "NOC": ["GRE", "USA"], "Age": [24, None]}),
+        "1900": pd.DataFrame({"Name": ["Carla"], "NOC": ["FRA"], "Age": [31]}),
+        "1904": pd.DataFrame({"Name": ["Davi", "Eva", "Fabio"], "NOC": ["USA", "USA", "CAN"], "Age": [19, 22, 27]}),
+    }
+    with pd.ExcelWriter(path) as writer:
+        for sheet, frame in frames.items():
+            frame.to_excel(writer, sheet_name=sheet, index=False)
+    return str(path)
+
+
+def test_list_sheets(workbook):
+    assert list_sheets(workbook) == pd.ExcelFile(workbook).sheet_names
+
+
+@pytest.mark.parametrize("sheet", ["1896", "1904", 1])
+def test_read_sheet_matches_pandas(workbook, sheet):
+    expected = pd.read_excel(workbook, sheet_name=sheet)
+    pd.testing.assert_frame_equal(read_sheet(workbook, sheet), expected, check_dtype=False)
+
+
+def test_read_sheet_columns_and_nrows(workbook):
+    expected = pd.read_excel(workbook, sheet_name="1904", usecols=["NOC", "Name"], nrows=2)[["NOC", "Name"]]
+    pd.testing.assert_frame_equal(read_sheet(workbook, "1904", ["NOC", "Name"], nrows=2), expected)
+    assert sheet_columns(workbook, "1900") == ["Name", "NOC", "Age"]
+
+
+def test_read_sheet_unknown_column(workbook):
+    with pytest.raises(ValueError, match="Columns not found"):
+        read_sheet(workbook, "1900", ["Team"])
+
+
+def test_read_workbook_stacks_sheets(workbook):
+    sheets = ["1896", "1904"]
+    expected = pd.concat(
+        [pd.read_excel(workbook, sheet_name=s).assign(Sheet=s) for s in sheets], ignore_index=True
+    )[["Sheet", "Name", "NOC", "Age"]]
+    pd.testing.assert_frame_equal(read_workbook(workbook, sheets, jobs=1), expected, check_dtype=False)
+    pd.testing.assert_frame_equal(read_workbook(workbook), pd.read_excel(workbook), check_dtype=False)
+
+
+def test_parallel_sheets_in_order(workbook, monkeypatch):
+    monkeypatch.setattr(excel_loader, "PARALLEL_MIN_BYTES", 0)
+    sheets = ["1904", "1896", "1900"]
+    assert [sheet for sheet, _df in iter_sheets(workbook, sheets, jobs=2)] == sheets
+    assert not multiprocessing.active_children()
+
+
+def test_closing_parallel_read_stops_workers(workbook, monkeypatch):
+    monkeypatch.setattr(excel_loader, "PARALLEL_MIN_BYTES", 0)
+    sheets = iter_sheets(workbook, ["1896", "1900", "1904"], jobs=2)
+    assert next(sheets)[0] == "1896"
+    start = time.perf_counter()
+    sheets.close()
+    assert time.perf_counter() - start < 1.0
+    deadline = time.perf_counter() + 5
+    while multiprocessing.active_children() and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    assert not multiprocessing.active_children()
+
+
+def test_iter_table_never_changes_a_yielded_meta(workbook):
+    from services.io_loader import iter_table
+
+    sheets = ["1896", "1900", "1904"]
+    yielded = [(meta, dict(meta)) for _chunk, meta in iter_table(workbook, 2, sheets=sheets)]
+    assert all(meta == copy for meta, copy in yielded)
+    assert [meta["rows"] for meta, _copy in yielded] == [2, 3, 5, 6]
+    assert yielded[-1][0]["bytes_read"] == yielded[-1][0]["size"]
@@ -0,0 +1,76 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+from services.figure_pool import FigurePool  # noqa: E402
+
+
+def test_release_reuses_figures():
+    pool = FigurePool(max_live=4, max_idle=2)
+    first = pool.acquire((3, 2))
+    pool.release(first)
+    second = pool.acquire((5, 4))
+    assert second is first
+    assert tuple(second.get_size_inches()) == (5, 4)
+    assert pool.stats() == {"live": 1, "idle": 0, "created": 1, "reused": 1}
+
+
+def test_cap_recycles_oldest_without_predicate():
+    pool = FigurePool(max_live=2, max_idle=0)
+    a, b = pool.acquire(), pool.acquire()
+    c = pool.acquire()
+    assert pool.live() == [b, c]
+    assert a not in pool.live()
+
+
+def test_cap_never_recycles_figures_in_use():
+    visible: set[int] = set()
+    pool = FigurePool(max_live=2, can_recycle=lambda fig: id(fig) not in visible)
+    shown = [pool.acquire() for _ in range(2)]
+    visible.update(id(fig) for fig in shown)
+    for fig in shown:
+        fig.add_subplot().plot([1, 2, 3])
+
+    # Only visible figures are live: the pool grows past the cap instead.
+    extra = pool.acquire()
+    assert pool.live() == [*shown, extra]
+    assert all(fig.axes for fig in shown)
+
+    # Once hidden, they are recycled to get back under the cap.
+    visible.clear()
+    latest = pool.acquire()
+    assert pool.live() == [extra, latest]
+    assert not any(fig.axes for fig in shown)
+
+
+def test_reused_figure_is_not_taken_for_a_hidden_one():
+    from tkinter import TclError
+
+    from matplotlib.backend_bases import FigureCanvasBase
+
+    from services.statistical_plot import _is_hidden
+
+    class DestroyedTkCanvas(FigureCanvasBase):
+        def get_tk_widget(self):
+            raise TclError('invalid command name ".!canvas"')
+
+    pool = FigurePool(max_live=2, can_recycle=_is_hidden)
+    shown = pool.acquire()
+    DestroyedTkCanvas(shown)
+    pool.release(shown)
+
+    # Three figures built before any is embedded, as StatisticsStep does.
+    building = [pool.acquire() for _ in range(3)]
+    for i, fig in enumerate(building):
+        fig.add_subplot().set_title(str(i))
+    assert building[0] is shown
+    assert len({id(fig) for fig in building}) == 3
+    assert [fig.axes[0].get_title() for fig in building] == ["0", "1", "2"]
+
+
+def test_statistical_plot_does_not_import_tkinter():
+    import subprocess
+    import sys
+
+    code = "import sys, services.batch_report, services.statistical_plot; sys.exit('tkinter' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -0,0 +1,93 @@
+import codecs
+
+import pandas as pd
+import pytest
+
+from services.io_loader import ENCODING_SAMPLE_BYTES, detect_encoding, iter_table, load_table
+
+NAMES = ["José", "Zoë", "Müller"]
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "Name": [f"Athlete {i}" for i in range(6000)] + NAMES,
+        "NOC": ["BRA"] * 6000 + ["ESP", "NED", "GER"],
+        "Year": list(range(6000)) + [2000, 2004, 2008],
+    })
+
+
+def _write(path, frame, encoding, bom=b""):
+    path.write_bytes(bom + frame.to_csv(index=False).encode(encoding))
+    return str(path)
+
+
+def _concat(path, chunksize=1000):
+    chunks = [chunk for chunk, _meta in iter_table(path, chunksize)]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def test_latin1_past_the_sample_is_decoded(tmp_path, frame):
+    path = _write(tmp_path / "latin1.csv", frame, "latin-1")
+    assert (tmp_path / "latin1.csv").stat().st_size > ENCODING_SAMPLE_BYTES
+    assert detect_encoding(path) == "utf-8"
+
+    df, _meta = load_table(path, use_cache=False)
+    assert list(df["Name"].tail(3)) == NAMES
+    pd.testing.assert_frame_equal(df, pd.read_csv(path, encoding="latin-1"))
+
+
+def test_iter_table_latin1_past_the_sample_keeps_every_row(tmp_path, frame):
+    path = _write(tmp_path / "latin1.csv", frame, "latin-1")
+    metas = [meta for _chunk, meta in iter_table(path, 1000)]
+    assert metas[-1]["rows"] == len(frame)
+    pd.testing.assert_frame_equal(_concat(path), pd.read_csv(path, encoding="latin-1"))
+
+
+def test_valid_utf8_around_a_bad_byte_is_kept(tmp_path, frame):
+    # One latin-1 row in an otherwise UTF-8 file, past the sample.
+    path = tmp_path / "mixed.csv"
+    path.write_bytes(
+        frame.to_csv(index=False).encode("utf-8")
+        + "Jos\xe9,BRA,2012\n".encode("latin-1")
+        + "Zoë,NED,2016\n".encode("utf-8")
+    )
+    expected = pd.concat([frame, pd.DataFrame({"Name": ["José", "Zoë"], "NOC": ["BRA", "NED"], "Year": [2012, 2016]})],
+                         ignore_index=True)
+
+    df, meta = load_table(str(path), use_cache=False)
+    assert meta["encoding"] == "utf-8"
+    pd.testing.assert_frame_equal(df, expected)
+    pd.testing.assert_frame_equal(_concat(str(path)), expected)
+
+
+@pytest.mark.parametrize("encoding, bom, expected", [
+    ("utf-8", b"", "utf-8"),
+    ("utf-8", codecs.BOM_UTF8, "utf-8-sig"),
+    ("latin-1", b"", "latin-1"),
+])
+def test_load_and_iter_match_pandas(tmp_path, encoding, bom, expected):
+    frame = pd.DataFrame({"Name": NAMES, "Year": [2000, 2004, 2008]})
+    path = _write(tmp_path / "small.csv", frame, encoding, bom)
+    assert detect_encoding(path) == expected
+
+    df, meta = load_table(path, use_cache=False)
+    assert meta["encoding"] == expected
+    pd.testing.assert_frame_equal(df, frame)
+    pd.testing.assert_frame_equal(_concat(path, chunksize=2), frame)
+
+
+def test_header_only_file(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("Name,Year\n", encoding="utf-8")
+    chunks = list(iter_table(str(path)))
+    assert len(chunks) == 1
+    assert list(chunks[0][0].columns) == ["Name", "Year"]
+    assert chunks[0][1]["rows"] == 0
+
+
+def test_sample_rows(tmp_path, frame):
+    path = _write(tmp_path / "latin1.csv", frame, "latin-1")
+    df, meta = load_table(path, sample_rows=10, use_cache=False)
+    pd.testing.assert_frame_equal(df, frame.head(10))
+    assert meta["rows"] == 10
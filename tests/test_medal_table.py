@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.background_loader import BackgroundLoader
+from services.medal_table import MEDALS, MedalTable, medal_table_for
+from services.result_cache import ResultCache
+from services.table_cache import TableCache
+
+
+@pytest.fixture(scope="module")
+def events():
+    rng = np.random.default_rng(7)
+    n = 5000
+    games = rng.choice(["1996 Summer", "2000 Summer", "2002 Winter", "2004 Summer"], n)
+    return pd.DataFrame({
+        "ID": np.arange(n),
+        "Games": games,
+        "Year": [int(g[:4]) for g in games],
+        "Event": rng.choice([f"Event {i}" for i in range(40)], n),
+        "NOC": rng.choice(["BRA", "USA", "CHN", "GER", "KEN", "JAM"], n),
+        # Repeated (Games, Event, NOC, Medal) rows stand for team members.
+        "Medal": rng.choice(["Gold", "Silver", "Bronze", None], n, p=[0.1, 0.1, 0.1, 0.7]),
+    })
+
+
+def _reference(df: pd.DataFrame, games: str | None = None) -> pd.DataFrame:
+    """Medal table the plain pandas way: drop team duplicates, then count."""
+    medals = df.dropna(subset=["Medal"]).drop_duplicates(["Games", "Event", "NOC", "Medal"])
+    if games is not None:
+        medals = medals[medals["Games"] == games]
+    counts = medals.groupby(["NOC", "Medal"]).size().unstack(fill_value=0)
+    counts = counts.reindex(columns=list(MEDALS), fill_value=0).reset_index()
+    counts["Total"] = counts[list(MEDALS)].sum(axis=1)
+    counts = counts.sort_values(["Gold", "Silver", "Bronze", "NOC"], ascending=[False, False, False, True])
+    counts.insert(0, "Rank", np.arange(1, len(counts) + 1))
+    counts.columns.name = None
+    return counts.reset_index(drop=True)
+
+
+def _assert_table_equal(table: pd.DataFrame, expected: pd.DataFrame):
+    pd.testing.assert_frame_equal(table, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("games", [None, "1996 Summer", "2002 Winter"])
+def test_table_matches_pandas(events, games):
+    table = MedalTable()
+    table.append(events)
+    _assert_table_equal(table.table(games), _reference(events, games))
+
+
+@pytest.mark.parametrize("chunksize", [97, 333, 2500])
+def test_chunked_append_equals_full_build(events, chunksize):
+    full = MedalTable()
+    full.append(events)
+    chunked = MedalTable()
+    # Shuffled so duplicates of a team medal land in different chunks.
+    shuffled = events.sample(frac=1, random_state=1)
+    for start in range(0, len(shuffled), chunksize):
+        chunked.append(shuffled.iloc[start:start + chunksize])
+    assert chunked.rows == full.rows == len(events)
+    assert chunked.games == full.games
+    for games in [None, *full.games]:
+        _assert_table_equal(chunked.table(games), full.table(games))
+
+
+def test_append_returns_new_medals_only(events):
+    table = MedalTable()
+    first = table.append(events)
+    assert first == len(events.dropna(subset=["Medal"]).drop_duplicates(["Games", "Event", "NOC", "Medal"]))
+    assert table.append(events) == 0
+
+
+def test_cached_table_is_frozen(events):
+    cache = ResultCache()
+    table = medal_table_for(events, cache)
+    assert medal_table_for(events, cache) is table
+    with pytest.raises(ValueError, match="frozen"):
+        table.append(events)
+
+
+def test_background_loader_tallies_chunks(events, tmp_path):
+    path = tmp_path / "athlete_events.csv"
+    events.to_csv(path, index=False)
+    loader = BackgroundLoader(str(path), chunksize=700, cache=TableCache(str(tmp_path / "cache")), tally_medals=True)
+    loader.start()
+    loader._thread.join(timeout=60)
+    done = [payload for kind, payload in loader.poll() if kind == "done"]
+    assert done, "the loader did not finish"
+    df, _meta = done[0]
+
+    # The tally built while loading is what the Medals step gets.
+    assert medal_table_for(df) is loader.medal_table
+    _assert_table_equal(loader.medal_table.table(), _reference(events))
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from services.noc_regions import NOC_REGIONS_PATH, REGION_COLUMN, add_region, load_noc_regions
+
+
+def _reference(df: pd.DataFrame) -> pd.Series:
+    with open(NOC_REGIONS_PATH, encoding="utf-8", newline=None) as fh:
+        table = pd.read_csv(fh, dtype=str).drop_duplicates("NOC")
+    table["region"] = table["region"].fillna(table["notes"])
+    merged = df[["NOC"]].merge(table[["NOC", "region"]], on="NOC", how="left")
+    return merged["region"]
+
+
+def test_region_matches_merge(athletes):
+    df = athletes.copy()
+    df.loc[df.index[:5], "NOC"] = "XXX"
+    out = add_region(df)
+    assert list(out.columns).index(REGION_COLUMN) == list(out.columns).index("NOC") + 1
+    # SGP and XXX are not in the table and get a missing region.
+    pd.testing.assert_series_equal(
+        out[REGION_COLUMN].astype(object), _reference(df).astype(object), check_names=False,
+    )
+
+
+def test_categorical_noc(athletes):
+    plain = add_region(athletes)[REGION_COLUMN]
+    categorical = add_region(athletes.astype({"NOC": "category"}))[REGION_COLUMN]
+    pd.testing.assert_series_equal(categorical, plain)
+
+
+def test_missing_region_uses_note():
+    regions = load_noc_regions()
+    assert regions["TUV"] == "Tuvalu"
+    assert regions["ROT"] == "Refugee Olympic Team"
+    assert regions["SIN"] == "Singapore"
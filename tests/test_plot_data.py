@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from services.plot_data import (
+    dispersion_data, histogram_data, lttb_indices, percentile_data, std_band_data, value_counts_data,
+)
+
+
+def test_histogram_matches_numpy(athletes):
+    data = histogram_data(athletes["Height"])
+    counts, edges = np.histogram(athletes["Height"].dropna(), bins=len(data.counts))
+    np.testing.assert_array_equal(data.counts, counts)
+    np.testing.assert_allclose(data.edges, edges)
+    assert histogram_data(np.array([np.nan])) is None
+
+
+def test_value_counts_match_pandas(athletes):
+    data = value_counts_data(athletes["Age"], max_points=10_000)
+    expected = athletes["Age"].value_counts().sort_index()
+    np.testing.assert_array_equal(data.x, expected.index.to_numpy())
+    np.testing.assert_array_equal(data.y, expected.to_numpy())
+
+
+def test_percentiles_match_quantile(athletes):
+    data = percentile_data(athletes["Weight"])
+    expected = athletes["Weight"].quantile(np.linspace(0, 1, 101))
+    np.testing.assert_allclose(data.y, expected.to_numpy())
+
+
+def test_std_band_matches_groupby(athletes):
+    data = std_band_data(athletes["Height"], athletes["Year"])
+    grouped = athletes.groupby("Year")["Height"]
+    np.testing.assert_array_equal(data.x, grouped.mean().index.to_numpy())
+    np.testing.assert_allclose(data.mean, grouped.mean().to_numpy())
+    np.testing.assert_allclose(data.std, grouped.std().to_numpy())
+
+
+def test_dispersion_keeps_complete_pairs(athletes):
+    x, y = athletes["Height"], athletes["Weight"]
+    complete = x.notna() & y.notna()
+    points = dispersion_data(x, y, sample_size=len(x))
+    assert len(points.x) == complete.sum()
+    density = dispersion_data(x, y, sample_size=10, bins=7)
+    assert density.counts.shape == (7, 7)
+    assert density.counts.sum() == complete.sum()
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.zeros(1000)
+    y[500] = 10.0
+    kept = lttb_indices(x, y, 50)
+    assert len(kept) == 50
+    assert kept[0] == 0 and kept[-1] == 999
+    assert 500 in kept
+    assert np.all(np.diff(kept) > 0)
+    pd.testing.assert_index_equal(pd.Index(lttb_indices(x, y, 2000)), pd.RangeIndex(1000), exact=False)
@@ -0,0 +1,20 @@
+from services.result_cache import ResultCache, dataframe_fingerprint
+
+
+def test_fingerprint_follows_content(athletes):
+    assert dataframe_fingerprint(athletes) == dataframe_fingerprint(athletes.copy())
+    changed = athletes.copy()
+    changed.loc[0, "Age"] = 99.0
+    assert dataframe_fingerprint(changed) != dataframe_fingerprint(athletes)
+    assert dataframe_fingerprint(athletes.astype({"Year": "int32"})) != dataframe_fingerprint(athletes)
+
+
+def test_lru_eviction_and_stats():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats() == {"hits": 3, "misses": 1, "entries": 2}
@@ -0,0 +1,47 @@
+import pytest
+
+from widgets.sheet_selector import SheetSelector
+
+
+class FakeListbox:
+    def __init__(self, values, selected):
+        self.values = list(values)
+        self.selected = [self.values.index(v) for v in selected]
+
+    def get(self, index):
+        return self.values[index]
+
+    def curselection(self):
+        return tuple(self.selected)
+
+    def size(self):
+        return len(self.values)
+
+
+def _accept(sheets, selected_sheets, columns, selected_columns):
+    dialog = SheetSelector.__new__(SheetSelector)
+    dialog.sheet_list = FakeListbox(sheets, selected_sheets)
+    dialog.column_list = FakeListbox(columns, selected_columns)
+    dialog.result = None
+    dialog.destroy = lambda: None
+    dialog.bell = lambda: None
+    dialog._accept()
+    return dialog.result
+
+
+@pytest.mark.parametrize("selected, expected", [
+    (["Name", "NOC"], None),
+    (["Name"], ["Name"]),
+])
+def test_single_sheet_keeps_all_columns_as_none(selected, expected):
+    assert _accept(["1896", "1900"], ["1896"], ["Name", "NOC"], selected) == (["1896"], expected)
+
+
+def test_several_sheets_pass_the_shared_columns():
+    # Every listed (shared) column selected must not mean "all columns of every sheet".
+    result = _accept(["1896", "1900"], ["1896", "1900"], ["Name", "NOC"], ["Name", "NOC"])
+    assert result == (["1896", "1900"], ["Name", "NOC"])
+
+
+def test_empty_selection_is_refused():
+    assert _accept(["1896"], ["1896"], ["Name"], []) is None
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.statistical_calc import (
+    GROUP_STATISTICS,
+    average_calc,
+    compute_summary,
+    correlation_calc,
+    covariance_calc,
+    grouped_summary,
+    median_calc,
+    mode_calc,
+    std_deviation_calc,
+    total_calc,
+    variance_calc,
+)
+
+NUMERIC = ["Age", "Height", "Weight", "Year"]
+
+
+def _assert_close(actual: dict, expected: dict):
+    assert list(actual) == list(expected)
+    np.testing.assert_allclose(
+        np.array(list(actual.values()), dtype=np.float64),
+        np.array(list(expected.values()), dtype=np.float64),
+        rtol=1e-9, atol=1e-12, equal_nan=True,
+    )
+
+
+@pytest.fixture
+def numeric(athletes):
+    return athletes[NUMERIC]
+
+
+@pytest.mark.parametrize("field, reference", [
+    ("total", total_calc),
+    ("mean", average_calc),
+    ("median", median_calc),
+    ("variance", variance_calc),
+    ("std", std_deviation_calc),
+])
+def test_scalar_statistics_match_pandas(athletes, field, reference):
+    summary = compute_summary(athletes)
+    assert summary.columns == ("ID", *NUMERIC)
+    _assert_close(getattr(summary, field), reference(athletes))
+
+
+@pytest.mark.parametrize("field, reference", [("covariance", covariance_calc), ("correlation", correlation_calc)])
+def test_matrices_match_pandas(numeric, field, reference):
+    actual, expected = getattr(compute_summary(numeric), field), reference(numeric)
+    for column in NUMERIC:
+        _assert_close(actual[column], expected[column])
+
+
+def test_mode_matches_pandas(numeric):
+    expected = {
+        column: {k: v for k, v in modes.items() if not pd.isna(v)}
+        for column, modes in mode_calc(numeric).items()
+    }
+    assert compute_summary(numeric).mode == expected
+
+
+def test_count_skips_missing_values(numeric):
+    assert compute_summary(numeric).count == numeric.count().to_dict()
+
+
+def test_edge_cases():
+    assert compute_summary(pd.DataFrame()).columns == ()
+    assert compute_summary(pd.DataFrame({"Name": ["a", "b"]})).columns == ()
+    one_row = compute_summary(pd.DataFrame({"Age": [24.0], "Height": [np.nan]}))
+    assert one_row.mean == {"Age": 24.0, "Height": pytest.approx(np.nan, nan_ok=True)}
+    assert np.isnan(one_row.variance["Age"])
+    assert one_row.median["Age"] == 24.0
+
+
+@pytest.mark.parametrize("by", [["Year"], ["NOC"], ["Sex", "Season"]])
+def test_grouped_summary_matches_groupby(athletes, by):
+    columns = ["Age", "Height", "Weight"]
+    result = grouped_summary(athletes, by, columns)
+    groups = athletes.groupby(by)
+
+    assert list(result["Rows"]) == list(groups.size())
+    expected = {
+        "count": groups[columns].count(),
+        "total": groups[columns].sum(),
+        "mean": groups[columns].mean(),
+        "median": groups[columns].median(),
+        "variance": groups[columns].var(),
+        "std": groups[columns].std(),
+        "mode": groups[columns].agg(lambda s: s.mode().min()),
+    }
+    for name in GROUP_STATISTICS:
+        for column in columns:
+            np.testing.assert_allclose(
+                result[f"{column} {name}"].to_numpy(dtype=np.float64),
+                expected[name][column].to_numpy(dtype=np.float64),
+                rtol=1e-9, equal_nan=True, err_msg=f"{column} {name}",
+            )
+
+
+def test_grouped_summary_pairs_match_groupby(athletes):
+    result = grouped_summary(athletes, ["Sport"], ["Height", "Weight"])
+    for sport, group in athletes.groupby("Sport"):
+        pair = group[["Height", "Weight"]]
+        assert result.loc[sport, "Height×Weight cov"] == pytest.approx(pair.cov().loc["Height", "Weight"])
+        assert result.loc[sport, "Height×Weight corr"] == pytest.approx(pair.corr().loc["Height", "Weight"])
+
+
+def test_grouped_summary_drops_missing_keys(athletes):
+    result = grouped_summary(athletes, ["Medal"], ["Age"])
+    assert list(result.index) == sorted(athletes["Medal"].dropna().unique())
+    assert result["Rows"].sum() == athletes["Medal"].notna().sum()
+
+
+def test_grouped_summary_needs_keys(athletes):
+    with pytest.raises(ValueError):
+        grouped_summary(athletes, [])
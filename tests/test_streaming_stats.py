@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.statistical_calc import compute_summary
+from services.streaming_stats import QuantileSketch, StreamingSummary, summarize_chunks, summarize_file
+
+EXACT_FIELDS = ("count", "total", "mean", "median", "variance", "std")
+
+
+def _chunks(df: pd.DataFrame, size: int):
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+
+def _assert_summaries_close(actual, expected):
+    assert actual.columns == expected.columns
+    for field in EXACT_FIELDS:
+        for column in expected.columns:
+            assert getattr(actual, field)[column] == pytest.approx(
+                getattr(expected, field)[column], rel=1e-9, nan_ok=True
+            ), f"{field} {column}"
+    for field in ("covariance", "correlation"):
+        for a in expected.columns:
+            for b in expected.columns:
+                assert getattr(actual, field)[a][b] == pytest.approx(
+                    getattr(expected, field)[a][b], rel=1e-9, abs=1e-12, nan_ok=True
+                ), f"{field} {a} {b}"
+    assert actual.mode == expected.mode
+
+
+@pytest.fixture
+def numeric(athletes):
+    return athletes[["ID", "Age", "Height", "Weight", "Year", "Name"]]
+
+
+@pytest.mark.parametrize("size", [1000, 333, 4000])
+def test_chunked_summary_matches_in_memory(numeric, size):
+    expected = compute_summary(numeric.drop(columns=["ID"]))
+    _assert_summaries_close(summarize_chunks(_chunks(numeric, size)), expected)
+
+
+def test_merge_equals_sequential_updates(numeric):
+    chunks = _chunks(numeric, 700)
+    sequential = StreamingSummary()
+    for chunk in chunks:
+        sequential.update(chunk)
+
+    # Each "worker" summarises every other chunk; the merge order differs too.
+    left, right = StreamingSummary(), StreamingSummary()
+    for i, chunk in enumerate(chunks):
+        (left if i % 2 else right).update(chunk)
+    right.merge(left)
+    _assert_summaries_close(right.result(), sequential.result())
+    _assert_summaries_close(right.result(), compute_summary(numeric.drop(columns=["ID"])))
+
+
+def test_merge_rejects_other_columns(numeric):
+    a, b = StreamingSummary(), StreamingSummary()
+    a.update(numeric[["Age", "Year"]])
+    b.update(numeric[["Height", "Year"]])
+    with pytest.raises(ValueError):
+        a.merge(b)
+
+
+def test_high_cardinality_median_is_approximate():
+    rng = np.random.default_rng(3)
+    values = rng.normal(100, 15, 200_000)
+    summary = StreamingSummary(drop=(), max_distinct=1000)
+    for chunk in _chunks(pd.DataFrame({"x": values}), 25_000):
+        summary.update(chunk)
+    result = summary.result()
+    assert result.mode["x"] is None
+    assert result.median["x"] == pytest.approx(np.median(values), abs=0.2)
+    assert result.mean["x"] == pytest.approx(values.mean())
+
+
+def test_quantile_sketch_tracks_numpy():
+    rng = np.random.default_rng(5)
+    values = rng.exponential(10, 100_000)
+    sketch = QuantileSketch()
+    for block in np.array_split(values, 10):
+        sketch.update(block)
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+    np.testing.assert_allclose(sketch.quantile(qs), np.quantile(values, qs), rtol=0.02)
+    assert sketch.quantile(0.0) == values.min()
+    assert sketch.quantile(1.0) == values.max()
+
+
+def test_summarize_file_matches_in_memory(numeric, tmp_path):
+    path = tmp_path / "athletes.csv"
+    numeric.to_csv(path, index=False)
+    expected = compute_summary(pd.read_csv(path).drop(columns=["ID"]))
+    _assert_summaries_close(summarize_file(str(path), chunksize=500), expected)
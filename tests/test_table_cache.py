@@ -0,0 +1,64 @@
+import os
+
+import pandas as pd
+import pytest
+
+from services.table_cache import TableCache
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def source(tmp_path, athletes):
+    path = tmp_path / "athlete_events.csv"
+    athletes.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TableCache(str(tmp_path / "cache"))
+
+
+def test_round_trip(cache, source):
+    df = pd.read_csv(source)
+    meta = {"name": "athlete_events.csv", "rows": len(df)}
+    assert cache.get(source) is None
+    assert cache.put(source, df, meta)
+
+    cached, cached_meta = cache.get(source)
+    pd.testing.assert_frame_equal(cached, df)
+    assert cached_meta == meta
+
+
+def test_changed_source_misses(cache, source):
+    df = pd.read_csv(source)
+    cache.put(source, df, {})
+    with open(source, "a", encoding="utf-8") as fh:
+        fh.write(",".join(["0"] * len(df.columns)) + "\n")
+    assert cache.get(source) is None
+    # The stale entry is removed once noticed.
+    assert len(os.listdir(cache.cache_dir)) == 0
+
+
+def test_variants_are_separate(cache, source):
+    df = pd.read_csv(source)
+    cache.put(source, df, {}, variant="")
+    assert cache.get(source, variant='{"columns": ["Name"]}') is None
+    cache.put(source, df[["Name"]], {}, variant='{"columns": ["Name"]}')
+    cached, _meta = cache.get(source, variant='{"columns": ["Name"]}')
+    assert list(cached.columns) == ["Name"]
+
+
+def test_eviction_keeps_total_under_cap(tmp_path, athletes):
+    cache = TableCache(str(tmp_path / "cache"), max_bytes=1)
+    path = tmp_path / "small.csv"
+    athletes.head(10).to_csv(path, index=False)
+    cache.put(str(path), athletes.head(10), {})
+    assert cache.get(str(path)) is None
+
+
+def test_unrepresentable_table_is_not_cached(cache, source):
+    mixed = pd.DataFrame({"x": [1, "a", 2.5]}, dtype=object)
+    assert not cache.put(source, mixed, {})
+    assert cache.get(source) is None
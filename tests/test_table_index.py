@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.dtype_profile import optimize_dtypes
+from services.table_index import TableIndex
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "Name": ["Ana", "Bruno", "Carla", "Davi", "Eva", "Fabio"],
+        "Team": ["Trinidad and Tobago", "Brazil", "Bosnia and Herzegovina", "Brazil", "Antigua and Barbuda", "Brazil"],
+        "NOC": ["TTO", "BRA", "BIH", "BRA", "ANT", "BRA"],
+        "Event": ["Athletics Men's 4 x 100 metres, Relay", "Judo", "Judo", "Swimming", "Judo", "Judo"],
+        "Year": [2000, 2004, 2008, 2004, 2012, 2016],
+        "Weight": [70.3, 60.5, np.nan, 81.7, 70.3, 55.0],
+    })
+
+
+def _expected(mask: pd.Series) -> list[int]:
+    return list(np.flatnonzero(mask.to_numpy()))
+
+
+@pytest.mark.parametrize("team", ["Trinidad and Tobago", "Bosnia and Herzegovina", "Antigua and Barbuda"])
+def test_filter_quoted_value_containing_and(df, team):
+    index = TableIndex(df)
+    assert list(index.filter(f'Team == "{team}"')) == _expected(df["Team"] == team)
+    assert list(index.filter(f"Team == '{team}' and Year >= 2000")) == _expected(df["Team"] == team)
+
+
+def test_filter_quoted_value_containing_comma(df):
+    event = "Athletics Men's 4 x 100 metres, Relay"
+    index = TableIndex(df)
+    assert list(index.filter(f'Event == "{event}", NOC == TTO')) == _expected(df["Event"] == event)
+
+
+def test_filter_combines_clauses(df):
+    index = TableIndex(df)
+    expected = _expected((df["NOC"] == "BRA") & (df["Year"] >= 2004) & (df["Event"] != "Swimming"))
+    assert list(index.filter('NOC == "BRA" and Year >= 2004 & Event != Swimming')) == expected
+
+
+def test_filter_unknown_column(df):
+    with pytest.raises(ValueError, match="Unknown column"):
+        TableIndex(df).filter("Country == BRA")
+
+
+@pytest.mark.parametrize("op, compare", [
+    ("==", lambda s, v: s == v),
+    ("<=", lambda s, v: s <= v),
+    (">=", lambda s, v: s >= v),
+    ("<", lambda s, v: s < v),
+    (">", lambda s, v: s > v),
+])
+@pytest.mark.parametrize("value", ["70.3", "60.5", "55", "2004"])
+def test_float32_comparisons_match_pandas(df, op, compare, value):
+    compact, _report = optimize_dtypes(df)
+    assert compact["Weight"].dtype == np.float32
+    column = "Year" if value == "2004" else "Weight"
+    # pandas compares against the value as stored in the column's dtype.
+    stored = compact[column].dtype.type(float(value))
+    rows = TableIndex(compact).filter(f"{column} {op} {value}")
+    assert list(rows) == _expected(compare(compact[column], stored).fillna(False))
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("column", ["Team", "Year", "Weight"])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_sort_order_matches_pandas(df, compact, column, ascending):
+    frame = optimize_dtypes(df)[0] if compact else df
+    order = TableIndex(frame).sort_order(column, ascending)
+    expected = frame[column].sort_values(ascending=ascending, kind="stable", na_position="last")
+    assert list(order) == list(expected.index)
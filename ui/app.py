@@ -3,7 +3,10 @@ from tkinter import ttk
 
 import pandas
 
+from ui.steps.athlete_step import AthleteStep
 from ui.steps.get_data_step import GetDataStep
+from ui.steps.medal_step import MedalStep
+from ui.steps.performance_step import PerformanceStep
 from ui.steps.statistical_step import StatisticsStep
 from ui.theme.theme_manager import ThemeManager
 
@@ -12,6 +15,7 @@ class App:
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self.theme_manager = ThemeManager(root, initial_theme="light")
+        self.perf_step: PerformanceStep | None = None
         self._build()
 
     def _build(self):
@@ -32,6 +36,14 @@ class App:
         )
         toggle_btn.grid(row=0, column=1, sticky="e")
 
+        perf_btn = ttk.Button(
+            top_bar,
+            text="Performance",
+            command=self._toggle_performance,
+            style="Secondary.TButton",
+        )
+        perf_btn.grid(row=0, column=2, sticky="e", padx=(8, 0))
+
         top_bar.columnconfigure(0, weight=1)
 
         self.nb = ttk.Notebook(container, style="TNotebook")
@@ -42,7 +54,39 @@ class App:
 
         self.step2 = StatisticsStep(self.nb, self.step1.df if self.step1.df else pandas.DataFrame(), self.step1.file_label_var, theme_manager=self.theme_manager)
         self.nb.add(self.step2, text="2 - Statistics")
+
+        self.step3 = MedalStep(self.nb, self.theme_manager)
+        self.nb.add(self.step3, text="3 - Medals")
+
+        self.step4 = AthleteStep(self.nb, self.theme_manager)
+        self.nb.add(self.step4, text="4 - Athletes")
         self.step1.on_data_loaded = self._on_data_loaded
 
+        self.status_var = tk.StringVar(value="Ready")
+        status_bar = ttk.Label(container, textvariable=self.status_var, style="Info.TLabel", anchor="w")
+        status_bar.pack(fill="x", side="bottom", before=self.nb)
+        self.step1.on_status = self._set_status
+        self.step2.on_status = self._set_status
+        self.step3.on_status = self._set_status
+        self.step4.on_status = self._set_status
+
+    def _toggle_performance(self):
+        """Show or hide the performance tab; timings are only recorded while it is shown."""
+        if self.perf_step is None:
+            self.perf_step = PerformanceStep(self.nb, self.theme_manager)
+            self.perf_step.on_status = self._set_status
+        if str(self.perf_step) in self.nb.tabs():
+            self.perf_step.stop()
+            self.nb.forget(self.perf_step)
+        else:
+            self.nb.add(self.perf_step, text="Performance")
+            self.nb.select(self.perf_step)
+            self.perf_step.start()
+
+    def _set_status(self, msg: str):
+        self.status_var.set(msg)
+
     def _on_data_loaded(self, df: pandas.DataFrame, _meta: dict):
-        self.step2.update_dataframe(df)
\ No newline at end of file
+        self.step2.update_dataframe(df)
+        self.step3.update_dataframe(df)
+        self.step4.update_dataframe(df)
\ No newline at end of file
@@ -0,0 +1,100 @@
+import tkinter as tk
+from tkinter import ttk
+
+import pandas as pd
+
+from services.athlete_index import ID_COLUMN, AthleteIndex, athlete_index_for
+from widgets.dataframe_table import DataFrameTable
+
+SEARCH_DELAY_MS = 150
+MAX_MATCHES = 200
+
+
+class AthleteStep(ttk.Frame):
+    """Athlete lookup by ID or name prefix, with career figures and participations."""
+
+    def __init__(self, master, theme_manager):
+        super().__init__(master, padding=8)
+        self.theme_manager = theme_manager
+        self.on_status = None
+        self.df: pd.DataFrame | None = None
+        self._index: AthleteIndex | None = None
+        self._matches = pd.DataFrame()
+        self._search_job = None
+
+        self._build()
+        self.theme_manager.add_observer(self._on_theme_changed)
+
+    def _build(self):
+        bar = ttk.Frame(self, style="TFrame")
+        bar.pack(fill="x", pady=(0,8))
+
+        ttk.Label(bar, text="ID or name", style="Info.TLabel").pack(side="left")
+        self.query_var = tk.StringVar()
+        entry = ttk.Entry(bar, textvariable=self.query_var)
+        entry.pack(side="left", fill="x", expand=True, padx=8)
+        entry.bind("<KeyRelease>", lambda _e: self._schedule_search())
+        entry.bind("<Return>", lambda _e: self._search())
+
+        self.info_var = tk.StringVar(value="—")
+        ttk.Label(bar, textvariable=self.info_var, style="Info.TLabel").pack(side="right")
+
+        panes = ttk.PanedWindow(self, orient="vertical")
+        panes.pack(fill="both", expand=True)
+
+        self.careers_table = DataFrameTable(panes, self.theme_manager)
+        self.careers_table.on_select = self._on_athlete_selected
+        panes.add(self.careers_table, weight=1)
+
+        self.rows_table = DataFrameTable(panes, self.theme_manager)
+        panes.add(self.rows_table, weight=2)
+
+    def update_dataframe(self, df: pd.DataFrame | None):
+        self.df = df
+        # The index is built on the first search.
+        self._index = None
+        self._show_matches(pd.DataFrame())
+        if df is not None and ID_COLUMN not in df.columns:
+            self.info_var.set(f"The table has no {ID_COLUMN} column.")
+        elif self.query_var.get().strip():
+            self._search()
+
+    def _schedule_search(self):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DELAY_MS, self._search)
+
+    def _search(self):
+        self._search_job = None
+        if self.df is None or ID_COLUMN not in self.df.columns:
+            return
+        if self._index is None:
+            self._index = athlete_index_for(self.df)
+            self._notify(f"{len(self._index)} athletes indexed.")
+        matches = self._index.lookup(self.query_var.get(), limit=MAX_MATCHES)
+        self._show_matches(matches)
+        if len(matches) == 1:
+            self._on_athlete_selected(0)
+
+    def _show_matches(self, matches: pd.DataFrame):
+        self._matches = matches
+        self.careers_table.set_dataframe(matches)
+        self.rows_table.set_dataframe(pd.DataFrame())
+        if self._index is not None:
+            more = "+" if len(matches) >= MAX_MATCHES else ""
+            self.info_var.set(f"{len(matches)}{more} of {len(self._index)} athletes")
+
+    def _on_athlete_selected(self, row: int):
+        if self._index is None or not 0 <= row < len(self._matches):
+            return
+        athlete_id = self._matches[ID_COLUMN].iloc[row]
+        rows = self._index.rows(athlete_id)
+        self.rows_table.set_dataframe(self.df.iloc[rows])
+
+    def _notify(self, msg: str):
+        if self.on_status:
+            self.on_status(msg)
+
+    def _on_theme_changed(self, *_args):
+        # Widget colors are handled via ttk styles.
+        pass
@@ -1,11 +1,22 @@
+import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Optional, Callable
 
 import pandas as pd
 
-from services.io_loader import load_table
+from services.background_loader import BackgroundLoader
+from services.column_store import STORE_EXT, is_store, write_store
+from services.excel_loader import is_excel
+from services.dtype_profile import OLYMPICS_PROFILE
+from services.page_cache import PageCache
+from services.table_index import TableIndex
 from widgets.dataframe_table import DataFrameTable
+from widgets.sheet_selector import ask_sheet_selection
+
+PAGE_SIZES = (500, 1_000, 5_000, 10_000, 50_000)
 
 
 class GetDataStep(ttk.Frame):
@@ -15,8 +26,15 @@ class GetDataStep(ttk.Frame):
         self.on_status = None
         self.df: pd.DataFrame | None = None
         self.page_idx = 0
-        self.page_size = 500
+        self.page_size = 10_000
         self.on_data_loaded: Optional[Callable[[pd.DataFrame, dict], None]] = None
+        self._loader: BackgroundLoader | None = None
+        self._previous: tuple[pd.DataFrame | None, str] | None = None
+        self._pages: PageCache | None = None
+        self._index: TableIndex | None = None
+        self._filter_expr = ""
+        self._sort: tuple[str, bool] | None = None
+        self._meta: dict | None = None
 
         self._build()
         self.theme_manager.add_observer(self._on_theme_changed)
@@ -28,9 +46,35 @@ class GetDataStep(ttk.Frame):
         self.btn_open = ttk.Button(bar, text="Open file", command=self._open_file, style="TButton")
         self.btn_open.pack(side="left")
 
+        self.btn_cancel = ttk.Button(bar, text="Cancel", command=self._cancel_load, state="disabled", style="Secondary.TButton")
+        self.btn_cancel.pack(side="left", padx=(8, 0))
+
+        ttk.Button(bar, text="Open project", command=self._open_project, style="Secondary.TButton").pack(side="left", padx=(8, 0))
+        self.btn_import = ttk.Button(bar, text="Import to project", command=self._import_to_project, state="disabled", style="Secondary.TButton")
+        self.btn_import.pack(side="left", padx=(8, 0))
+
+        self.progress = ttk.Progressbar(bar, mode="determinate", maximum=1.0, length=160)
+        self.progress.pack(side="right")
+
+        # Off by default: float32 columns show rounded values (70.3 as 70.30000305).
+        self.optimize_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(bar, text="Compact dtypes", variable=self.optimize_var).pack(side="right", padx=8)
+
         self.file_label_var = tk.StringVar(value="No file selected")
         ttk.Label(bar, textvariable=self.file_label_var, style="Info.Label").pack(side="left", padx=12)
 
+        filter_bar = ttk.Frame(self, style="TFrame")
+        filter_bar.pack(fill="x", pady=(0,8))
+
+        ttk.Label(filter_bar, text="Filter", style="Info.TLabel").pack(side="left")
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_bar, textvariable=self.filter_var)
+        filter_entry.pack(side="left", fill="x", expand=True, padx=8)
+        filter_entry.bind("<Return>", lambda _e: self._apply_filter())
+
+        ttk.Button(filter_bar, text="Clear", command=self._clear_filter, style="Secondary.TButton").pack(side="right")
+        ttk.Button(filter_bar, text="Apply", command=self._apply_filter, style="TButton").pack(side="right", padx=(0, 8))
+
         bar2 = ttk.Frame(self, style="Card.TFrame")
         bar2.pack(fill="x", pady=(0,4))
 
@@ -44,28 +88,266 @@ class GetDataStep(ttk.Frame):
 
         ttk.Label(bar2, textvariable=self.page_info, style="Subtitle.TLabel").pack(side="left", padx=12)
 
+        self.page_size_var = tk.StringVar(value=str(self.page_size))
+        page_size_box = ttk.Combobox(
+            bar2,
+            textvariable=self.page_size_var,
+            values=[str(n) for n in PAGE_SIZES],
+            width=8,
+            state="readonly",
+        )
+        page_size_box.pack(side="right", padx=8)
+        page_size_box.bind("<<ComboboxSelected>>", self._on_page_size_changed)
+        ttk.Label(bar2, text="Rows per page", style="Info.TLabel").pack(side="right")
+
         self.table = DataFrameTable(self, self.theme_manager)
+        self.table.on_sort = self._on_sort
         self.table.pack(fill="both", expand=True)
 
     def _open_file(self):
         fp = filedialog.askopenfilename(
             title="Select file",
-            filetypes=[("Sheets", "*.xlsx *xls *.csv"), ("All files", "*.*")]
+            filetypes=[("Sheets", "*.xlsx *.xlsm *.xls *.csv"), ("All files", "*.*")]
         )
         if not fp:
             return
+        if not is_excel(fp):
+            self._start_load(fp)
+            return
         try:
-            self._notify("Loading...")
-            self.df, meta = load_table(fp, sample_rows=None)
-            self.file_label_var.set(f"File: {meta['name']}  •  Rows: {meta['rows']}  •  Columns: {meta['cols']}")
-            self.page_idx = 0
-            self._render_page()
-            if self.on_data_loaded:
-                self.on_data_loaded(self.df, meta)
-            self._notify("Loading successfully")
+            selection = ask_sheet_selection(self, self.theme_manager, fp)
         except Exception as e:
             messagebox.showerror("Error while opening", str(e))
-            self._notify("Loading error")
+            return
+        if selection is not None:
+            self._start_load(fp, *selection)
+
+    def _open_project(self):
+        path = filedialog.askdirectory(title="Select project", mustexist=True)
+        if not path:
+            return
+        if not is_store(path):
+            messagebox.showerror("Error while opening", f"Not a project ({STORE_EXT}) folder: {path}")
+            return
+        self._start_load(path)
+
+    def _start_load(self, fp: str, sheets: list[str] | None = None, columns: list[str] | None = None):
+        if self._loader is not None:
+            self._loader.cancel()
+        else:
+            self._previous = (self.df, self.file_label_var.get())
+
+        profile = OLYMPICS_PROFILE if self.optimize_var.get() else None
+        self._loader = BackgroundLoader(
+            fp,
+            dtype_profile=profile,
+            enrich_regions=True,
+            sheets=sheets,
+            columns=columns,
+            tally_medals=True,
+        )
+        self._loader.start()
+        self.btn_cancel.config(state="normal")
+        self.progress.config(mode="indeterminate")
+        self.progress.start(15)
+        self._notify("Loading...")
+        self.after(50, self._poll_loader, self._loader)
+
+    def _poll_loader(self, loader: BackgroundLoader):
+        if loader is not self._loader:
+            return
+        for kind, payload in loader.poll():
+            match kind:
+                case "progress":
+                    self._on_load_progress(*payload)
+                case "chunk":
+                    self._on_first_chunk(payload)
+                case "done":
+                    self._on_load_done(*payload)
+                    return
+                case "error":
+                    self._finish_load()
+                    self._restore_previous()
+                    messagebox.showerror("Error while opening", str(payload))
+                    self._notify("Loading error")
+                    return
+                case "cancelled":
+                    self._finish_load()
+                    self._restore_previous()
+                    self._notify("Loading cancelled")
+                    return
+        self.after(50, self._poll_loader, loader)
+
+    def _on_load_progress(self, rows: int, fraction: float | None):
+        if fraction is None:
+            self._notify(f"Loading... {rows} rows")
+            return
+        if str(self.progress.cget("mode")) != "determinate":
+            self.progress.stop()
+            self.progress.config(mode="determinate")
+        self.progress["value"] = fraction
+        self._notify(f"Loading... {rows} rows ({fraction:.0%})")
+
+    def _on_first_chunk(self, chunk: pd.DataFrame):
+        self._set_df(chunk)
+        self.page_idx = 0
+        self.file_label_var.set(f"File: {os.path.basename(self._loader.file_path)}  •  Loading...")
+        self._render_page()
+
+    def _on_load_done(self, df: pd.DataFrame, meta: dict):
+        self._finish_load()
+        self._previous = None
+        self._meta = meta
+        # A project is already mapped from disk; there is nothing to import.
+        self.btn_import.config(state="disabled" if meta.get("store") else "normal")
+        self._set_df(df)
+        label = f"File: {meta['name']}  •  Rows: {meta['rows']}  •  Columns: {meta['cols']}"
+        if "memory_after" in meta:
+            label += f"  •  Memory: {meta['memory_before'] / 2**20:.1f} → {meta['memory_after'] / 2**20:.1f} MB"
+        self.file_label_var.set(label)
+        self._render_page()
+        if self.on_data_loaded:
+            self.on_data_loaded(self.df, meta)
+        self._notify("Loading successfully")
+
+    def _import_to_project(self):
+        """Save the loaded table as a project and reopen it from there."""
+        if self.df is None or self._meta is None:
+            return
+        base = os.path.splitext(self._meta["name"])[0]
+        path = filedialog.asksaveasfilename(
+            title="Import to project",
+            initialfile=base + STORE_EXT,
+            defaultextension=STORE_EXT,
+            filetypes=[("Project", "*" + STORE_EXT)],
+        )
+        if not path:
+            return
+
+        df, meta = self.df, {**self._meta, "source": self._meta.get("path")}
+        results: queue.Queue = queue.Queue()
+
+        def work():
+            try:
+                write_store(df, path, meta)
+                results.put(None)
+            except Exception as e:
+                results.put(e)
+
+        self.btn_import.config(state="disabled")
+        self._notify("Importing to project...")
+        threading.Thread(target=work, name="project-import", daemon=True).start()
+        self.after(50, self._poll_import, results, path)
+
+    def _poll_import(self, results: queue.Queue, path: str):
+        try:
+            error = results.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_import, results, path)
+            return
+        if error is not None:
+            self.btn_import.config(state="normal")
+            messagebox.showerror("Error while importing", str(error))
+            self._notify("Import error")
+            return
+        self._notify(f"Imported to {path}")
+        self._start_load(path)
+
+    def _cancel_load(self):
+        if self._loader is not None:
+            self._loader.cancel()
+            self._notify("Cancelling...")
+
+    def _finish_load(self):
+        self._loader = None
+        self.progress.stop()
+        self.progress.config(mode="determinate")
+        self.progress["value"] = 0
+        self.btn_cancel.config(state="disabled")
+
+    def _restore_previous(self):
+        if self._previous is None:
+            return
+        df, label = self._previous
+        self._set_df(df)
+        self._previous = None
+        self.file_label_var.set(label)
+        self.page_idx = 0
+        if self.df is not None:
+            self._render_page()
+        else:
+            self.table.set_dataframe(pd.DataFrame())
+            self.page_info.set("—")
+            self.btn_prev.config(state="disabled")
+            self.btn_next.config(state="disabled")
+
+    def _set_df(self, df: pd.DataFrame | None):
+        self.df = df
+        self._index = TableIndex(df) if df is not None else None
+        if self._sort is not None and (df is None or self._sort[0] not in map(str, df.columns)):
+            self._sort = None
+        try:
+            self._update_view()
+        except ValueError:
+            # The filter does not fit the new file.
+            self._filter_expr = ""
+            self.filter_var.set("")
+            self._update_view()
+
+    def _update_view(self):
+        """Rebuild the pages over the filtered and sorted row positions."""
+        if self._pages is not None:
+            self._pages.close()
+            self._pages = None
+        if self.df is None:
+            return
+        rows = self._index.filter(self._filter_expr) if self._filter_expr else None
+        if self._sort is not None:
+            rows = self._index.view(rows, *self._sort)
+        self._pages = PageCache(self.df, self.page_size, rows=rows)
+
+    def _apply_filter(self):
+        if self.df is None:
+            return
+        previous = self._filter_expr
+        self._filter_expr = self.filter_var.get().strip()
+        try:
+            self._update_view()
+        except ValueError as exc:
+            self._filter_expr = previous
+            self._update_view()
+            self._notify(f"Invalid filter: {exc}")
+            return
+        self.page_idx = 0
+        self._render_page()
+        self._notify(f"{self._pages.row_count} of {len(self.df)} rows match" if self._filter_expr else "Filter cleared")
+
+    def _clear_filter(self):
+        self.filter_var.set("")
+        self._apply_filter()
+
+    def _on_sort(self, column: str):
+        """Cycle ``column`` through ascending, descending and unsorted."""
+        if self.df is None:
+            return
+        if self._sort is None or self._sort[0] != column:
+            self._sort = (column, True)
+        elif self._sort[1]:
+            self._sort = (column, False)
+        else:
+            self._sort = None
+        self._update_view()
+        self.page_idx = 0
+        self._render_page()
+
+    def _on_page_size_changed(self, _event=None):
+        page_size = int(self.page_size_var.get())
+        first_row = self.page_idx * self.page_size
+        self.page_size = page_size
+        self.page_idx = first_row // page_size
+        if self._pages is not None:
+            self._pages.set_page_size(page_size)
+            self._render_page()
 
     def _notify(self, msg: str):
         if self.on_status:
@@ -74,7 +356,7 @@ class GetDataStep(ttk.Frame):
     def _render_page(self):
         if self.df is None:
             return
-        total = len(self.df)
+        total = self._pages.row_count
         start = self.page_idx * self.page_size
         end = min(start + self.page_size, total)
 
@@ -83,9 +365,14 @@ class GetDataStep(ttk.Frame):
             start = self.page_idx * self.page_size
             end = min(start + self.page_size, total)
 
-        page_df = self.df.iloc[start:end].reset_index(drop=True)
-        self.table.set_dataframe(page_df)
-        self.page_info.set(f"Showing {start+1}-{end} of {total} rows (page {self.page_idx+1}/{max((total-1)//self.page_size+1, 1)})")
+        rows = self._pages.get(self.page_idx)
+        self.table.set_rows(self._pages.columns, len(rows), lambda a, b: rows[a:b])
+        self.table.set_sort_indicator(*(self._sort or (None,)))
+        self._pages.prefetch(self.page_idx)
+        info = f"Showing {start+1}-{end} of {total} rows (page {self.page_idx+1}/{max((total-1)//self.page_size+1, 1)})"
+        if total != len(self.df):
+            info += f"  •  filtered from {len(self.df)}"
+        self.page_info.set(info)
 
         if total == 0:
             self.btn_prev.config(state="disabled")
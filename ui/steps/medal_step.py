@@ -0,0 +1,92 @@
+import tkinter as tk
+from tkinter import ttk
+
+import pandas as pd
+
+from services.medal_table import KEY_COLUMNS, MedalTable, medal_table_for
+from widgets.dataframe_table import DataFrameTable
+
+ALL_GAMES = "All Games"
+
+
+class MedalStep(ttk.Frame):
+    """Medal table per Games, with team medals counted once."""
+
+    def __init__(self, master, theme_manager):
+        super().__init__(master, padding=8)
+        self.theme_manager = theme_manager
+        self.on_status = None
+        self.df: pd.DataFrame | None = None
+        self._medals: MedalTable | None = None
+        self._stale = False
+
+        self._build()
+        # Building the tally is deferred until the tab is actually shown.
+        self.bind("<Map>", lambda _e: self._ensure_medals())
+        self.theme_manager.add_observer(self._on_theme_changed)
+
+    def _build(self):
+        bar = ttk.Frame(self, style="TFrame")
+        bar.pack(fill="x", pady=(0,8))
+
+        ttk.Label(bar, text="Games", style="Info.TLabel").pack(side="left")
+        self.games_var = tk.StringVar(value=ALL_GAMES)
+        self.games_box = ttk.Combobox(
+            bar,
+            textvariable=self.games_var,
+            values=[ALL_GAMES],
+            width=18,
+            state="readonly",
+        )
+        self.games_box.pack(side="left", padx=8)
+        self.games_box.bind("<<ComboboxSelected>>", lambda _e: self._render())
+
+        self.info_var = tk.StringVar(value="—")
+        ttk.Label(bar, textvariable=self.info_var, style="Info.TLabel").pack(side="left", padx=12)
+
+        self.table = DataFrameTable(self, self.theme_manager)
+        self.table.pack(fill="both", expand=True)
+
+    def update_dataframe(self, df: pd.DataFrame | None):
+        self.df = df
+        self._medals = None
+        self._stale = True
+        if self.winfo_ismapped():
+            self._ensure_medals()
+
+    def _ensure_medals(self):
+        if not self._stale:
+            return
+        self._stale = False
+        df = self.df
+        missing = [c for c in KEY_COLUMNS if df is None or c not in df.columns]
+        if missing:
+            self.games_box.configure(values=[ALL_GAMES])
+            self.games_var.set(ALL_GAMES)
+            self.table.set_dataframe(pd.DataFrame())
+            self.info_var.set(f"Needs the columns: {', '.join(missing)}" if df is not None else "—")
+            return
+
+        self._medals = medal_table_for(df)
+        games = self._medals.games
+        self.games_box.configure(values=[ALL_GAMES, *games])
+        if self.games_var.get() not in games:
+            self.games_var.set(ALL_GAMES)
+        self._render()
+
+    def _render(self):
+        if self._medals is None:
+            return
+        games = self.games_var.get()
+        table = self._medals.table(None if games == ALL_GAMES else games)
+        self.table.set_dataframe(table)
+        self.info_var.set(f"{len(table)} NOCs, {int(table['Total'].sum())} medals")
+        self._notify(f"Medal table for {games}.")
+
+    def _notify(self, msg: str):
+        if self.on_status:
+            self.on_status(msg)
+
+    def _on_theme_changed(self, *_args):
+        # Widget colors are handled via ttk styles.
+        pass
@@ -0,0 +1,125 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from services import instrumentation
+from widgets.dataframe_table import DataFrameTable
+
+REFRESH_MS = 1000
+COLUMNS = ("Stage", "Category", "Calls", "Total ms", "Mean ms", "Max ms", "Memory Δ MB")
+
+
+class PerformanceStep(ttk.Frame):
+    """Per-stage timings recorded by ``services.instrumentation``."""
+
+    def __init__(self, master, theme_manager):
+        super().__init__(master, padding=8)
+        self.theme_manager = theme_manager
+        self.on_status = None
+        self._rows: list[tuple] = []
+        self._seen = -1
+        self._last = None
+        self._refresh_job = None
+        # Recording state before the tab was shown, restored when it is hidden.
+        self._previous = (instrumentation.is_enabled(), instrumentation.is_tracing_memory())
+
+        self._build()
+        self.theme_manager.add_observer(self._on_theme_changed)
+
+    def _build(self):
+        bar = ttk.Frame(self, style="TFrame")
+        bar.pack(fill="x", pady=(0,8))
+
+        self.record_var = tk.BooleanVar(value=instrumentation.is_enabled())
+        ttk.Checkbutton(bar, text="Record", variable=self.record_var, command=self._on_record_toggled).pack(side="left")
+
+        self.memory_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(bar, text="Trace memory (slow)", variable=self.memory_var, command=self._on_record_toggled).pack(side="left", padx=8)
+
+        ttk.Button(bar, text="Export Chrome trace", command=self._export, style="TButton").pack(side="right")
+        ttk.Button(bar, text="Clear", command=self._clear, style="Secondary.TButton").pack(side="right", padx=8)
+
+        self.info_var = tk.StringVar(value="—")
+        ttk.Label(bar, textvariable=self.info_var, style="Info.TLabel").pack(side="left", padx=12)
+
+        self.table = DataFrameTable(self, self.theme_manager)
+        self.table.pack(fill="both", expand=True)
+
+    def start(self):
+        """Start recording and refreshing while the tab is shown."""
+        self._previous = (instrumentation.is_enabled(), instrumentation.is_tracing_memory())
+        self.record_var.set(True)
+        self.memory_var.set(self.memory_var.get() or self._previous[1])
+        self._on_record_toggled()
+        self._schedule_refresh(0)
+
+    def stop(self):
+        """Stop refreshing and put recording back the way it was (e.g. on with ``OLYMPICS_TRACE=1``)."""
+        enabled, memory = self._previous
+        instrumentation.enable(enabled, memory=memory)
+        self.record_var.set(enabled)
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+
+    def _on_record_toggled(self):
+        instrumentation.enable(self.record_var.get(), memory=self.memory_var.get())
+
+    def _schedule_refresh(self, delay: int = REFRESH_MS):
+        self._refresh_job = self.after(delay, self._refresh)
+
+    def _refresh(self):
+        records = instrumentation.records()
+        # Rebuilding the rows resets the scroll position, so only do it on change.
+        if len(records) != self._seen or (records and records[-1] is not self._last):
+            self._seen = len(records)
+            self._last = records[-1] if records else None
+            memory: dict[str, int] = {}
+            for rec in records:
+                if rec.memory_delta is not None:
+                    memory[rec.name] = memory.get(rec.name, 0) + rec.memory_delta
+            self._rows = [
+                (
+                    row["name"],
+                    row["category"],
+                    row["calls"],
+                    f"{row['total_ms']:.1f}",
+                    f"{row['mean_ms']:.2f}",
+                    f"{row['max_ms']:.1f}",
+                    f"{memory[row['name']] / 2**20:.1f}" if row["name"] in memory else "—",
+                )
+                for row in instrumentation.summary()
+            ]
+            self.table.set_rows(COLUMNS, len(self._rows), lambda a, b: self._rows[a:b])
+            self.info_var.set(f"{len(records)} spans recorded")
+            # Showing the rows records a table span itself; don't count it as a change.
+            records = instrumentation.records()
+            self._seen = len(records)
+            self._last = records[-1] if records else None
+        self._schedule_refresh()
+
+    def _clear(self):
+        instrumentation.clear()
+        self._seen = -1
+
+    def _export(self):
+        fp = filedialog.asksaveasfilename(
+            title="Export Chrome trace",
+            defaultextension=".json",
+            filetypes=[("Trace JSON", "*.json"), ("All files", "*.*")],
+        )
+        if not fp:
+            return
+        try:
+            count = instrumentation.export_chrome_trace(fp)
+        except OSError as e:
+            messagebox.showerror("Error while exporting", str(e))
+            return
+        self._notify(f"Exported {count} spans to {fp}")
+
+    def _notify(self, msg: str):
+        if self.on_status:
+            self.on_status(msg)
+
+    def _on_theme_changed(self, *_args):
+        # Widget colors are handled via ttk styles.
+        pass
@@ -1,21 +1,24 @@
+from __future__ import annotations
+
 import tkinter as tk
 from tkinter import ttk
-from typing import Any, Mapping
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Mapping
 
 import pandas as pd
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-from services import statistical_plot
-from services.statistical_calc import (
-    average_calc,
-    correlation_calc,
-    covariance_calc,
-    median_calc,
-    mode_calc,
-    std_deviation_calc,
-    total_calc,
-    variance_calc,
-)
+
+from services.instrumentation import span
+from services.noc_regions import REGION_COLUMN
+from services.parallel_stats import StatisticsJob
+from services.plot_data import PLOT_KINDS
+from services.result_cache import dataframe_fingerprint, get_result_cache
+from services.statistical_calc import StatisticsSummary, grouped_summary
+from widgets.dataframe_table import DataFrameTable
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+    from services.statistical_plot import StatisticalPlot
 
 def _calc():
     return [
@@ -30,6 +33,37 @@ def _calc():
     ]
 
 
+# StatisticsSummary field holding the results shown in each calc tab.
+SUMMARY_FIELDS = {
+    "Total": "total",
+    "Average": "mean",
+    "Median": "median",
+    "Mode": "mode",
+    "Variance": "variance",
+    "Standard Deviation": "std",
+    "Covariance": "covariance",
+    "Correlation": "correlation",
+}
+
+
+# Plot kind (see services.plot_data.PLOT_KINDS) drawn in each calc tab.
+PLOT_KIND_BY_CALC = {
+    "Total": "total",
+    "Average": "histogram",
+    "Median": "percentile",
+    "Mode": "dispersion",
+    "Variance": "distribution",
+    "Standard Deviation": "standard_deviation",
+    "Covariance": "covariance",
+    "Correlation": "correlation",
+}
+
+
+# Tab with the statistics per group of the chosen key columns.
+GROUPED_TAB = "Grouped"
+GROUP_CHOICES = ("Year", "Games", "Season", "Sport", "Event", "NOC", REGION_COLUMN, "Sex", "Medal")
+
+
 class StatisticsStep(ttk.Frame):
     def __init__(self, parent, df: pd.DataFrame | None, label, theme_manager, *args, **kwargs):
         super().__init__(parent, *args, **kwargs, padding=8)
@@ -42,13 +76,31 @@ class StatisticsStep(ttk.Frame):
         self.df: pd.DataFrame = df if df is not None else pd.DataFrame()
         self.tabs_by_calc: dict[str, ttk.Frame] = {}
         self._calcs = _calc()
+        self._jobs: dict[str, StatisticsJob] = {}
+        self._built_calcs: set[str] = set()
+        self._summary: StatisticsSummary | None = None
+        self._plot_data: dict[tuple[str, str | None], Any] = {}
+        self._numeric_df: pd.DataFrame | None = None
+        self._fingerprint: str | None = None
+        # Figures shown in each built tab, least recently built first.
+        self._figures_by_calc: OrderedDict[str, list[Figure]] = OrderedDict()
 
-        self.statisticalPlot = statistical_plot.StatisticalPlot(self.df, self.theme_manager)
+        self._statistical_plot: StatisticalPlot | None = None
 
         self._build()
         self.update_dataframe(self.df)
         self.theme_manager.add_observer(self._on_theme_changed)
 
+    @property
+    def statisticalPlot(self) -> StatisticalPlot:
+        """The figure renderer; matplotlib is imported the first time a tab draws a plot."""
+        if self._statistical_plot is None:
+            from services.statistical_plot import StatisticalPlot
+
+            self.theme_manager.apply_plot_theme()
+            self._statistical_plot = StatisticalPlot(self.df, self.theme_manager)
+        return self._statistical_plot
+
     def _notify(self, msg: str):
         if self.on_status:
             self.on_status(msg)
@@ -60,112 +112,222 @@ class StatisticsStep(ttk.Frame):
 
         self.nb = ttk.Notebook(self, style="TNotebook")
         self.nb.pack(fill="both", expand=True)
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # Figures restyled while this step was hidden are refreshed when it is shown.
+        self.bind("<Map>", lambda _e: self._refresh_theme(self._selected_calc()))
 
         self._notify(f"{len(self.df.columns)} columns loaded.")
 
     def update_dataframe(self, df: pd.DataFrame | None):
         self.df = df if df is not None else pd.DataFrame()
 
-        self.statisticalPlot.set_dataframe(self.df)
-
-        for tab_id in self.nb.tabs():
-            self.nb.forget(tab_id)
-        self.tabs_by_calc.clear()
+        if self._statistical_plot is not None:
+            self._statistical_plot.set_dataframe(self.df)
+        self._figures_by_calc.clear()
+        for job in self._jobs.values():
+            job.cancel()
+        self._jobs.clear()
+        self._built_calcs.clear()
+        self._summary = None
+        self._plot_data.clear()
+        self._numeric_df = None
 
         if self.df.empty or len(self.df.columns) == 0:
-            frame = ttk.Frame(self.nb, padding=16)
-            ttk.Label(
-                frame,
-                text="Load a file in Step 1 to view available columns.",
-                anchor="center",
-                justify="center",
-                style="Info.TLabel"
-            ).pack(expand=True)
-            self.nb.add(frame, text="Info")
+            self._show_info("Load a file in Step 1 to view available columns.")
             self._notify("No data loaded.")
             return
 
         numeric_df = self.df.select_dtypes(include="number").drop(
             columns=["ID"], errors="ignore"
         )
-        numeric_columns = list(numeric_df.columns)
-
-        if len(numeric_columns) == 0:
-            frame = ttk.Frame(self.nb, padding=16)
-            ttk.Label(
-                frame,
-                text=(
-                    "No numeric columns available. Update the dataset to view statistics."
-                ),
-                anchor="center",
-                justify="center",
-            ).pack(expand=True)
-            self.nb.add(frame, text="Info")
+        if len(numeric_df.columns) == 0:
+            self._show_info("No numeric columns available. Update the dataset to view statistics.")
             self._notify("No numeric data available.")
             return
 
-        calc_results: dict[str, Any] = {}
-        plots_by_calc: dict[str, Any] = {}
+        # Tabs start empty and are filled the first time they are selected.
+        self._clear_tabs()
         for calc in self._calcs:
-            match calc:
-                case "Total":
-                    calc_results[calc] = total_calc(numeric_df)
-                    for c in numeric_columns:
-                        fig = self.statisticalPlot.total_plot(c)
-                        if fig is not None:
-                            plots_by_calc.setdefault(calc, []).append(fig)
-                case "Average":
-                    calc_results[calc] = average_calc(numeric_df)
-                    for c in numeric_columns:
-                        fig = self.statisticalPlot.histogram_plot(c)
-                        if fig is not None:
-                            plots_by_calc.setdefault(calc, []).append(fig)
-                case "Median":
-                    calc_results[calc] = median_calc(numeric_df)
-                    for c in numeric_columns:
-                        fig = self.statisticalPlot.percentile_plot(c)
-                        if fig is not None:
-                            plots_by_calc.setdefault(calc, []).append(fig)
-                case "Mode":
-                    calc_results[calc] = mode_calc(numeric_df)
-                    for c in numeric_columns:
-                        fig = self.statisticalPlot.dispersion_plot(c, "Year")
-                        if fig is not None:
-                            plots_by_calc.setdefault(calc, []).append(fig)
-                case "Variance":
-                    calc_results[calc] = variance_calc(numeric_df)
-                    for c in numeric_columns:
-                        fig = self.statisticalPlot.distribution_plot(c)
-                        if fig is not None:
-                            plots_by_calc.setdefault(calc, []).append(fig)
-                case "Standard Deviation":
-                    calc_results[calc] = std_deviation_calc(numeric_df)
-                    for c in numeric_columns:
-                        fig = self.statisticalPlot.standard_deviation_plot(c, "Year")
-                        if fig is not None:
-                            plots_by_calc.setdefault(calc, []).append(fig)
-                case "Covariance":
-                    calc_results[calc] = covariance_calc(numeric_df)
-                    fig = self.statisticalPlot.covariance_heatmap_plot()
-                    if fig is not None:
-                        plots_by_calc.setdefault(calc, []).append(fig)
-                case "Correlation":
-                    calc_results[calc] = correlation_calc(numeric_df)
-                    fig = self.statisticalPlot.correlation_heatmap_plot()
-                    if fig is not None:
-                        plots_by_calc.setdefault(calc, []).append(fig)
-                case _:
-                    calc_results[calc] = {}
+            frame = ttk.Frame(self.nb, padding=4)
+            ttk.Label(frame, text="Computing statistics...", style="Info.TLabel").pack(expand=True)
+            self.nb.add(frame, text=str(calc))
+            self.tabs_by_calc[calc] = frame
+        if any(c in self.df.columns for c in GROUP_CHOICES):
+            frame = ttk.Frame(self.nb, padding=4)
+            self.nb.add(frame, text=GROUPED_TAB)
+            self.tabs_by_calc[GROUPED_TAB] = frame
+        self._numeric_df = numeric_df
+        self._fingerprint = dataframe_fingerprint(numeric_df)
+        self._ensure_tab(self._selected_calc())
 
-        for calc in self._calcs:
+    def _selected_calc(self) -> str | None:
+        selected = self.nb.select()
+        for calc, frame in self.tabs_by_calc.items():
+            if str(frame) == selected:
+                return calc
+        return None
+
+    def _on_tab_changed(self, _event=None):
+        calc = self._selected_calc()
+        self._ensure_tab(calc)
+        self._refresh_theme(calc)
+
+    def _refresh_theme(self, calc: str | None):
+        figures = self._figures_by_calc.get(calc)
+        if figures:
+            self.statisticalPlot.refresh_theme(figures)
+
+    def _ensure_tab(self, calc: str | None):
+        """Fill the tab of ``calc`` unless it is already built or being computed."""
+        if calc is None or self._numeric_df is None:
+            return
+        if calc in self._built_calcs or calc in self._jobs:
+            return
+        if calc == GROUPED_TAB:
+            self._build_grouped_tab()
+            return
+
+        missing = [key for key in self._plots_for(calc) if key not in self._plot_data]
+        if self._summary is not None and not missing:
+            self._fill_tab(calc)
+            return
+
+        self._notify(f"Computing {calc.lower()}...")
+        job = StatisticsJob(
+            self._numeric_df,
+            missing,
+            summary=self._summary,
+            cache=get_result_cache(),
+            fingerprint=self._fingerprint,
+        )
+        job.start()
+        self._jobs[calc] = job
+        self._poll_job(calc, job)
+
+    def _plots_for(self, calc: str) -> list[tuple[str, str | None]]:
+        kind = PLOT_KIND_BY_CALC.get(calc)
+        if kind is None:
+            return []
+        if PLOT_KINDS[kind]:
+            return [(kind, c) for c in self._numeric_df.columns]
+        return [(kind, None)]
+
+    def _poll_job(self, calc: str, job: StatisticsJob):
+        if self._jobs.get(calc) is not job:
+            return
+        if not job.done():
+            self.after(50, self._poll_job, calc, job)
+            return
+        del self._jobs[calc]
+        try:
+            result = job.result()
+        except Exception as e:
+            frame = self.tabs_by_calc[calc]
+            for child in frame.winfo_children():
+                child.destroy()
+            ttk.Label(frame, text=f"Could not compute statistics: {e}", style="Info.TLabel").pack(expand=True)
+            self._notify("Statistics error")
+            return
+
+        if self._summary is None:
+            self._summary = result.summary
+        self._plot_data.update(result.plot_data)
+        self._fill_tab(calc)
+
+    def _fill_tab(self, calc: str):
+        with span("step2.fill_tab", "ui", calc=calc):
+            plots = self._plots_for(calc)
+            self._trim_figures(len(plots))
+            figures = []
+            for kind, column in plots:
+                fig = self.statisticalPlot.render(kind, column, self._plot_data.get((kind, column)))
+                if fig is not None:
+                    figures.append(fig)
+
+            field_name = SUMMARY_FIELDS.get(calc)
+            frame = self.tabs_by_calc[calc]
+            for child in frame.winfo_children():
+                child.destroy()
             self._build_calc_sheet(
-                calc,
-                numeric_columns,
-                calc_results.get(calc, {}),
-                plots_by_calc.get(calc),
+                frame,
+                list(self._numeric_df.columns),
+                getattr(self._summary, field_name) if field_name else {},
+                figures or None,
             )
+            self._built_calcs.add(calc)
+            self._figures_by_calc[calc] = figures
+        stats = get_result_cache().stats()
+        self._notify(
+            f"{len(self._numeric_df.columns)} numeric columns loaded.  •  "
+            f"Cache: {stats['hits']} hits / {stats['misses']} misses"
+        )
 
-        self._notify(f"{len(numeric_columns)} numeric columns loaded.")
+    def _build_grouped_tab(self):
+        frame = self.tabs_by_calc[GROUPED_TAB]
+        for child in frame.winfo_children():
+            child.destroy()
+
+        bar = ttk.Frame(frame)
+        bar.pack(fill="x", pady=(0, 8))
+        ttk.Label(bar, text="Group by", style="Info.TLabel").pack(side="left", padx=(0, 8))
+        choices = [c for c in GROUP_CHOICES if c in self.df.columns]
+        default = REGION_COLUMN if REGION_COLUMN in choices else choices[0]
+        self._group_vars = {c: tk.BooleanVar(value=c == default) for c in choices}
+        for column, var in self._group_vars.items():
+            ttk.Checkbutton(bar, text=column, variable=var).pack(side="left")
+        ttk.Button(bar, text="Apply", command=self._fill_grouped_table, style="TButton").pack(side="right")
+
+        self._group_table = DataFrameTable(frame, self.theme_manager)
+        self._group_table.pack(fill="both", expand=True)
+        self._built_calcs.add(GROUPED_TAB)
+        self._fill_grouped_table()
+
+    def _fill_grouped_table(self):
+        by = [c for c, var in self._group_vars.items() if var.get()]
+        if not by:
+            self._notify("Select at least one column to group by.")
+            return
+        columns = [c for c in self._numeric_df.columns if c not in by]
+        with span("step2.grouped_summary", "ui", by=",".join(by)):
+            summary = grouped_summary(self.df, by, columns)
+        self._group_table.set_dataframe(summary.round(2).reset_index())
+        self._notify(f"{len(summary)} groups by {', '.join(by)}")
+
+    def _trim_figures(self, incoming: int):
+        """Unbuild the oldest hidden tabs until ``incoming`` more figures fit under the cap.
+
+        Their figure data stays memoized, so selecting them again only redraws.
+        """
+        selected = self._selected_calc()
+        for calc in list(self._figures_by_calc):
+            if len(self.statisticalPlot.pool.live()) + incoming <= self.statisticalPlot.max_figures:
+                break
+            if calc == selected:
+                continue
+            self.statisticalPlot.release(self._figures_by_calc.pop(calc))
+            self._built_calcs.discard(calc)
+            frame = self.tabs_by_calc[calc]
+            for child in frame.winfo_children():
+                child.destroy()
+            ttk.Label(frame, text="Computing statistics...", style="Info.TLabel").pack(expand=True)
+
+    def _clear_tabs(self):
+        for tab_id in self.nb.tabs():
+            self.nb.forget(tab_id)
+            self.nametowidget(tab_id).destroy()
+        self.tabs_by_calc.clear()
+
+    def _show_info(self, text: str):
+        self._clear_tabs()
+        frame = ttk.Frame(self.nb, padding=16)
+        ttk.Label(
+            frame,
+            text=text,
+            anchor="center",
+            justify="center",
+            style="Info.TLabel"
+        ).pack(expand=True)
+        self.nb.add(frame, text="Info")
 
     @staticmethod
     def _format_result(value: Any) -> str:
@@ -187,6 +349,7 @@ class StatisticsStep(ttk.Frame):
     def _add_plot(self, parent, figs):
         if figs is None:
             return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         if not isinstance(figs, (list, tuple)):
             figs = [figs]
 
@@ -201,20 +364,17 @@ class StatisticsStep(ttk.Frame):
                 continue
             r, c = divmod(idx, 2)
             canvas = FigureCanvasTkAgg(fig, master=parent)
-            canvas.draw()
+            with span("canvas.draw", "ui"):
+                canvas.draw()
             canvas.get_tk_widget().grid(row=r, column=c)
 
     def _build_calc_sheet(
             self,
-            calc_name: str,
+            frame: ttk.Frame,
             df_columns,
             results: Mapping[str, Any] | None,
             figure: Any,
     ):
-        frame = ttk.Frame(self.nb, padding=4)
-        self.nb.add(frame, text=str(calc_name))
-        self.tabs_by_calc[calc_name] = frame
-
         cards = ttk.Frame(frame)
         cards.pack(fill="x", pady=(8, 0))
 
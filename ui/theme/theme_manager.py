@@ -1,8 +1,7 @@
+import sys
 import tkinter as tk
 from tkinter import ttk
 
-from matplotlib import pyplot as plt
-
 from ui.theme.themes import ThemeType
 from ui.theme.themes import THEMES
 
@@ -19,6 +18,7 @@ class ThemeManager:
         self.root = root
         self.current_theme: ThemeType = initial_theme
         self.observers = []
+        self._notify_pending = False
         self._setup_ttk_style()
         self.apply_theme(initial_theme)
 
@@ -153,8 +153,21 @@ class ThemeManager:
             arrowcolor=colors["text_secondary"],
         )
 
-        #   Plot
-        plt.rcParams.update({
+        self.apply_plot_theme()
+        self._notify_observers()
+
+    def apply_plot_theme(self):
+        """Apply the current theme to the matplotlib defaults.
+
+        Skipped while matplotlib is not imported, so the theme does not pull
+        in the plotting stack at startup; whoever imports it calls this.
+        """
+        if "matplotlib" not in sys.modules:
+            return
+        import matplotlib as mpl
+
+        colors = THEMES[self.current_theme]
+        mpl.rcParams.update({
             # bg
             "figure.facecolor": colors["bg"],
             "axes.facecolor": colors["surface"],
@@ -194,8 +207,6 @@ class ThemeManager:
             "image.cmap": "viridis",
         })
 
-        self._notify_observers()
-
     def get_color(self, color_key: str) -> str:
         return THEMES[self.current_theme].get(color_key, "#000000")
 
@@ -206,19 +217,23 @@ class ThemeManager:
         self.observers.append(callback)
 
     def _notify_observers(self):
-        """Notify all observers"""
+        """Notify all observers once the pending events are handled.
+
+        Theme changes in quick succession end up in a single notification.
+        """
+        if self._notify_pending:
+            return
+        self._notify_pending = True
+        self.root.after_idle(self._flush_observers)
+
+    def _flush_observers(self):
+        self._notify_pending = False
         for callback in self.observers:
             try:
                 callback(self.current_theme)
             except Exception as e:
                 print(f"Error notifying observers: {e}")
 
-        try:
-            import matplotlib.pyplot as plt
-            plt.draw_all()
-        except Exception as e:
-            print(f"Error notifying observers: {e}")
-
     def cycle_theme(self):
         """Cycle theme"""
         themes = list(THEMES.keys())
@@ -1,54 +1,212 @@
-import tkinter as tk
 from tkinter import ttk
+from typing import Callable, Sequence
 
 import pandas as pd
 
+from services.instrumentation import span
+
+DEFAULT_ROW_HEIGHT = 20
+
+RowFetcher = Callable[[int, int], Sequence[tuple]]
+SortHandler = Callable[[str], None]
+SelectHandler = Callable[[int], None]
+
+SORT_ARROWS = {True: " \u25b2", False: " \u25bc"}
+
+
 class DataFrameTable(ttk.Frame):
+    """Treeview showing a DataFrame through a fixed pool of row items.
+
+    Only as many items as fit in the widget exist; scrolling rebinds their
+    values from the underlying data, so memory and per-scroll cost stay
+    constant no matter how many rows are shown. When ``on_sort`` is set,
+    clicking a column heading calls it with the column name; the owner does
+    the sorting and reports it back through :meth:`set_sort_indicator`.
+    ``on_select`` is called with the row number whenever the selected row
+    changes.
+    """
+
     def __init__(self, master, theme_manager, *args, **kwargs):
         super().__init__(master, *args, **kwargs)
         self.theme_manager = theme_manager
         self.tree = None
+        self.vsb = None
+
+        self._fetch: RowFetcher = lambda start, stop: []
+        self._row_count = 0
+        self._top = 0
+        self._pool: list[str] = []
+        self._detached: set[str] = set()
+        self._selected_row: int | None = None
+        self.on_sort: SortHandler | None = None
+        self.on_select: SelectHandler | None = None
 
         self._build()
         self.theme_manager.add_observer(self._on_theme_changed)
 
     def _build(self):
-        self.tree = ttk.Treeview(self, show="headings", style="Treeview")
-        vsb = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview, style="Vertical.TScrollbar")
-        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree = ttk.Treeview(self, show="headings", style="Treeview", selectmode="browse")
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar, style="Vertical.TScrollbar")
 
         self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
+        self.vsb.grid(row=0, column=1, sticky="ns")
 
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda _e: self._scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda _e: self._scroll_by(3))
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        for key, step in (("<Up>", -1), ("<Down>", 1)):
+            self.tree.bind(key, lambda _e, s=step: self._move_selection(s))
+        for key, sign in (("<Prior>", -1), ("<Next>", 1)):
+            self.tree.bind(key, lambda _e, s=sign: self._scroll_by(s * max(len(self._pool) - 1, 1)))
+        self.tree.bind("<Home>", lambda _e: self._scroll_to(0))
+        self.tree.bind("<End>", lambda _e: self._scroll_to(self._row_count))
+
     def set_dataframe(self, df: pd.DataFrame):
+        def fetch(start: int, stop: int) -> Sequence[tuple]:
+            return list(df.iloc[start:stop].itertuples(index=False, name=None))
+
+        self.set_rows([str(c) for c in df.columns], len(df), fetch)
+
+    def set_rows(self, columns: Sequence[str], row_count: int, fetch: RowFetcher):
+        """Show ``row_count`` rows obtained on demand through ``fetch(start, stop)``."""
         #   Clear
         for col in self.tree["columns"]:
-            self.tree.heading(col, text="")
+            self.tree.heading(col, text="", command="")
             self.tree.column(col, width=0)
-        self.tree.delete(*self.tree.get_children())
 
         #   Set
-        columns = [str(c) for c in df.columns]
+        columns = list(columns)
         self.tree["columns"] = columns
         for col in columns:
-            self.tree.heading(col, text=col)
+            self.tree.heading(col, text=col, command=lambda c=col: self._on_heading(c))
             self.tree.column(col, width=min(max(80, len(col) * 10), 400), stretch=True, anchor="w")
 
-        if not df.empty:
-            values_iter = df.itertuples(index=False, name=None)
-            batch = []
-            for i, row in enumerate(values_iter, start=1):
-                batch.append(row)
-                if len(batch) >= 1000:
-                    for r in batch:
-                        self.tree.insert("", "end", values=r)
-                    batch.clear()
-            for r in batch:
-                self.tree.insert("", "end", values=r)
+        self._fetch = fetch
+        self._row_count = row_count
+        self._top = 0
+        self._selected_row = None
+        self._resize_pool()
+        self._refresh()
+
+    def set_sort_indicator(self, column: str | None, ascending: bool = True):
+        """Mark ``column`` as the sort key in its heading (None clears the mark)."""
+        for col in self.tree["columns"]:
+            arrow = SORT_ARROWS[ascending] if col == column else ""
+            self.tree.heading(col, text=f"{col}{arrow}")
+
+    def _on_heading(self, column: str):
+        if self.on_sort is not None:
+            self.on_sort(column)
+
+    def _visible_rows(self) -> int:
+        height = self.tree.winfo_height()
+        if height <= 1:
+            height = int(self.tree.cget("height") or 10) * self._row_height()
+        # The heading takes roughly one row.
+        return max(height // self._row_height() - 1, 1)
+
+    def _row_height(self) -> int:
+        try:
+            return int(ttk.Style().lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+        except (TypeError, ValueError):
+            return DEFAULT_ROW_HEIGHT
+
+    def _resize_pool(self):
+        wanted = self._visible_rows()
+        while len(self._pool) < wanted:
+            iid = self.tree.insert("", "end", values=())
+            self.tree.detach(iid)
+            self._pool.append(iid)
+            self._detached.add(iid)
+        while len(self._pool) > wanted:
+            iid = self._pool.pop()
+            self._detached.discard(iid)
+            self.tree.delete(iid)
+
+    def _refresh(self):
+        """Rebind the pool items to the rows starting at ``self._top``."""
+        self._top = max(min(self._top, self._row_count - len(self._pool)), 0)
+        rows = self._fetch(self._top, min(self._top + len(self._pool), self._row_count))
+
+        with span("table.treeview_update", "table", rows=len(rows)):
+            for i, iid in enumerate(self._pool):
+                if i < len(rows):
+                    if iid in self._detached:
+                        self.tree.move(iid, "", i)
+                        self._detached.discard(iid)
+                    self.tree.item(iid, values=rows[i])
+                elif iid not in self._detached:
+                    self.tree.detach(iid)
+                    self._detached.add(iid)
+
+        selected = []
+        if self._selected_row is not None and 0 <= self._selected_row - self._top < len(rows):
+            selected = [self._pool[self._selected_row - self._top]]
+        self.tree.selection_set(selected)
+
+        if self._row_count:
+            first = self._top / self._row_count
+            last = (self._top + len(rows)) / self._row_count
+            self.vsb.set(first, last)
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _scroll_to(self, top: int):
+        top = max(min(top, self._row_count - len(self._pool)), 0)
+        if top != self._top:
+            self._top = top
+            self._refresh()
+        return "break"
+
+    def _scroll_by(self, rows: int):
+        return self._scroll_to(self._top + rows)
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self._scroll_to(int(float(args[0]) * self._row_count))
+        elif action == "scroll":
+            amount, unit = int(args[0]), args[1]
+            step = max(len(self._pool) - 1, 1) if unit == "pages" else 1
+            self._scroll_by(amount * step)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas.
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_by(-3 * delta)
+
+    def _on_resize(self, _event=None):
+        if len(self._pool) != self._visible_rows():
+            self._resize_pool()
+            self._refresh()
+
+    def _on_select(self, _event=None):
+        selection = self.tree.selection()
+        if selection and selection[0] in self._pool:
+            self._select(self._top + self._pool.index(selection[0]))
+
+    def _move_selection(self, step: int):
+        if self._row_count == 0:
+            return "break"
+        current = self._top if self._selected_row is None else self._selected_row
+        self._select(max(min(current + step, self._row_count - 1), 0))
+        if self._selected_row < self._top:
+            self._top = self._selected_row
+        elif self._selected_row >= self._top + len(self._pool):
+            self._top = self._selected_row - len(self._pool) + 1
+        self._refresh()
+        return "break"
+
+    def _select(self, row: int):
+        if row != self._selected_row:
+            self._selected_row = row
+            if self.on_select is not None:
+                self.on_select(row)
 
     def _on_theme_changed(self, *_args):
         # Widget colors are handled via ttk styles.
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,138 @@
+import os
+import tkinter as tk
+from tkinter import ttk
+
+from services.excel_loader import list_sheets, sheet_columns
+
+Selection = tuple[list[str] | None, list[str] | None]
+
+
+class SheetSelector(tk.Toplevel):
+    """Modal dialog choosing the sheets and columns of a workbook to load.
+
+    The column list holds the columns shared by every selected sheet, read
+    from their header rows only. ``result`` is ``(sheets, columns)`` once
+    accepted, where ``columns`` is None when all of them are kept.
+    """
+
+    def __init__(self, master, theme_manager, file_path: str, sheets: list[str]):
+        super().__init__(master)
+        self.theme_manager = theme_manager
+        self.file_path = file_path
+        self.result: tuple[list[str], list[str] | None] | None = None
+        self._headers: dict[str, list[str]] = {}
+
+        self.title(f"Open {os.path.basename(file_path)}")
+        self.transient(master.winfo_toplevel())
+        self.configure(bg=self.theme_manager.get_color("bg"))
+        self._build(sheets)
+
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+        self.bind("<Return>", lambda _e: self._accept())
+        self.bind("<Escape>", lambda _e: self.destroy())
+        self.grab_set()
+
+    def _build(self, sheets: list[str]):
+        body = ttk.Frame(self, padding=8)
+        body.pack(fill="both", expand=True)
+        body.grid_columnconfigure((0, 1), weight=1)
+        body.grid_rowconfigure(1, weight=1)
+
+        ttk.Label(body, text=f"Sheets ({len(sheets)})", style="Info.TLabel").grid(row=0, column=0, sticky="w")
+        ttk.Label(body, text="Columns", style="Info.TLabel").grid(row=0, column=1, sticky="w", padx=(8, 0))
+
+        self.sheet_list = self._listbox(body, sheets)
+        self.sheet_list.master.grid(row=1, column=0, sticky="nsew")
+        self.sheet_list.selection_set(0)
+        self.sheet_list.bind("<<ListboxSelect>>", lambda _e: self._load_columns())
+
+        self.column_list = self._listbox(body, [])
+        self.column_list.master.grid(row=1, column=1, sticky="nsew", padx=(8, 0))
+
+        bar = ttk.Frame(body)
+        bar.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(8, 0))
+        ttk.Button(bar, text="All sheets", command=self._select_all_sheets, style="Secondary.TButton").pack(side="left")
+        ttk.Button(bar, text="Load", command=self._accept, style="TButton").pack(side="right")
+        ttk.Button(bar, text="Cancel", command=self.destroy, style="Secondary.TButton").pack(side="right", padx=8)
+
+        self._load_columns()
+
+    def _listbox(self, parent, values: list[str]) -> tk.Listbox:
+        frame = ttk.Frame(parent)
+        listbox = tk.Listbox(
+            frame,
+            selectmode="extended",
+            exportselection=False,
+            height=14,
+            bg=self.theme_manager.get_color("surface"),
+            fg=self.theme_manager.get_color("text_primary"),
+            selectbackground=self.theme_manager.get_color("primary"),
+            selectforeground=self.theme_manager.get_color("text_on_primary"),
+            highlightthickness=0,
+            relief="flat",
+        )
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=listbox.yview, style="Vertical.TScrollbar")
+        listbox.configure(yscrollcommand=scrollbar.set)
+        listbox.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        for value in values:
+            listbox.insert("end", value)
+        return listbox
+
+    @staticmethod
+    def _selected(listbox: tk.Listbox) -> list[str]:
+        return [listbox.get(i) for i in listbox.curselection()]
+
+    def _select_all_sheets(self):
+        self.sheet_list.selection_set(0, "end")
+        self._load_columns()
+
+    def _load_columns(self):
+        """Show the columns shared by the selected sheets, keeping earlier deselections."""
+        shown = list(self.column_list.get(0, "end"))
+        dropped = set(shown) - set(self._selected(self.column_list))
+
+        columns: list[str] | None = None
+        for sheet in self._selected(self.sheet_list):
+            if sheet not in self._headers:
+                try:
+                    self._headers[sheet] = sheet_columns(self.file_path, sheet)
+                except Exception:
+                    # Unreadable sheets surface as a load error later on.
+                    self._headers[sheet] = []
+            header = self._headers[sheet]
+            columns = list(header) if columns is None else [c for c in columns if c in header]
+
+        self.column_list.delete(0, "end")
+        for i, column in enumerate(columns or []):
+            self.column_list.insert("end", column)
+            if column not in dropped:
+                self.column_list.selection_set(i)
+
+    def _accept(self):
+        sheets = self._selected(self.sheet_list)
+        columns = self._selected(self.column_list)
+        if not sheets or not columns:
+            self.bell()
+            return
+        # With several sheets the list only holds their shared columns; None
+        # would load the union, so only a single sheet can keep "all".
+        keep_all = len(sheets) == 1 and len(columns) == self.column_list.size()
+        self.result = (sheets, None if keep_all else columns)
+        self.destroy()
+
+
+def ask_sheet_selection(master, theme_manager, file_path: str) -> Selection | None:
+    """Ask which sheets and columns of ``file_path`` to load; None when cancelled.
+
+    Returns ``(sheets, columns)`` as taken by ``load_table``: ``sheets`` is
+    None for the first sheet alone, ``columns`` None for all columns.
+    """
+    sheets = list_sheets(file_path)
+    dialog = SheetSelector(master, theme_manager, file_path, sheets)
+    master.wait_window(dialog)
+    if dialog.result is None:
+        return None
+    chosen, columns = dialog.result
+    # The default selection shares its cache entry with a plain load.
+    return (None if chosen == sheets[:1] else chosen), columns